@@ -0,0 +1,243 @@
+import csv
+import sys
+import gzip
+import time
+import logging
+from contextlib import nullcontext
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, TextIO, Tuple
+from .serialization import loads
+from .utils.job_matcher import JobMatcher
+from .utils.minhash import MinHashLSH
+from .metrics import time_stage, JOB_FEED_RECORDS
+
+logger = logging.getLogger(__name__)
+
+FEED_FORMATS = ('jsonl', 'csv')
+FORMAT_EXTENSIONS = {'jsonl': 'jsonl', 'ndjson': 'jsonl', 'json': 'jsonl', 'csv': 'csv'}
+
+# Fields every job posting needs for matching (see JobMatcher._create_job_text)
+JOB_REQUIRED_FIELDS = ('id', 'title', 'description', 'requirements', 'skills')
+LIST_FIELDS = ('requirements', 'skills')
+OPTIONAL_TEXT_FIELDS = ('company', 'location', 'type', 'salary', 'experience_level')
+
+# (line number, record, error): exactly one of record and error is set
+FeedRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ('1', 'true', 'yes', 'false', '0', 'no', ''):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    raise ValueError('remote_friendly must be a boolean')
+
+
+def validate_job(record: Any) -> Dict[str, Any]:
+    """Check a record against the job schema JobMatcher uses and return a normalized copy.
+
+    ``id`` may be a string or an integer and is stored as a string;
+    ``title`` and ``description`` must be non-empty strings and
+    ``requirements`` and ``skills`` lists of strings. Other fields are
+    kept as they are. Raises ValueError naming the first problem found.
+    """
+    if not isinstance(record, dict):
+        raise ValueError('job must be an object')
+    missing = [field for field in JOB_REQUIRED_FIELDS if field not in record]
+    if missing:
+        raise ValueError(f"missing fields: {', '.join(missing)}")
+
+    job = dict(record)
+    job_id = record['id']
+    if isinstance(job_id, bool) or not isinstance(job_id, (str, int)) or not str(job_id).strip():
+        raise ValueError('id must be a non-empty string or integer')
+    job['id'] = str(job_id).strip()
+    for field in ('title', 'description'):
+        if not isinstance(record[field], str) or not record[field].strip():
+            raise ValueError(f'{field} must be a non-empty string')
+    for field in LIST_FIELDS:
+        values = record[field]
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise ValueError(f'{field} must be a list of strings')
+        job[field] = [value.strip() for value in values if value.strip()]
+    for field in OPTIONAL_TEXT_FIELDS:
+        if record.get(field) is not None and not isinstance(record[field], str):
+            raise ValueError(f'{field} must be a string')
+    if 'remote_friendly' in record:
+        job['remote_friendly'] = _as_bool(record['remote_friendly'])
+    return job
+
+
+def detect_format(path: str) -> str:
+    """Feed format from a file name such as ``jobs.jsonl`` or ``feed.csv.gz``."""
+    name = path[:-3] if path.endswith('.gz') else path
+    extension = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+    if extension not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Cannot tell the feed format of {path}; pass one of: {', '.join(FEED_FORMATS)}")
+    return FORMAT_EXTENSIONS[extension]
+
+
+def open_feed(path: str) -> TextIO:
+    """Open a feed file for streaming, gunzipping ``.gz`` files; ``-`` is stdin."""
+    if path == '-':
+        return sys.stdin
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def iter_records(stream: Iterable[str], feed_format: str, list_separator: str = '|') -> Iterator[FeedRecord]:
+    """Yield (line number, record, error) for each record of a JSONL or CSV feed.
+
+    Reads one line (or CSV row) at a time. Lines that cannot be decoded
+    are yielded with an error instead of stopping the feed. In CSV feeds
+    empty cells are dropped and ``requirements``/``skills`` cells hold a
+    JSON array or values joined by ``list_separator``.
+    """
+    if feed_format == 'jsonl':
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except ValueError as e:
+                yield number, None, f"invalid JSON: {str(e)}"
+                continue
+            if isinstance(record, dict):
+                yield number, record, None
+            else:
+                yield number, None, 'job must be an object'
+    elif feed_format == 'csv':
+        reader = csv.DictReader(stream)
+        try:
+            for row in reader:
+                # Cells beyond the header land under the None key
+                record = {key: value for key, value in row.items() if key and value not in (None, '')}
+                for field in LIST_FIELDS:
+                    if field in record:
+                        record[field] = _split_list(record[field], list_separator)
+                yield reader.line_num, record, None
+        except (csv.Error, ValueError) as e:
+            # The reader cannot resynchronize after a malformed row
+            yield reader.line_num, None, f"unreadable CSV, stopping: {str(e)}"
+    else:
+        raise ValueError(f"Unknown feed format: {feed_format}")
+
+
+def _split_list(value: str, separator: str) -> Any:
+    value = value.strip()
+    if value.startswith('['):
+        try:
+            return loads(value)
+        except ValueError:
+            pass
+    return [item.strip() for item in value.split(separator) if item.strip()]
+
+
+class FeedImporter:
+    """Validate, de-duplicate and bulk-load job feed records into a JobMatcher.
+
+    Records are streamed: at most one chunk of ``chunk_size`` jobs is held
+    before it goes to JobMatcher.add_jobs, all inside one bulk_update(), so
+    the index is refitted at most once however large the feed. A later
+    record with the same id replaces an earlier one. Near-duplicates of
+    another posting (reposts under a new id) are skipped when a
+    ``deduplicator`` is given. Invalid and duplicate records are counted
+    and passed to ``on_reject``.
+    """
+
+    def __init__(self, job_matcher: JobMatcher, chunk_size: int = 5000,
+                 deduplicator: Optional[MinHashLSH] = None, dedupe_existing: bool = False,
+                 on_reject: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 progress_every: int = 10000, sample_size: int = 20, dry_run: bool = False):
+        self.job_matcher = job_matcher
+        self.chunk_size = chunk_size
+        self.deduplicator = deduplicator
+        self.dedupe_existing = dedupe_existing
+        self.on_reject = on_reject
+        self.progress_every = progress_every
+        self.sample_size = sample_size
+        self.dry_run = dry_run
+
+    def run(self, records: Iterable[FeedRecord]) -> Dict[str, Any]:
+        """Import the records and return a report of counts, timings and records/sec."""
+        counts = {'records': 0, 'imported': 0, 'invalid': 0, 'duplicates': 0, 'chunks': 0}
+        seconds = {'dedupe': 0.0, 'load': 0.0}
+        rejected: List[Dict[str, Any]] = []
+        text_builder = self.job_matcher._create_job_text
+        if not self.dry_run:
+            # Built up front, so its one-off cost stays out of records/sec
+            self.job_matcher.load()
+        started = time.perf_counter()
+
+        def reject(entry: Dict[str, Any]) -> None:
+            if len(rejected) < self.sample_size:
+                rejected.append(entry)
+            if self.on_reject is not None:
+                self.on_reject(entry)
+
+        def flush(chunk: Dict[str, Dict[str, Any]]) -> None:
+            if not self.dry_run:
+                stage_started = time.perf_counter()
+                with time_stage('job_feed_load'):
+                    self.job_matcher.add_jobs(list(chunk.values()))
+                seconds['load'] += time.perf_counter() - stage_started
+            counts['imported'] += len(chunk)
+            counts['chunks'] += 1
+
+        if self.deduplicator is not None and self.dedupe_existing:
+            stage_started = time.perf_counter()
+            for job in self.job_matcher.jobs_database:
+                self.deduplicator.insert(str(job['id']), self.deduplicator.signature(text_builder(job)))
+            seconds['dedupe'] += time.perf_counter() - stage_started
+            logger.info(f"Near-duplicate index seeded with {len(self.deduplicator)} existing jobs")
+
+        with nullcontext() if self.dry_run else self.job_matcher.bulk_update():
+            chunk: Dict[str, Dict[str, Any]] = {}
+            for line, record, error in records:
+                counts['records'] += 1
+                if error is None:
+                    try:
+                        job = validate_job(record)
+                    except ValueError as e:
+                        error = str(e)
+                if error is not None:
+                    counts['invalid'] += 1
+                    reject({'line': line, 'id': record.get('id') if record else None,
+                            'status': 'invalid', 'error': error})
+                else:
+                    duplicate = None
+                    if self.deduplicator is not None:
+                        stage_started = time.perf_counter()
+                        duplicate = self.deduplicator.check(job['id'], text_builder(job))
+                        seconds['dedupe'] += time.perf_counter() - stage_started
+                    if duplicate is not None:
+                        counts['duplicates'] += 1
+                        reject({'line': line, 'id': job['id'], 'status': 'duplicate',
+                                'duplicate_of': duplicate[0], 'similarity': round(duplicate[1], 3)})
+                    else:
+                        chunk[job['id']] = job
+                        if len(chunk) >= self.chunk_size:
+                            flush(chunk)
+                            chunk = {}
+
+                if counts['records'] % self.progress_every == 0:
+                    rate = counts['records'] / (time.perf_counter() - started)
+                    logger.info(f"{counts['records']} records read ({rate:.0f} records/sec), "
+                                f"{counts['invalid']} invalid, {counts['duplicates']} duplicates")
+            if chunk:
+                flush(chunk)
+            # Leaving the block runs the deferred refit, if the load drifted far enough
+            stage_started = time.perf_counter()
+        seconds['load'] += time.perf_counter() - stage_started
+
+        elapsed = time.perf_counter() - started
+        for status in ('imported', 'invalid', 'duplicates'):
+            JOB_FEED_RECORDS.inc(counts[status], status=status)
+        return {
+            **counts,
+            'index_size': None if self.dry_run else self.job_matcher.index.size,
+            'elapsed_seconds': round(elapsed, 3),
+            'records_per_second': round(counts['records'] / elapsed, 1) if elapsed else 0.0,
+            'stage_seconds': {stage: round(value, 3) for stage, value in seconds.items()},
+            'rejected_sample': rejected,
+        }
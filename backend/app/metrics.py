@@ -0,0 +1,187 @@
+import time
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Iterator, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans a regex pass up to a slow multi-page PDF
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Samples = Union[float, List[Tuple[Dict[str, str], float]]]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with optional labels. Names should end in ``_total``."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(name, '')) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labels, key)} {_format_value(value)}'
+                for key, value in values]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram with optional labels."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket counts (last slot is +Inf), sum
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, '')) for name in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of a block, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(counts), total) for key, (counts, total) in self._series.items())
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(self.labels, key)} {cumulative}')
+        return lines
+
+
+class CallbackMetric:
+    """Gauge or counter whose value is read from a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, kind: str, callback: Callable[[], Samples]):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        try:
+            samples = self.callback()
+        except Exception as e:
+            logger.error(f"Error reading metric {self.name}: {str(e)}")
+            return []
+        if not isinstance(samples, list):
+            samples = [({}, samples)]
+        return [f'{self.name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}'
+                for labels, value in samples]
+
+
+class MetricsRegistry:
+    """Process-local metrics, rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, documentation, labels, buckets))
+
+    def register_callback(self, name: str, documentation: str, callback: Callable[[], Samples],
+                          kind: str = 'gauge') -> None:
+        """Register (or replace) a metric computed on each scrape."""
+        with self._lock:
+            self._metrics[name] = CallbackMetric(name, documentation, kind, callback)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'resume_stage_seconds', 'Time spent in each resume processing stage.', ('stage',)
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'http_request_duration_seconds', 'HTTP request latency by endpoint.', ('endpoint', 'method', 'status')
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    'http_requests_total', 'HTTP requests by endpoint and status.', ('endpoint', 'method', 'status')
+)
+RESUMES_PARSED = REGISTRY.counter(
+    'resumes_parsed_total', 'Resumes run through the parse pipeline, by outcome.', ('status',)
+)
+JOB_FEED_RECORDS = REGISTRY.counter(
+    'job_feed_records_total', 'Job feed records read by the importer, by outcome.', ('status',)
+)
+
+
+def time_stage(stage: str):
+    """Context manager recording a block's duration under ``resume_stage_seconds``."""
+    return STAGE_SECONDS.time(stage=stage)
+
@@ -1,8 +1,21 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional
 from datetime import datetime
 
-@dataclass
+def slotted_dataclass(cls):
+    """``@dataclass`` with ``__slots__``, like ``dataclass(slots=True)`` on Python 3.10+.
+    
+    Slots drop the per-instance ``__dict__``, which adds up across
+    thousands of parsed resumes held in memory.
+    """
+    cls = dataclass(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@slotted_dataclass
 class PersonalInfo:
     """Personal information extracted from resume."""
     name: Optional[str] = None
@@ -13,7 +26,7 @@ class PersonalInfo:
     github: Optional[str] = None
     website: Optional[str] = None
 
-@dataclass
+@slotted_dataclass
 class Experience:
     """Work experience information."""
     company: str
@@ -25,7 +38,7 @@ class Experience:
     location: Optional[str] = None
     is_current: bool = False
 
-@dataclass
+@slotted_dataclass
 class Education:
     """Education information."""
     institution: str
@@ -36,7 +49,7 @@ class Education:
     gpa: Optional[str] = None
     location: Optional[str] = None
 
-@dataclass
+@slotted_dataclass
 class Certification:
     """Certification information."""
     name: str
@@ -45,12 +58,13 @@ class Certification:
     expiry_date: Optional[str] = None
     credential_id: Optional[str] = None
 
-@dataclass
+@slotted_dataclass
 class ResumeData:
     """Complete structured resume data."""
     personal_info: PersonalInfo = field(default_factory=PersonalInfo)
     summary: Optional[str] = None
     skills: List[str] = field(default_factory=list)
+    skill_categories: Dict[str, List[str]] = field(default_factory=dict)
     experience: List[Experience] = field(default_factory=list)
     education: List[Education] = field(default_factory=list)
     certifications: List[Certification] = field(default_factory=list)
@@ -76,6 +90,7 @@ class ResumeData:
             },
             'summary': self.summary,
             'skills': self.skills,
+            'skill_categories': self.skill_categories,
             'experience': [
                 {
                     'company': exp.company,
@@ -112,4 +127,23 @@ class ResumeData:
             'projects': self.projects,
             'processed_at': self.processed_at.isoformat(),
             'confidence_score': self.confidence_score
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ResumeData':
+        """Rebuild ResumeData from the output of to_dict."""
+        processed_at = data.get('processed_at')
+        return cls(
+            personal_info=PersonalInfo(**(data.get('personal_info') or {})),
+            summary=data.get('summary'),
+            skills=list(data.get('skills') or []),
+            skill_categories=dict(data.get('skill_categories') or {}),
+            experience=[Experience(**exp) for exp in data.get('experience') or []],
+            education=[Education(**edu) for edu in data.get('education') or []],
+            certifications=[Certification(**cert) for cert in data.get('certifications') or []],
+            languages=list(data.get('languages') or []),
+            projects=list(data.get('projects') or []),
+            raw_text=data.get('raw_text', ''),
+            processed_at=datetime.fromisoformat(processed_at) if processed_at else datetime.utcnow(),
+            confidence_score=data.get('confidence_score', 0.0)
+        )
\ No newline at end of file
@@ -0,0 +1,309 @@
+import os
+import time
+import tempfile
+import uuid
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Dict, Any, Optional
+from .models.resume_data import ResumeData
+from .parsers.resume_parser import ResumeParser
+from .pipeline import ResumePipeline
+from .metrics import STAGE_SECONDS
+from .serialization import dumps, loads
+from .utils.file_handler import FileHandler
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+DONE = 'done'
+FAILED = 'failed'
+
+# Set in each worker process by _init_worker
+_worker_pipeline: Optional[ResumePipeline] = None
+
+
+def _init_worker(file_handler: FileHandler, resume_parser: ResumeParser) -> None:
+    global _worker_pipeline
+    # Workers only extract and parse, so they get no job matcher or cache
+    _worker_pipeline = ResumePipeline(file_handler, resume_parser, None)
+    if not resume_parser.nlp:
+        resume_parser.load_model()
+
+
+def _parse_in_worker(content: bytes, file_extension: str) -> Dict[str, Any]:
+    """Worker task: the CPU-heavy extraction and NLP stages of the pipeline.
+
+    Stage metrics recorded here stay in the worker, so the task's duration
+    is returned for the parent to record.
+    """
+    started = time.perf_counter()
+    resume = _worker_pipeline.parse_content(content, file_extension).to_dict()
+    return {'resume': resume, 'seconds': time.perf_counter() - started}
+
+
+class QueueFull(Exception):
+    """Raised when the parse queue has no room for another job."""
+
+
+class QueueUnavailable(Exception):
+    """Raised when the worker pool cannot accept jobs."""
+
+
+class ParseQueue:
+    """Bounded queue of parse jobs drained by a local process pool.
+
+    Workers run extraction and NLP; matching and cache writes happen back in
+    this process when a job completes, so results always use the current
+    job index. They run on ``finish_threads`` threads (default: one per
+    worker) rather than in the pool's completion callback, which a single
+    management thread delivers for every job. Submissions beyond ``max_pending`` unfinished jobs are
+    rejected immediately, and finished results are dropped after
+    ``result_ttl`` seconds.
+
+    With ``results_dir`` set, job records are also written there so that any
+    server process can answer a status poll, not only the one that took
+    the upload.
+    """
+
+    def __init__(self, pipeline: ResumePipeline, workers: int = 2, max_pending: int = 64,
+                 result_ttl: int = 3600, results_dir: Optional[str] = None,
+                 finish_threads: Optional[int] = None):
+        self.pipeline = pipeline
+        self.workers = workers
+        self.finish_threads = finish_threads or max(1, workers)
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.results_dir = results_dir
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._finisher: Optional[ThreadPoolExecutor] = None
+        self._finisher_pid: Optional[int] = None
+        self._last_sweep = 0.0
+
+    def submit(self, content: bytes, filename: str, k: int = 10, min_score: int = 0,
+               mode: Optional[str] = None) -> str:
+        """Queue an upload for parsing and return its job id.
+
+        Raises QueueFull when too many jobs are unfinished and
+        QueueUnavailable when the worker pool is down.
+        """
+        if self.workers <= 0:
+            raise QueueUnavailable('Asynchronous parsing is disabled')
+
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self._expire()
+            if self._pending >= self.max_pending:
+                raise QueueFull(f"Parse queue is full ({self.max_pending} jobs pending)")
+            self._pending += 1
+            self._jobs[job_id] = {
+                'id': job_id,
+                'status': QUEUED,
+                'submitted_at': datetime.utcnow().isoformat(),
+                'expires': None,
+            }
+        self._persist(job_id)
+
+        try:
+            filename, file_extension, cache_key, cache_entry = self.pipeline.lookup(content, filename)
+            result = None
+            if cache_entry is not None:
+                result = self.pipeline.finish(filename, cache_key, None, cache_entry, k, min_score, mode)
+        except Exception as e:
+            self._complete(job_id, error=e, filename=filename)
+            return job_id
+        if result is not None:
+            self._complete(job_id, result=result)
+            return job_id
+
+        try:
+            future = self._get_executor().submit(_parse_in_worker, content, file_extension)
+        except RuntimeError as e:
+            # BrokenProcessPool, or a pool that has been shut down
+            self._complete(job_id, error=e, filename=filename)
+            self._reset_executor()
+            raise QueueUnavailable('Parse workers are unavailable')
+
+        future.add_done_callback(
+            lambda done: self._on_parsed(job_id, done, filename, cache_key, k, min_score, mode)
+        )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Status (and result or error, once finished) of a job; None if unknown or expired."""
+        with self._lock:
+            self._expire()
+            job = self._jobs.get(job_id)
+        if job is None:
+            job = self._read(job_id)
+            if job is None:
+                return None
+        return {key: value for key, value in job.items() if key != 'expires'}
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and retained results."""
+        with self._lock:
+            self._expire()
+            return {
+                'workers': self.workers,
+                'pending': self._pending,
+                'max_pending': self.max_pending,
+                'retained': len(self._jobs),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, cancelling queued jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            finisher, self._finisher = self._finisher, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if finisher is not None:
+            finisher.shutdown(wait=False)
+
+    def _on_parsed(self, job_id: str, future: Future, filename: str, cache_key: Optional[str],
+                   k: int, min_score: int, mode: Optional[str] = None) -> None:
+        # Runs on the pool's management thread: only hand the payload on
+        try:
+            parsed = future.result()
+        except BrokenProcessPool as e:
+            self._reset_executor()
+            self._complete(job_id, error=e, filename=filename)
+            return
+        except Exception as e:
+            self._complete(job_id, error=e, filename=filename)
+            return
+        try:
+            self._get_finisher().submit(self._finish, job_id, parsed, filename, cache_key, k, min_score, mode)
+        except RuntimeError as e:
+            # The queue was shut down meanwhile
+            self._complete(job_id, error=e, filename=filename)
+
+    def _finish(self, job_id: str, parsed: Dict[str, Any], filename: str, cache_key: Optional[str],
+                k: int, min_score: int, mode: Optional[str] = None) -> None:
+        """Finishing-thread task: match, cache and store a parsed resume."""
+        try:
+            STAGE_SECONDS.observe(parsed['seconds'], stage='worker_parse')
+            parsed_data = ResumeData.from_dict(parsed['resume'])
+            result = self.pipeline.finish(filename, cache_key, parsed_data, None, k, min_score, mode)
+        except Exception as e:
+            self._complete(job_id, error=e, filename=filename)
+        else:
+            self._complete(job_id, result=result)
+
+    def _complete(self, job_id: str, result: Optional[Dict[str, Any]] = None,
+                  error: Optional[Exception] = None, filename: Optional[str] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job['finished_at'] = datetime.utcnow().isoformat()
+            job['expires'] = time.time() + self.result_ttl
+            if error is None:
+                job['status'] = DONE
+                job['result'] = result
+            else:
+                job['status'] = FAILED
+                job['error'] = self.pipeline.failure(filename, error)['error']
+        self._persist(job_id)
+        logger.info(f"Parse job {job_id} {job['status']}")
+
+    def _expire(self) -> None:
+        """Drop finished jobs past their TTL. Caller holds the lock."""
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job['expires'] is not None and job['expires'] <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+        # Records of every process share the directory; sweep it now and then
+        if self.results_dir and now - self._last_sweep > 60:
+            self._last_sweep = now
+            try:
+                names = os.listdir(self.results_dir)
+            except OSError:
+                # Not created until the first record is written
+                names = []
+            for name in names:
+                path = os.path.join(self.results_dir, name)
+                try:
+                    if now - os.path.getmtime(path) > self.result_ttl:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.results_dir, f'{job_id}.json')
+
+    def _persist(self, job_id: str) -> None:
+        if not self.results_dir:
+            return
+        with self._lock:
+            job = dict(self._jobs.get(job_id) or {})
+        if not job:
+            return
+        try:
+            os.makedirs(self.results_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.results_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dumps(job))
+            os.replace(tmp_path, self._path(job_id))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write parse job {job_id}: {str(e)}")
+
+    def _read(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if not self.results_dir:
+            return None
+        # Job ids are UUIDs; anything else is not a file we wrote
+        try:
+            job_id = str(uuid.UUID(job_id))
+        except ValueError:
+            return None
+        try:
+            with open(self._path(job_id), 'rb') as f:
+                job = loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if job.get('expires') is not None and job['expires'] <= time.time():
+            return None
+        return job
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created lazily and per process, so a pre-forking server's master
+        # never owns a pool that its workers would inherit.
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                methods = multiprocessing.get_all_start_methods()
+                # Forked workers share the already loaded model copy-on-write
+                context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.pipeline.file_handler, self.pipeline.resume_parser)
+                )
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _get_finisher(self) -> ThreadPoolExecutor:
+        with self._lock:
+            # Threads do not survive a fork, so a forked server worker starts its own
+            if self._finisher is None or self._finisher_pid != os.getpid():
+                self._finisher = ThreadPoolExecutor(max_workers=self.finish_threads,
+                                                    thread_name_prefix='parse-finish')
+                self._finisher_pid = os.getpid()
+            return self._finisher
+
+    def _reset_executor(self) -> None:
+        logger.error("Parse worker pool is broken, it will be recreated")
+        with self._lock:
+            self._executor = None
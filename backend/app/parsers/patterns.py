@@ -0,0 +1,67 @@
+import re
+
+# Patterns used by the resume parser, compiled once at import time.
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHARACTERS_PATTERN = re.compile(r'[^\w\s@.,-]')
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+
+SKILL_HEADING_PATTERNS = [
+    re.compile(r'skills?:?\s*([^\n]+)'),
+    re.compile(r'technologies?:?\s*([^\n]+)'),
+    re.compile(r'programming languages?:?\s*([^\n]+)'),
+    re.compile(r'tools?:?\s*([^\n]+)'),
+]
+SKILL_DELIMITER_PATTERN = re.compile(r'[,;|•]')
+
+EXPERIENCE_DATE_PATTERN = re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|present|current)')
+
+DEGREE_PATTERNS = [
+    re.compile(r'(bachelor|master|phd|doctorate|associate)\s*(of|in|degree)?\s*([^\n,]+)'),
+    re.compile(r'(b\.?a\.?|b\.?s\.?|m\.?a\.?|m\.?s\.?|ph\.?d\.?)\s*(in)?\s*([^\n,]+)'),
+]
+
+SUMMARY_PATTERNS = [
+    re.compile(r'summary:?\s*([^\n]{50,300})', re.DOTALL),
+    re.compile(r'objective:?\s*([^\n]{50,300})', re.DOTALL),
+    re.compile(r'profile:?\s*([^\n]{50,300})', re.DOTALL),
+]
+
+# Section headings, by the section they open. A line is a heading when it
+# holds only the heading, or the heading followed by a colon and content.
+SECTION_HEADINGS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+        'objective', 'career objective', 'about me',
+    ],
+    'skills': [
+        'skills', 'skill', 'technical skills', 'key skills', 'core competencies', 'competencies',
+        'technologies', 'technology', 'programming languages', 'tools',
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'career history',
+    ],
+    'education': [
+        'education', 'academic background', 'qualifications', 'academic qualifications',
+    ],
+    'other': [
+        'certifications', 'certification', 'projects', 'publications', 'awards',
+        'languages', 'interests', 'references', 'volunteering',
+    ],
+}
+
+SECTION_BY_HEADING = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+SECTION_HEADING_PATTERN = re.compile(
+    r'^[ \t]*(?P<heading>'
+    + '|'.join(re.escape(heading) for heading in sorted(SECTION_BY_HEADING, key=len, reverse=True))
+    + r')\b[ \t]*(?P<colon>:)?[ \t]*(?P<rest>[^\n]*)$',
+    re.IGNORECASE | re.MULTILINE
+)
@@ -1,25 +1,324 @@
-import re
-import spacy
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Sequence
 import logging
 from ..models.resume_data import ResumeData, PersonalInfo, Experience, Education, Certification
+from ..metrics import time_stage
+from .skill_matcher import SkillMatcher, DEFAULT_ALIASES
+from .section_segmenter import ResumeSections, segment, CONTACT
+from .patterns import (
+    WHITESPACE_PATTERN, SPECIAL_CHARACTERS_PATTERN, EMAIL_PATTERN, PHONE_PATTERN,
+    LINKEDIN_PATTERN, GITHUB_PATTERN, SKILL_HEADING_PATTERNS, SKILL_DELIMITER_PATTERN,
+    EXPERIENCE_DATE_PATTERN, DEGREE_PATTERNS, SUMMARY_PATTERNS
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction logic changes so cached parse results are invalidated
+PARSER_VERSION = '1.3'
+
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# Only the entity recognizer is used; in the core English pipelines it carries
+# its own embedding layer, so the shared tok2vec can be dropped as well.
+DEFAULT_EXCLUDED_COMPONENTS = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter')
+
+# Names and locations live at the top of a resume
+DEFAULT_NER_HEADER_CHARS = 1000
+
+WARM_UP_TEXT = 'Jane Doe, Software Engineer, San Francisco, CA. jane@example.com'
+
 class ResumeParser:
     """Main resume parser using spaCy and regex patterns."""
     
-    def __init__(self):
+    def __init__(self, model_name: str = DEFAULT_MODEL,
+                 exclude: Sequence[str] = DEFAULT_EXCLUDED_COMPONENTS,
+                 ner_header_chars: int = DEFAULT_NER_HEADER_CHARS,
+                 skill_taxonomy_path: Optional[str] = None):
         self.nlp = None
+        self.model_name = model_name
+        self.exclude = list(exclude)
+        self.ner_header_chars = ner_header_chars
         self.skill_keywords = self._load_skill_keywords()
+        if skill_taxonomy_path:
+            self.skill_matcher = SkillMatcher.from_file(skill_taxonomy_path, DEFAULT_ALIASES)
+        else:
+            self.skill_matcher = SkillMatcher.from_taxonomy(self.skill_keywords, DEFAULT_ALIASES)
         
     def load_model(self):
-        """Load spaCy model."""
+        """Load spaCy model, leaving out the components the parser does not use."""
+        # Deferred: importing spaCy alone takes about a second
+        import spacy
         try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("spaCy model loaded successfully")
+            self.nlp = spacy.load(self.model_name, exclude=self.exclude)
+            logger.info(f"spaCy model loaded successfully with pipes: {self.nlp.pipe_names}")
         except OSError:
-            logger.error("spaCy model not found. Please install with: python -m spacy download en_core_web_sm")
+            logger.error(f"spaCy model not found. Please install with: python -m spacy download {self.model_name}")
             raise
     
-    def _load_skill_keywords(self) -> Dict[str, List[str]]:\n        \"\"\"Load predefined skill keywords by category.\"\"\"\n        return {\n            'programming': [\n                'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'go', 'rust', 'kotlin',\n                'swift', 'typescript', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell'\n            ],\n            'web_frameworks': [\n                'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'rails',\n                'laravel', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'next.js', 'nuxt.js'\n            ],\n            'databases': [\n                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',\n                'dynamodb', 'cassandra', 'elasticsearch', 'firebase', 'mariadb'\n            ],\n            'cloud_devops': [\n                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible',\n                'ci/cd', 'git', 'github', 'gitlab', 'bitbucket', 'linux', 'ubuntu', 'centos'\n            ],\n            'data_science': [\n                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',\n                'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi'\n            ],\n            'mobile': [\n                'ios', 'android', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova'\n            ],\n            'tools': [\n                'jira', 'confluence', 'slack', 'trello', 'figma', 'sketch', 'photoshop', 'illustrator',\n                'visual studio', 'intellij', 'eclipse', 'vim', 'emacs', 'sublime text'\n            ]\n        }\n    \n    def parse(self, text: str) -> ResumeData:\n        \"\"\"Parse resume text and extract structured data.\"\"\"\n        if not self.nlp:\n            self.load_model()\n        \n        # Create ResumeData object\n        resume_data = ResumeData()\n        resume_data.raw_text = text\n        \n        # Clean and preprocess text\n        cleaned_text = self._clean_text(text)\n        doc = self.nlp(cleaned_text)\n        \n        # Extract different sections\n        resume_data.personal_info = self._extract_personal_info(text, doc)\n        resume_data.skills = self._extract_skills(text, doc)\n        resume_data.experience = self._extract_experience(text, doc)\n        resume_data.education = self._extract_education(text, doc)\n        resume_data.summary = self._extract_summary(text, doc)\n        \n        # Calculate confidence score\n        resume_data.confidence_score = self._calculate_confidence_score(resume_data)\n        \n        return resume_data\n    \n    def _clean_text(self, text: str) -> str:\n        \"\"\"Clean and normalize text.\"\"\"\n        # Remove extra whitespace\n        text = re.sub(r'\\s+', ' ', text)\n        # Remove special characters but keep basic punctuation\n        text = re.sub(r'[^\\w\\s@.,-]', '', text)\n        return text.strip()\n    \n    def _extract_personal_info(self, text: str, doc) -> PersonalInfo:\n        \"\"\"Extract personal information from resume.\"\"\"\n        personal_info = PersonalInfo()\n        \n        # Extract email\n        email_pattern = r'\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{2,}\\b'\n        emails = re.findall(email_pattern, text)\n        if emails:\n            personal_info.email = emails[0]\n        \n        # Extract phone number\n        phone_pattern = r'(\\+?\\d{1,3}[-.\\s]?)?(\\(?\\d{3}\\)?[-.\\s]?)?\\d{3}[-.\\s]?\\d{4}'\n        phones = re.findall(phone_pattern, text)\n        if phones:\n            personal_info.phone = ''.join(phones[0]).strip()\n        \n        # Extract name (using named entities)\n        for ent in doc.ents:\n            if ent.label_ == \"PERSON\" and not personal_info.name:\n                personal_info.name = ent.text\n                break\n        \n        # Extract location\n        locations = [ent.text for ent in doc.ents if ent.label_ in [\"GPE\", \"LOC\"]]\n        if locations:\n            personal_info.location = locations[0]\n        \n        # Extract LinkedIn\n        linkedin_pattern = r'linkedin\\.com/in/[\\w-]+'\n        linkedin_matches = re.findall(linkedin_pattern, text.lower())\n        if linkedin_matches:\n            personal_info.linkedin = f\"https://{linkedin_matches[0]}\"\n        \n        # Extract GitHub\n        github_pattern = r'github\\.com/[\\w-]+'\n        github_matches = re.findall(github_pattern, text.lower())\n        if github_matches:\n            personal_info.github = f\"https://{github_matches[0]}\"\n        \n        return personal_info\n    \n    def _extract_skills(self, text: str, doc) -> List[str]:\n        \"\"\"Extract skills from resume text.\"\"\"\n        skills = set()\n        text_lower = text.lower()\n        \n        # Search for skills in all categories\n        for category, skill_list in self.skill_keywords.items():\n            for skill in skill_list:\n                if skill.lower() in text_lower:\n                    skills.add(skill.title())\n        \n        # Additional pattern matching for common skill formats\n        skill_patterns = [\n            r'skills?:?\\s*([^\\n]+)',\n            r'technologies?:?\\s*([^\\n]+)',\n            r'programming languages?:?\\s*([^\\n]+)',\n            r'tools?:?\\s*([^\\n]+)'\n        ]\n        \n        for pattern in skill_patterns:\n            matches = re.findall(pattern, text_lower)\n            for match in matches:\n                # Split by common delimiters\n                potential_skills = re.split(r'[,;|•]', match)\n                for skill in potential_skills:\n                    skill = skill.strip()\n                    if len(skill) > 2 and len(skill) < 30:  # Filter reasonable skill names\n                        skills.add(skill.title())\n        \n        return list(skills)\n    \n    def _extract_experience(self, text: str, doc) -> List[Experience]:\n        \"\"\"Extract work experience from resume.\"\"\"\n        experiences = []\n        \n        # Simple pattern matching for experience sections\n        # This is a basic implementation - could be enhanced with ML\n        experience_pattern = r'(\\d{4})\\s*[-–]\\s*(\\d{4}|present|current)'\n        date_matches = re.findall(experience_pattern, text.lower())\n        \n        # For now, create a basic experience entry if dates are found\n        if date_matches:\n            # This is a simplified extraction - in practice, you'd want more sophisticated parsing\n            exp = Experience(\n                company=\"Company Name\",  # Would extract from context\n                position=\"Position Title\",  # Would extract from context\n                duration=f\"{date_matches[0][0]} - {date_matches[0][1]}\",\n                description=\"Job description would be extracted here\"\n            )\n            experiences.append(exp)\n        \n        return experiences\n    \n    def _extract_education(self, text: str, doc) -> List[Education]:\n        \"\"\"Extract education information from resume.\"\"\"\n        education_list = []\n        \n        # Common degree patterns\n        degree_patterns = [\n            r'(bachelor|master|phd|doctorate|associate)\\s*(of|in|degree)?\\s*([^\\n,]+)',\n            r'(b\\.?a\\.?|b\\.?s\\.?|m\\.?a\\.?|m\\.?s\\.?|ph\\.?d\\.?)\\s*(in)?\\s*([^\\n,]+)'\n        ]\n        \n        for pattern in degree_patterns:\n            matches = re.findall(pattern, text.lower())\n            for match in matches:\n                degree = ' '.join(match).strip()\n                if degree:\n                    edu = Education(\n                        institution=\"University Name\",  # Would extract from context\n                        degree=degree.title(),\n                        field_of_study=\"Field of Study\"  # Would extract from context\n                    )\n                    education_list.append(edu)\n                    break  # For now, just take the first match\n        \n        return education_list\n    \n    def _extract_summary(self, text: str, doc) -> Optional[str]:\n        \"\"\"Extract summary/objective section.\"\"\"\n        summary_patterns = [\n            r'summary:?\\s*([^\\n]{50,300})',\n            r'objective:?\\s*([^\\n]{50,300})',\n            r'profile:?\\s*([^\\n]{50,300})'\n        ]\n        \n        for pattern in summary_patterns:\n            matches = re.findall(pattern, text.lower(), re.DOTALL)\n            if matches:\n                return matches[0].strip()\n        \n        return None\n    \n    def _calculate_confidence_score(self, resume_data: ResumeData) -> float:\n        \"\"\"Calculate confidence score based on extracted data completeness.\"\"\"\n        score = 0.0\n        \n        # Personal info completeness (30%)\n        if resume_data.personal_info.name:\n            score += 0.1\n        if resume_data.personal_info.email:\n            score += 0.1\n        if resume_data.personal_info.phone:\n            score += 0.1\n        \n        # Skills (25%)\n        if len(resume_data.skills) > 0:\n            score += min(0.25, len(resume_data.skills) * 0.05)\n        \n        # Experience (30%)\n        if len(resume_data.experience) > 0:\n            score += min(0.3, len(resume_data.experience) * 0.15)\n        \n        # Education (15%)\n        if len(resume_data.education) > 0:\n            score += 0.15\n        \n        return min(1.0, score)
\ No newline at end of file
+    def warm_up(self):
+        """Load the model and run it once so lazily initialised state is built up front."""
+        if not self.nlp:
+            self.load_model()
+        self.nlp(WARM_UP_TEXT)
+    
+    @property
+    def version(self) -> str:
+        """Identify the parser and model that produce parse results."""
+        if not self.nlp:
+            self.load_model()
+        meta = self.nlp.meta
+        return (f"{PARSER_VERSION}:{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+                f":{'+'.join(self.nlp.pipe_names)}:{self.ner_header_chars}")
+    
+    def _load_skill_keywords(self) -> Dict[str, List[str]]:
+        """Load predefined skill keywords by category."""
+        return {
+            'programming': [
+                'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'go', 'rust', 'kotlin',
+                'swift', 'typescript', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell'
+            ],
+            'web_frameworks': [
+                'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'rails',
+                'laravel', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'next.js', 'nuxt.js'
+            ],
+            'databases': [
+                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
+                'dynamodb', 'cassandra', 'elasticsearch', 'firebase', 'mariadb'
+            ],
+            'cloud_devops': [
+                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible',
+                'ci/cd', 'git', 'github', 'gitlab', 'bitbucket', 'linux', 'ubuntu', 'centos'
+            ],
+            'data_science': [
+                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
+                'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi'
+            ],
+            'mobile': [
+                'ios', 'android', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova'
+            ],
+            'tools': [
+                'jira', 'confluence', 'slack', 'trello', 'figma', 'sketch', 'photoshop', 'illustrator',
+                'visual studio', 'intellij', 'eclipse', 'vim', 'emacs', 'sublime text'
+            ]
+        }
+    
+    def parse(self, text: str) -> ResumeData:
+        """Parse resume text and extract structured data."""
+        if not self.nlp:
+            self.load_model()
+        
+        # Clean and preprocess text
+        with time_stage('clean'):
+            cleaned_text = self._clean_text(text)
+        with time_stage('ner'):
+            doc = self.nlp(self._header(cleaned_text))
+        
+        return self._build_resume_data(text, doc)
+    
+    def parse_many(self, texts: Iterable[str], batch_size: int = 32, n_process: int = 1) -> Iterator[ResumeData]:
+        """Parse many resume texts, streaming them through nlp.pipe.
+        
+        Results are yielded lazily in input order. With ``n_process > 1``
+        spaCy runs the pipeline in worker processes.
+        """
+        if not self.nlp:
+            self.load_model()
+        
+        pairs = ((self._header(self._clean_text(text)), text) for text in texts)
+        for doc, text in self.nlp.pipe(pairs, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            yield self._build_resume_data(text, doc)
+    
+    def _build_resume_data(self, text: str, doc) -> ResumeData:
+        """Run the extractors over a resume and its processed doc."""
+        with time_stage('fields'):
+            return self._extract_fields(text, doc)
+    
+    def _extract_fields(self, text: str, doc) -> ResumeData:
+        # Create ResumeData object
+        resume_data = ResumeData()
+        resume_data.raw_text = text
+        
+        # Split into sections once; each extractor scans only its own
+        sections = segment(text)
+        
+        # Extract different sections
+        resume_data.personal_info = self._extract_personal_info(sections, doc)
+        resume_data.skills = self._extract_skills(sections, doc)
+        resume_data.skill_categories = self._categorize_skills(resume_data.skills)
+        resume_data.experience = self._extract_experience(sections, doc)
+        resume_data.education = self._extract_education(sections, doc)
+        resume_data.summary = self._extract_summary(sections, doc)
+        
+        # Calculate confidence score
+        resume_data.confidence_score = self._calculate_confidence_score(resume_data)
+        
+        return resume_data
+    
+    def _clean_text(self, text: str) -> str:
+        """Clean and normalize text."""
+        # Remove extra whitespace
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        # Remove special characters but keep basic punctuation
+        text = SPECIAL_CHARACTERS_PATTERN.sub('', text)
+        return text.strip()
+    
+    def _header(self, cleaned_text: str) -> str:
+        """Leading slice of the resume that NER runs over, cut at a word boundary."""
+        if not self.ner_header_chars or len(cleaned_text) <= self.ner_header_chars:
+            return cleaned_text
+        cut = cleaned_text.rfind(' ', 0, self.ner_header_chars)
+        return cleaned_text[:cut if cut > 0 else self.ner_header_chars]
+    
+    @staticmethod
+    def _search_contact(sections: ResumeSections, pattern, lower: bool = False):
+        """First match in the contact header, falling back to the whole resume."""
+        scopes = (CONTACT, None) if sections.has(CONTACT) else (None,)
+        for scope in scopes:
+            text = sections.lower(scope) if lower else sections.get(scope)
+            match = pattern.search(text)
+            if match:
+                return match
+        return None
+    
+    def _extract_personal_info(self, sections: ResumeSections, doc) -> PersonalInfo:
+        """Extract personal information from resume."""
+        personal_info = PersonalInfo()
+        
+        # Extract email
+        email_match = self._search_contact(sections, EMAIL_PATTERN)
+        if email_match:
+            personal_info.email = email_match.group()
+        
+        # Extract phone number
+        phone_match = self._search_contact(sections, PHONE_PATTERN)
+        if phone_match:
+            personal_info.phone = ''.join(phone_match.groups('')).strip()
+        
+        # Extract name (using named entities)
+        for ent in doc.ents:
+            if ent.label_ == "PERSON" and not personal_info.name:
+                personal_info.name = ent.text
+                break
+        
+        # Extract location
+        locations = [ent.text for ent in doc.ents if ent.label_ in ["GPE", "LOC"]]
+        if locations:
+            personal_info.location = locations[0]
+        
+        # Extract LinkedIn
+        linkedin_match = self._search_contact(sections, LINKEDIN_PATTERN, lower=True)
+        if linkedin_match:
+            personal_info.linkedin = f"https://{linkedin_match.group()}"
+        
+        # Extract GitHub
+        github_match = self._search_contact(sections, GITHUB_PATTERN, lower=True)
+        if github_match:
+            personal_info.github = f"https://{github_match.group()}"
+        
+        return personal_info
+    
+    def _extract_skills(self, sections: ResumeSections, doc) -> List[str]:
+        """Extract skills from resume text."""
+        # Known skills and aliases, found in one pass over the whole text
+        skills = dict.fromkeys(self.skill_matcher.extract(sections.text))
+        skills_lower = sections.lower('skills')
+        
+        # Additional pattern matching for common skill formats
+        for pattern in SKILL_HEADING_PATTERNS:
+            matches = pattern.findall(skills_lower)
+            for match in matches:
+                # Split by common delimiters
+                potential_skills = SKILL_DELIMITER_PATTERN.split(match)
+                for skill in potential_skills:
+                    skill = skill.strip()
+                    if len(skill) > 2 and len(skill) < 30:  # Filter reasonable skill names
+                        skills[skill.title()] = None
+        
+        return list(skills)
+    
+    def _categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
+        """Group the taxonomy skills among ``skills`` by category."""
+        categories: Dict[str, List[str]] = {}
+        for skill in skills:
+            category = self.skill_matcher.categories.get(skill)
+            if category:
+                categories.setdefault(category, []).append(skill)
+        return categories
+    
+    def _extract_experience(self, sections: ResumeSections, doc) -> List[Experience]:
+        """Extract work experience from resume."""
+        experiences = []
+        
+        # Simple pattern matching for experience sections
+        # This is a basic implementation - could be enhanced with ML
+        date_matches = EXPERIENCE_DATE_PATTERN.findall(sections.lower('experience'))
+        
+        # For now, create a basic experience entry if dates are found
+        if date_matches:
+            # This is a simplified extraction - in practice, you'd want more sophisticated parsing
+            exp = Experience(
+                company="Company Name",  # Would extract from context
+                position="Position Title",  # Would extract from context
+                duration=f"{date_matches[0][0]} - {date_matches[0][1]}",
+                description="Job description would be extracted here"
+            )
+            experiences.append(exp)
+        
+        return experiences
+    
+    def _extract_education(self, sections: ResumeSections, doc) -> List[Education]:
+        """Extract education information from resume."""
+        education_list = []
+        education_lower = sections.lower('education')
+        
+        # Common degree patterns
+        for pattern in DEGREE_PATTERNS:
+            matches = pattern.findall(education_lower)
+            for match in matches:
+                degree = ' '.join(match).strip()
+                if degree:
+                    edu = Education(
+                        institution="University Name",  # Would extract from context
+                        degree=degree.title(),
+                        field_of_study="Field of Study"  # Would extract from context
+                    )
+                    education_list.append(edu)
+                    break  # For now, just take the first match
+        
+        return education_list
+    
+    def _extract_summary(self, sections: ResumeSections, doc) -> Optional[str]:
+        """Extract summary/objective section."""
+        summary_lower = sections.lower('summary')
+        
+        for pattern in SUMMARY_PATTERNS:
+            matches = pattern.findall(summary_lower)
+            if matches:
+                return matches[0].strip()
+        
+        return None
+    
+    def _calculate_confidence_score(self, resume_data: ResumeData) -> float:
+        """Calculate confidence score based on extracted data completeness."""
+        score = 0.0
+        
+        # Personal info completeness (30%)
+        if resume_data.personal_info.name:
+            score += 0.1
+        if resume_data.personal_info.email:
+            score += 0.1
+        if resume_data.personal_info.phone:
+            score += 0.1
+        
+        # Skills (25%)
+        if len(resume_data.skills) > 0:
+            score += min(0.25, len(resume_data.skills) * 0.05)
+        
+        # Experience (30%)
+        if len(resume_data.experience) > 0:
+            score += min(0.3, len(resume_data.experience) * 0.15)
+        
+        # Education (15%)
+        if len(resume_data.education) > 0:
+            score += 0.15
+        
+        return min(1.0, score)
\ No newline at end of file
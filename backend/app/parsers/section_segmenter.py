@@ -0,0 +1,79 @@
+import logging
+from typing import List, Dict, Optional, Tuple
+from .patterns import SECTION_HEADING_PATTERN, SECTION_BY_HEADING
+
+logger = logging.getLogger(__name__)
+
+CONTACT = 'contact'
+
+
+class ResumeSections:
+    """A resume split into named sections.
+
+    Sections are kept as character spans of the original text; their text
+    and lowercased text are built on first use. Asking for a section the
+    resume does not have returns the full text, so extractors still see
+    everything when segmentation finds no headings.
+    """
+
+    def __init__(self, text: str, spans: Dict[str, List[Tuple[int, int]]]):
+        self.text = text
+        self.spans = spans
+        self._text_cache: Dict[str, str] = {}
+        self._lower_cache: Dict[str, str] = {}
+
+    def has(self, name: Optional[str]) -> bool:
+        """Whether the resume has a non-empty section ``name``."""
+        return bool(self.spans.get(name))
+
+    def get(self, name: Optional[str]) -> str:
+        """Text of section ``name``, or the full text if it is missing (or None)."""
+        if not self.has(name):
+            return self.text
+        if name not in self._text_cache:
+            self._text_cache[name] = '\n'.join(self.text[start:end] for start, end in self.spans[name])
+        return self._text_cache[name]
+
+    def lower(self, name: Optional[str]) -> str:
+        """Lowercased text of section ``name`` (full text if missing)."""
+        key = name if self.has(name) else ''
+        if key not in self._lower_cache:
+            self._lower_cache[key] = self.get(name).lower()
+        return self._lower_cache[key]
+
+
+def segment(text: str) -> ResumeSections:
+    """Split resume text into sections in one scan over its heading lines.
+
+    Text before the first heading is the ``contact`` section. A heading on a
+    line of its own opens a section that runs to the next heading; an inline
+    ``Heading: content`` line forms a one-line section, after which the
+    previously open section continues. Every section includes its heading
+    line, so label-based patterns still match within it.
+    """
+    spans: Dict[str, List[Tuple[int, int]]] = {}
+    current = CONTACT
+    start = 0
+
+    def close(section: str, end: int) -> None:
+        if end > start and text[start:end].strip():
+            spans.setdefault(section, []).append((start, end))
+
+    for match in SECTION_HEADING_PATTERN.finditer(text):
+        inline = match.group('rest').strip()
+        if inline and not match.group('colon'):
+            # Prose that merely starts with a heading word
+            continue
+
+        section = SECTION_BY_HEADING[match.group('heading').lower()]
+        close(current, match.start())
+        if inline:
+            start = match.start()
+            close(section, match.end())
+            start = match.end()
+        else:
+            current = section
+            start = match.start()
+
+    close(current, len(text))
+    return ResumeSections(text, spans)
@@ -0,0 +1,161 @@
+import re
+import json
+import logging
+from collections import deque
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Keeps tech names such as c++, c#, node.js and asp.net as single tokens; a
+# trailing period is not part of the token. Slashes and hyphens split tokens
+# (so "python/django" yields both), and skills are tokenized the same way.
+SKILL_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*')
+
+# Common alternative spellings, mapped to the canonical keyword
+DEFAULT_ALIASES = {
+    'javascript': ['js', 'ecmascript'],
+    'go': ['golang'],
+    'c++': ['cpp'],
+    'c#': ['csharp'],
+    'node.js': ['nodejs', 'node'],
+    'next.js': ['nextjs'],
+    'nuxt.js': ['nuxtjs'],
+    'vue': ['vue.js', 'vuejs'],
+    'react': ['react.js', 'reactjs'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo'],
+    'sql server': ['mssql'],
+    'kubernetes': ['k8s'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'aws': ['amazon web services'],
+    'ci/cd': ['cicd'],
+    'machine learning': ['ml'],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'power bi': ['powerbi'],
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase skill tokens of ``text``."""
+    return SKILL_TOKEN_PATTERN.findall(text.lower())
+
+
+class SkillMatcher:
+    """Token-level Aho-Corasick automaton over a skill taxonomy.
+
+    Every skill and alias is compiled once into a trie of token sequences
+    with failure links, so a resume is scanned in a single pass over its
+    tokens regardless of taxonomy size. Matching on tokens rather than
+    characters means ``java`` does not fire inside ``javascript`` and ``r``
+    does not fire inside every word containing the letter.
+    """
+
+    def __init__(self):
+        # State 0 is the root; each state has token transitions, a failure
+        # link and the canonical skills that end there.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self.categories: Dict[str, str] = {}
+        self._compiled = True
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: Dict[str, Iterable[Any]],
+                      aliases: Optional[Dict[str, Iterable[str]]] = None) -> 'SkillMatcher':
+        """Build a matcher from ``{category: [skill, ...]}``.
+
+        A skill is either a name or ``{'name': ..., 'aliases': [...]}``;
+        ``aliases`` adds more alternative spellings keyed by skill name.
+        """
+        matcher = cls()
+        aliases = aliases or {}
+        for category, skills in taxonomy.items():
+            for skill in skills:
+                if isinstance(skill, dict):
+                    name, skill_aliases = skill['name'], list(skill.get('aliases', []))
+                else:
+                    name, skill_aliases = skill, []
+                skill_aliases += aliases.get(name.lower(), [])
+                matcher.add(name, category, skill_aliases)
+        matcher.compile()
+        return matcher
+
+    @classmethod
+    def from_file(cls, path: str,
+                  aliases: Optional[Dict[str, Iterable[str]]] = None) -> 'SkillMatcher':
+        """Build a matcher from a JSON taxonomy file (same shape as from_taxonomy)."""
+        with open(path) as f:
+            taxonomy = json.load(f)
+        matcher = cls.from_taxonomy(taxonomy, aliases)
+        logger.info(f"Loaded {len(matcher.categories)} skills from {path}")
+        return matcher
+
+    @staticmethod
+    def canonical_name(name: str) -> str:
+        """Display form of a skill, as returned by the parser."""
+        return name.title()
+
+    def add(self, name: str, category: str, aliases: Iterable[str] = ()) -> None:
+        """Register a skill and its aliases. Call compile() before matching."""
+        canonical = self.canonical_name(name)
+        self.categories.setdefault(canonical, category)
+        for surface in (name, *aliases):
+            tokens = tokenize(surface)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                state = self._goto[state].get(token) or self._new_state(state, token)
+            if canonical not in self._output[state]:
+                self._output[state].append(canonical)
+        self._compiled = False
+
+    def compile(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                for skill in self._output[self._fail[child]]:
+                    if skill not in self._output[child]:
+                        self._output[child].append(skill)
+                queue.append(child)
+        self._compiled = True
+
+    def find(self, text: str) -> List[Tuple[str, int]]:
+        """All skill occurrences as (canonical name, end token index), in text order."""
+        if not self._compiled:
+            self.compile()
+        matches = []
+        state = 0
+        for position, token in enumerate(tokenize(text)):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for skill in self._output[state]:
+                matches.append((skill, position))
+        return matches
+
+    def extract(self, text: str) -> Dict[str, str]:
+        """Distinct skills found in ``text`` mapped to their category, in order of first mention."""
+        found: Dict[str, str] = {}
+        for skill, _ in self.find(text):
+            if skill not in found:
+                found[skill] = self.categories[skill]
+        return found
+
+    def _new_state(self, parent: int, token: str) -> int:
+        self._goto.append({})
+        self._fail.append(0)
+        self._output.append([])
+        state = len(self._goto) - 1
+        self._goto[parent][token] = state
+        return state
@@ -0,0 +1,174 @@
+import uuid
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from werkzeug.utils import secure_filename
+from .models.resume_data import ResumeData
+from .parsers.resume_parser import ResumeParser
+from .utils.file_handler import FileHandler
+from .utils.job_matcher import JobMatcher, TFIDF
+from .storage.parse_cache import ParseCache
+from .metrics import time_stage, RESUMES_PARSED
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(Exception):
+    """Raised when no text can be extracted from an uploaded file."""
+
+
+class ResumePipeline:
+    """Extract, parse and match uploaded resumes, reusing cached parse results.
+
+    With ``store_candidates`` set, every parsed resume is also added to the
+    job matcher's candidate pool for job -> candidate ranking.
+    """
+
+    def __init__(self, file_handler: FileHandler, resume_parser: ResumeParser,
+                 job_matcher: JobMatcher, parse_cache: Optional[ParseCache] = None,
+                 batch_size: int = 32, n_process: int = 1, store_candidates: bool = False):
+        self.file_handler = file_handler
+        self.resume_parser = resume_parser
+        self.job_matcher = job_matcher
+        self.parse_cache = parse_cache
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.store_candidates = store_candidates
+
+    def process(self, content: bytes, filename: str, k: int = 10, min_score: int = 0,
+                mode: Optional[str] = None) -> Dict[str, Any]:
+        """Parse and match a single upload.
+
+        Raises ExtractionError if the file yields no text.
+        """
+        filename, file_extension, cache_key, cache_entry = self.lookup(content, filename)
+        if cache_entry is None:
+            parsed_data = self.parse_content(content, file_extension)
+            return self.finish(filename, cache_key, parsed_data, None, k, min_score, mode)
+        return self.finish(filename, cache_key, None, cache_entry, k, min_score, mode)
+
+    def process_many(self, uploads: List[Tuple[str, bytes]], k: int = 10,
+                     min_score: int = 0, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Parse and match many uploads, running NLP over all of them in one pipe.
+
+        Returns one result per upload, in input order; failures are reported
+        as ``{'filename': ..., 'error': ...}`` entries instead of raising.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(uploads)
+        pending: List[Tuple[int, str, str]] = []
+        texts: List[str] = []
+
+        for position, (filename, content) in enumerate(uploads):
+            try:
+                filename, file_extension, cache_key, cache_entry = self.lookup(content, filename)
+                if cache_entry is not None:
+                    results[position] = self.finish(filename, cache_key, None, cache_entry, k, min_score, mode)
+                    continue
+                text_content = self.extract(content, file_extension)
+            except Exception as e:
+                results[position] = self.failure(filename, e)
+                continue
+            pending.append((position, filename, cache_key))
+            texts.append(text_content)
+
+        if texts:
+            parsed = self.resume_parser.parse_many(
+                texts, batch_size=self.batch_size, n_process=self.n_process
+            )
+            for (position, filename, cache_key), parsed_data in zip(pending, parsed):
+                try:
+                    results[position] = self.finish(filename, cache_key, parsed_data, None, k, min_score, mode)
+                except Exception as e:
+                    results[position] = self.failure(filename, e)
+
+        return results
+
+    def extract(self, content: bytes, file_extension: str) -> str:
+        """Extract text from an upload. Raises ExtractionError if there is none."""
+        # Per-format stages, so slow PDFs stand out from DOCX
+        stage = f'extract_{file_extension}' if file_extension in ('pdf', 'doc', 'docx') else 'extract'
+        with time_stage(stage):
+            text_content = self.file_handler.extract_text(memoryview(content), file_extension)
+        if not text_content:
+            raise ExtractionError('Unable to extract text from file')
+        return text_content
+
+    def parse_content(self, content: bytes, file_extension: str) -> ResumeData:
+        """Extract and parse an upload, without touching the cache or the job index."""
+        return self.resume_parser.parse(self.extract(content, file_extension))
+
+    def lookup(self, content: bytes, filename: str):
+        """Resolve the file extension and any cached parse result for an upload."""
+        filename = secure_filename(filename)
+        file_extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+        if self.parse_cache is None:
+            return filename, file_extension, None, None
+
+        # Identical uploads parsed by the same parser version share a cache entry
+        with time_stage('cache_lookup'):
+            cache_key = self.parse_cache.make_key(content, file_extension, self.resume_parser.version)
+            cache_entry = self.parse_cache.get(cache_key)
+        if cache_entry is not None:
+            logger.info(f"Parse cache hit: {cache_key}")
+        return filename, file_extension, cache_key, cache_entry
+
+    def finish(self, filename: str, cache_key: Optional[str], parsed_data: Optional[ResumeData],
+               cache_entry: Optional[Dict[str, Any]], k: int, min_score: int,
+               mode: Optional[str] = None) -> Dict[str, Any]:
+        """Match a parsed resume and build the response payload."""
+        cached = cache_entry is not None
+        if cached:
+            parsed_data = ResumeData.from_dict(cache_entry['resume'])
+        else:
+            cache_entry = {'resume': parsed_data.to_dict()}
+
+        # Matches are reused only while the job index and options are unchanged
+        mode = mode or self.job_matcher.match_mode
+        match_key = f"{self.job_matcher.fingerprint}:{k}:{min_score}:{mode}"
+        if cache_entry.get('match_key') == match_key:
+            job_matches = cache_entry['job_matches']
+        else:
+            with time_stage('match'):
+                job_matches = self.job_matcher.find_matches(parsed_data, k=k, min_score=min_score, mode=mode)
+            if self.parse_cache is not None:
+                self.parse_cache.put(cache_key, {**cache_entry, 'match_key': match_key,
+                                                 'job_matches': job_matches})
+
+        result_id = str(uuid.uuid4())
+        candidate_id = None
+        if self.store_candidates:
+            # Re-uploads of the same file replace their candidate entry
+            candidate_id = cache_key or result_id
+            # The response's matches double as the stored top-k when they rank the same way
+            reusable = mode == TFIDF and min_score == 0 and k >= self.job_matcher.candidate_top_k
+            try:
+                with time_stage('store_candidate'):
+                    self.job_matcher.add_candidate(candidate_id, parsed_data,
+                                                   job_matches=job_matches if reusable else None)
+            except Exception as e:
+                logger.error(f"Error storing candidate {candidate_id}: {str(e)}")
+                candidate_id = None
+
+        RESUMES_PARSED.inc(status='ok')
+        return {
+            'id': result_id,
+            'filename': filename,
+            'parsed_at': datetime.utcnow().isoformat(),
+            'personal_info': parsed_data.personal_info,
+            'skills': parsed_data.skills,
+            'skill_categories': parsed_data.skill_categories,
+            'experience': parsed_data.experience,
+            'education': parsed_data.education,
+            'job_matches': job_matches,
+            'cached': cached,
+            'candidate_id': candidate_id
+        }
+
+    @staticmethod
+    def failure(filename: str, error: Exception) -> Dict[str, Any]:
+        """Per-file error payload; unexpected errors are logged and not exposed."""
+        RESUMES_PARSED.inc(status='error')
+        if not isinstance(error, ExtractionError):
+            logger.error(f"Error parsing {filename}: {str(error)}")
+        return {'filename': filename, 'error': str(error) if isinstance(error, ExtractionError)
+                else 'Failed to parse resume'}
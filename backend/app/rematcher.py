@@ -0,0 +1,107 @@
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Set
+from .utils.job_matcher import JobMatcher
+from .metrics import time_stage
+
+logger = logging.getLogger(__name__)
+
+IDLE = 'idle'
+RUNNING = 'running'
+
+
+class Rematcher:
+    """Background thread keeping stored candidates' top-k job lists current.
+
+    Job changes are submitted as they happen and coalesced while a run is
+    in progress, so a burst of postings costs one delta pass over the
+    candidates (JobMatcher.rematch_candidates) rather than one per job.
+    Progress of the current run and a summary of the last one are
+    available from stats().
+    """
+
+    def __init__(self, job_matcher: JobMatcher, chunk_size: int = 1000, max_pairs: int = 2000000):
+        self.job_matcher = job_matcher
+        self.chunk_size = chunk_size
+        self.max_pairs = max_pairs
+
+        self._pending_jobs: Set[str] = set()
+        self._full_pending = False
+        self._current: Optional[Dict[str, Any]] = None
+        self._last_run: Optional[Dict[str, Any]] = None
+        self._runs = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, job_ids: Optional[Iterable[str]] = None) -> None:
+        """Queue the ids of added, changed or removed jobs; None re-matches everyone in full."""
+        with self._condition:
+            if job_ids is None:
+                self._full_pending = True
+                self._pending_jobs.clear()
+            elif not self._full_pending:
+                self._pending_jobs.update(str(job_id) for job_id in job_ids)
+            self._ensure_thread()
+            self._condition.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """State, queued work, progress of the current run and the last run's summary."""
+        with self._condition:
+            return {
+                'state': RUNNING if self._current is not None else IDLE,
+                'pending_jobs': len(self._pending_jobs),
+                'full_pending': self._full_pending,
+                'current': dict(self._current) if self._current is not None else None,
+                'last_run': dict(self._last_run) if self._last_run is not None else None,
+                'runs': self._runs,
+            }
+
+    def _ensure_thread(self) -> None:
+        # Started on first use, so forked workers each get their own thread
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='candidate-rematch', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._full_pending and not self._pending_jobs:
+                    self._condition.wait()
+                job_ids = None if self._full_pending else sorted(self._pending_jobs)
+                self._full_pending = False
+                self._pending_jobs = set()
+                self._current = {
+                    'started_at': datetime.utcnow().isoformat(),
+                    'jobs': 'all' if job_ids is None else len(job_ids),
+                    'candidates_done': 0,
+                    'candidates_total': None,
+                }
+            self._rematch(job_ids)
+
+    def _rematch(self, job_ids: Optional[List[str]]) -> None:
+        started = time.perf_counter()
+        summary = dict(self._current)
+        try:
+            with time_stage('candidate_rematch'):
+                summary['updated'] = self.job_matcher.rematch_candidates(
+                    job_ids, chunk_size=self.chunk_size, max_pairs=self.max_pairs, progress=self._progress
+                )
+            summary['status'] = 'done'
+        except Exception as e:
+            logger.error(f"Error re-matching candidates: {str(e)}")
+            summary['status'] = 'failed'
+            summary['error'] = str(e)
+        with self._condition:
+            summary.update({key: self._current[key] for key in ('candidates_done', 'candidates_total')})
+            summary['seconds'] = round(time.perf_counter() - started, 3)
+            self._last_run = summary
+            self._current = None
+            self._runs += 1
+
+    def _progress(self, done: int, total: int) -> None:
+        with self._condition:
+            if self._current is not None:
+                self._current['candidates_done'] = done
+                self._current['candidates_total'] = total
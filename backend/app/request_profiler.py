@@ -0,0 +1,78 @@
+import os
+import time
+import uuid
+import random
+import cProfile
+import logging
+from typing import Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfiler:
+    """Opt-in cProfile capture of sampled or explicitly requested HTTP requests.
+
+    Disabled unless ``directory`` is set. A request is profiled when it
+    carries the trigger ``header`` (whose value must equal ``token`` if one
+    is configured), or at random with probability ``sample_rate``. Each
+    profile is dumped as a ``.prof`` file for ``pstats`` or snakeviz, and
+    only the newest ``max_files`` are kept.
+    """
+
+    def __init__(self, directory: Optional[str] = None, sample_rate: float = 0.0,
+                 header: str = 'X-Profile', token: Optional[str] = None, max_files: int = 500):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.header = header
+        self.token = token
+        self.max_files = max_files
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def should_profile(self, headers: Mapping[str, str]) -> bool:
+        """Whether to profile a request with these headers."""
+        if not self.enabled:
+            return False
+        requested = headers.get(self.header)
+        if requested:
+            return self.token is None or requested == self.token
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """Start profiling the current thread. Returns None if a profiler is already active."""
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Only one profiler can be active at a time on newer Pythons
+            return None
+        return profiler
+
+    def finish(self, profiler: cProfile.Profile, name: str) -> Optional[str]:
+        """Stop profiling and dump the stats. Returns the file name written."""
+        profiler.disable()
+        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name).strip('_') or 'request'
+        filename = f"{time.strftime('%Y%m%dT%H%M%S')}-{safe_name}-{uuid.uuid4().hex[:8]}.prof"
+        try:
+            profiler.dump_stats(os.path.join(self.directory, filename))
+        except OSError as e:
+            logger.warning(f"Failed to write request profile: {str(e)}")
+            return None
+        self._prune()
+        return filename
+
+    def _prune(self) -> None:
+        try:
+            profiles = sorted(
+                (entry for entry in os.scandir(self.directory) if entry.name.endswith('.prof')),
+                key=lambda entry: entry.stat().st_mtime
+            )
+            for entry in profiles[:max(0, len(profiles) - self.max_files)]:
+                os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Failed to prune request profiles: {str(e)}")
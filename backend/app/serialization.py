@@ -0,0 +1,88 @@
+import json
+import logging
+import dataclasses
+from datetime import datetime, date
+from typing import Any, Dict, Iterable, Iterator
+from flask.json.provider import JSONProvider
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# orjson handles dataclasses, datetimes and numpy values natively
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types orjson handles natively and json does not."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow: nested dataclasses come back through here
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(value, default=_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def stream_object(fields: Dict[str, Any], array_key: str, items: Iterable[Any],
+                  chunk_size: int = 100) -> Iterator[bytes]:
+    """Stream ``{**fields, array_key: [items...]}`` as JSON, a chunk of items at a time.
+
+    Only one chunk of encoded items is held at once, so large listings start
+    reaching the client before the whole body is built.
+    """
+    head = dumps(fields)
+    yield head[:-1] + (b',' if fields else b'') + dumps(array_key) + b':['
+    chunk = []
+    first = True
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield (b'' if first else b',') + dumps(chunk)[1:-1]
+            chunk, first = [], False
+    if chunk:
+        yield (b'' if first else b',') + dumps(chunk)[1:-1]
+    yield b']}'
+
+
+class FastJSONProvider(JSONProvider):
+    """Flask JSON provider backed by ``dumps``/``loads``, so every endpoint shares one encoder."""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Encoded straight to bytes, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def backend_name() -> str:
+    """Which encoder is in use, for logs."""
+    return 'orjson' if orjson is not None else 'json'
@@ -0,0 +1 @@
+# Persistent storage package
\ No newline at end of file
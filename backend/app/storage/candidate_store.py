@@ -0,0 +1,196 @@
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from sqlalchemy import (
+    create_engine, event, MetaData, Table, Column, String, Text, Float,
+    DateTime, LargeBinary, select, delete, func, bindparam
+)
+from sqlalchemy.dialects.sqlite import insert
+import numpy as np
+from ..serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+candidates_table = Table(
+    'candidates', metadata,
+    Column('id', String, primary_key=True),
+    Column('payload', Text, nullable=False),
+    Column('match_text', Text, nullable=False),
+    Column('location', String),
+    Column('experience_years', Float),
+    # TF-IDF vector as raw int32 indices / float64 weights, valid only for
+    # the vectorizer identified by vector_key
+    Column('vector_key', String),
+    Column('vector_indices', LargeBinary),
+    Column('vector_data', LargeBinary),
+    Column('updated_at', DateTime, default=datetime.utcnow),
+)
+
+# Each candidate's top-k job matches as a JSON list of [job_id, percentage,
+# similarity], valid only for the vectorizer identified by match_key
+candidate_matches_table = Table(
+    'candidate_matches', metadata,
+    Column('candidate_id', String, primary_key=True),
+    Column('match_key', String),
+    Column('payload', Text, nullable=False),
+    Column('updated_at', DateTime, default=datetime.utcnow),
+)
+
+
+class CandidateStore:
+    """SQLite-backed store of parsed candidates for reverse (job -> candidate) matching.
+
+    Each row keeps the candidate's profile, the text the matcher vectorizes
+    and its TF-IDF vector, so the candidate matrix can be reloaded at startup
+    without re-vectorizing while the job vocabulary is unchanged. A second
+    table keeps each candidate's top-k job matches, updated in place as
+    jobs change.
+    """
+
+    def __init__(self, database_url: str = 'sqlite:///candidates.db'):
+        self.engine = create_engine(database_url)
+        event.listen(self.engine, 'connect', self._configure_connection)
+        metadata.create_all(self.engine)
+
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    def count(self) -> int:
+        """Number of stored candidates."""
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(candidates_table)).scalar_one()
+
+    def upsert_candidates(self, candidates: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace candidates in one transaction. Returns the count written.
+
+        Each candidate is a dict with ``id``, ``profile``, ``match_text`` and
+        optionally ``vector_key`` and ``vector`` (an ``(indices, data)`` pair).
+        """
+        rows = [self._to_row(candidate) for candidate in candidates]
+        if not rows:
+            return 0
+        with self.engine.begin() as conn:
+            statement = insert(candidates_table)
+            conn.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[candidates_table.c.id],
+                    set_={column: statement.excluded[column] for column in rows[0] if column != 'id'}
+                ),
+                rows
+            )
+        return len(rows)
+
+    def update_vectors(self, vectors: Dict[str, Any], vector_key: str) -> None:
+        """Replace stored vectors after the job vocabulary changed."""
+        if not vectors:
+            return
+        params = []
+        for candidate_id, vector in vectors.items():
+            encoded = self._encode_vector(vector)
+            params.append({'candidate_id': candidate_id, 'key': vector_key,
+                           'indices': encoded['vector_indices'], 'data': encoded['vector_data']})
+        with self.engine.begin() as conn:
+            conn.execute(
+                candidates_table.update()
+                .where(candidates_table.c.id == bindparam('candidate_id'))
+                .values(vector_key=bindparam('key'), vector_indices=bindparam('indices'),
+                        vector_data=bindparam('data')),
+                params
+            )
+
+    def delete_candidate(self, candidate_id: str) -> bool:
+        """Delete a candidate. Returns False if it did not exist."""
+        with self.engine.begin() as conn:
+            result = conn.execute(delete(candidates_table).where(candidates_table.c.id == str(candidate_id)))
+            conn.execute(delete(candidate_matches_table)
+                         .where(candidate_matches_table.c.candidate_id == str(candidate_id)))
+        return result.rowcount > 0
+
+    def upsert_matches(self, matches: Dict[str, List[Tuple[str, int, float]]], match_key: str) -> int:
+        """Replace candidates' stored top-k job matches in one transaction."""
+        if not matches:
+            return 0
+        now = datetime.utcnow()
+        rows = [
+            {'candidate_id': str(candidate_id), 'match_key': match_key,
+             'payload': dumps(candidate_matches).decode('utf-8'), 'updated_at': now}
+            for candidate_id, candidate_matches in matches.items()
+        ]
+        with self.engine.begin() as conn:
+            statement = insert(candidate_matches_table)
+            conn.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[candidate_matches_table.c.candidate_id],
+                    set_={column: statement.excluded[column] for column in ('match_key', 'payload', 'updated_at')}
+                ),
+                rows
+            )
+        return len(rows)
+
+    def load_matches(self, match_key: str) -> Dict[str, List[Tuple[str, int, float]]]:
+        """Stored top-k lists made with ``match_key``, by candidate id."""
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                select(candidate_matches_table.c.candidate_id, candidate_matches_table.c.payload)
+                .where(candidate_matches_table.c.match_key == match_key)
+            )
+            return {
+                candidate_id: [(job_id, percentage, similarity) for job_id, percentage, similarity in loads(payload)]
+                for candidate_id, payload in result
+            }
+
+    def iter_candidates(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream stored candidates, least recently written first.
+
+        Yields dicts with ``id``, ``profile``, ``match_text``, ``vector_key``
+        and the raw ``vector_indices`` / ``vector_data`` arrays.
+        """
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+                select(
+                    candidates_table.c.id, candidates_table.c.payload, candidates_table.c.match_text,
+                    candidates_table.c.vector_key, candidates_table.c.vector_indices,
+                    candidates_table.c.vector_data
+                ).order_by(candidates_table.c.updated_at, candidates_table.c.id)
+            )
+            for candidate_id, payload, match_text, vector_key, indices, data in result:
+                yield {
+                    'id': candidate_id,
+                    'profile': loads(payload),
+                    'match_text': match_text,
+                    'vector_key': vector_key,
+                    'vector_indices': np.frombuffer(indices, dtype=np.int32) if indices is not None else None,
+                    'vector_data': np.frombuffer(data, dtype=np.float64) if data is not None else None,
+                }
+
+    @classmethod
+    def _to_row(cls, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        profile = candidate['profile']
+        row = {
+            'id': str(candidate['id']),
+            'payload': dumps(profile).decode('utf-8'),
+            'match_text': candidate['match_text'],
+            'location': profile.get('location'),
+            'experience_years': profile.get('experience_years'),
+            'vector_key': candidate.get('vector_key'),
+            'vector_indices': None,
+            'vector_data': None,
+            'updated_at': datetime.utcnow(),
+        }
+        if candidate.get('vector') is not None:
+            row.update(cls._encode_vector(candidate['vector']))
+        return row
+
+    @staticmethod
+    def _encode_vector(vector) -> Dict[str, Optional[bytes]]:
+        indices, data = vector
+        return {
+            'vector_indices': np.asarray(indices, dtype=np.int32).tobytes(),
+            'vector_data': np.asarray(data, dtype=np.float64).tobytes(),
+        }
@@ -0,0 +1,186 @@
+import os
+import json
+import shutil
+import logging
+import tempfile
+from typing import List, Dict, Any, Optional, Tuple
+from scipy import sparse
+import numpy as np
+from ..utils.job_index import JobIndex, SkillVocabulary
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+CURRENT_POINTER = 'CURRENT'
+
+# Arrays written as .npy files so they can be memory-mapped on load
+ARRAY_NAMES = (
+    'matrix_data', 'matrix_indices', 'matrix_indptr', 'row_norms', 'idf',
+    'skill_indices', 'skill_indptr',
+)
+
+
+def save_snapshot(index: JobIndex, directory: str, revision: int) -> str:
+    """Write the fitted index to ``directory`` and make it the current snapshot.
+
+    Each snapshot goes to a new sub-directory and the ``CURRENT`` pointer
+    is swapped atomically, so workers that still map an older snapshot are
+    never handed half-written files; a published sub-directory is never
+    rewritten. Tombstoned rows are left out of the files, but ``index``
+    itself is not modified.
+    """
+    matrix, row_norms, skill_matrix = index.matrix, index.row_norms, index.skill_matrix
+    if index.size != matrix.shape[0]:
+        # A compacted copy, same vectorizer: refitting here would change the live index under its readers
+        rows = index.active_rows
+        matrix, row_norms, skill_matrix = matrix[rows], row_norms[rows], skill_matrix[rows]
+
+    os.makedirs(directory, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.snapshot-', dir=directory)
+    try:
+        arrays = {
+            'matrix_data': matrix.data,
+            'matrix_indices': matrix.indices,
+            'matrix_indptr': matrix.indptr,
+            'row_norms': row_norms,
+            'idf': index.vectorizer.idf_,
+            'skill_indices': skill_matrix.indices,
+            'skill_indptr': skill_matrix.indptr,
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f'{name}.npy'), np.ascontiguousarray(array))
+
+        vocabulary = {term: int(column) for term, column in index.vocabulary.items()}
+        manifest = {
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'revision': revision,
+            'shape': list(matrix.shape),
+            'skill_shape': list(skill_matrix.shape),
+            'baseline_oov': index.baseline_oov,
+            'vectorizer_options': _json_options(index.vectorizer_options),
+            'job_ids': [str(job['id']) for job in index.jobs],
+            'vocabulary': vocabulary,
+            'skills': index.skills.ids,
+        }
+        with open(os.path.join(staging, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f)
+
+        name, target = _publish(staging, directory, revision)
+        _write_pointer(directory, name)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    _prune_old_snapshots(directory, keep=name)
+    logger.info(f"Index snapshot saved: {target}")
+    return target
+
+
+def load_snapshot(index: JobIndex, directory: str, jobs: List[Dict[str, Any]],
+                  revision: int) -> bool:
+    """Restore ``index`` from the current snapshot by memory-mapping its arrays.
+
+    Returns False (leaving the index untouched) when there is no snapshot,
+    it was taken at another store revision, or its rows do not line up with
+    ``jobs``.
+    """
+    path = _current_path(directory)
+    if path is None:
+        return False
+
+    try:
+        with open(os.path.join(path, 'manifest.json')) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable index snapshot {path}: {str(e)}")
+        return False
+
+    if manifest.get('format_version') != SNAPSHOT_FORMAT_VERSION or manifest.get('revision') != revision:
+        logger.info("Index snapshot is stale, refitting")
+        return False
+    if manifest.get('vectorizer_options') != _json_options(index.vectorizer_options):
+        logger.info("Index snapshot was built with different vectorizer options, refitting")
+        return False
+
+    jobs_by_id = {str(job['id']): job for job in jobs}
+    try:
+        ordered_jobs = [jobs_by_id[job_id] for job_id in manifest['job_ids']]
+    except KeyError:
+        return False
+    if len(ordered_jobs) != len(jobs_by_id):
+        return False
+
+    arrays = {
+        name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+        for name in ARRAY_NAMES
+    }
+    matrix = sparse.csr_matrix(
+        (arrays['matrix_data'], arrays['matrix_indices'], arrays['matrix_indptr']),
+        shape=tuple(manifest['shape']), copy=False
+    )
+    skill_matrix = sparse.csr_matrix(
+        (np.ones(len(arrays['skill_indices'])), arrays['skill_indices'], arrays['skill_indptr']),
+        shape=tuple(manifest['skill_shape']), copy=False
+    )
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    vectorizer = TfidfVectorizer(vocabulary=manifest['vocabulary'], **index.vectorizer_options)
+    vectorizer.idf_ = np.asarray(arrays['idf'])
+
+    skills = SkillVocabulary()
+    skills.ids = manifest['skills']
+
+    index.restore(ordered_jobs, vectorizer, matrix, arrays['row_norms'], skills, skill_matrix,
+                  manifest.get('baseline_oov', 0.0))
+    return True
+
+
+def _json_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    # Round-trip through JSON so tuples compare equal to stored lists.
+    return json.loads(json.dumps(options))
+
+
+def _current_path(directory: str) -> Optional[str]:
+    try:
+        with open(os.path.join(directory, CURRENT_POINTER)) as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(directory, name)
+    return path if os.path.isdir(path) else None
+
+
+def _write_pointer(directory: str, name: str) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, 'w') as f:
+        f.write(name)
+    os.replace(tmp_path, os.path.join(directory, CURRENT_POINTER))
+
+
+def _publish(staging: str, directory: str, revision: int) -> Tuple[str, str]:
+    """Move a staged snapshot to the first free ``rev-N`` name (``rev-N.1``, ... once taken)."""
+    attempt = 0
+    while True:
+        name = f'rev-{revision}' if attempt == 0 else f'rev-{revision}.{attempt}'
+        target = os.path.join(directory, name)
+        if not os.path.exists(target):
+            try:
+                # rename() refuses a non-empty target, so a racing writer's snapshot survives
+                os.rename(staging, target)
+                return name, target
+            except OSError:
+                if not os.path.exists(target):
+                    raise
+        attempt += 1
+
+
+def _prune_old_snapshots(directory: str, keep: str) -> None:
+    # Open memory maps keep unlinked files alive, so removing old
+    # snapshots is safe even if another worker is still using one.
+    # Whatever CURRENT names now is kept too, in case another writer
+    # published after us.
+    current = _current_path(directory)
+    keep = {keep, os.path.basename(current) if current else keep}
+    for entry in os.listdir(directory):
+        if entry.startswith('rev-') and entry not in keep:
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
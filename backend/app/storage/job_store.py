@@ -0,0 +1,191 @@
+import re
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from sqlalchemy import (
+    create_engine, event, MetaData, Table, Column, String, Text, Boolean,
+    DateTime, Integer, select, delete, func, text
+)
+from sqlalchemy.dialects.sqlite import insert
+from ..serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+FTS_TOKEN_PATTERN = re.compile(r'\w+')
+
+metadata = MetaData()
+
+jobs_table = Table(
+    'jobs', metadata,
+    Column('id', String, primary_key=True),
+    Column('payload', Text, nullable=False),
+    Column('location', String),
+    Column('experience_level', String),
+    Column('remote_friendly', Boolean, default=False),
+    Column('updated_at', DateTime, default=datetime.utcnow),
+)
+
+store_meta_table = Table(
+    'store_meta', metadata,
+    Column('key', String, primary_key=True),
+    Column('value', Integer, nullable=False),
+)
+
+
+class JobStore:
+    """SQLite-backed job repository with an FTS5 table for text search.
+
+    Jobs are stored as JSON payloads alongside a few filterable columns.
+    Every write bumps a revision counter so derived artifacts (such as the
+    index snapshot) can tell whether they are still current.
+    """
+
+    def __init__(self, database_url: str = 'sqlite:///jobs.db'):
+        self.engine = create_engine(database_url)
+        event.listen(self.engine, 'connect', self._configure_connection)
+        self._create_schema()
+
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record) -> None:
+        # WAL lets many worker processes read while one writes.
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    def _create_schema(self) -> None:
+        metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5('
+                'job_id UNINDEXED, title, description, requirements, skills)'
+            ))
+            conn.execute(
+                insert(store_meta_table)
+                .values(key='revision', value=0)
+                .on_conflict_do_nothing()
+            )
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every write."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(store_meta_table.c.value).where(store_meta_table.c.key == 'revision')
+            ).scalar_one()
+
+    def count(self) -> int:
+        """Number of stored jobs."""
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(jobs_table)).scalar_one()
+
+    def upsert_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace jobs in a single transaction. Returns the count written."""
+        rows = [self._to_row(job) for job in jobs]
+        if not rows:
+            return 0
+
+        with self.engine.begin() as conn:
+            statement = insert(jobs_table)
+            conn.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[jobs_table.c.id],
+                    set_={
+                        'payload': statement.excluded.payload,
+                        'location': statement.excluded.location,
+                        'experience_level': statement.excluded.experience_level,
+                        'remote_friendly': statement.excluded.remote_friendly,
+                        'updated_at': statement.excluded.updated_at,
+                    }
+                ),
+                rows
+            )
+            conn.execute(
+                text('DELETE FROM jobs_fts WHERE job_id = :job_id'),
+                [{'job_id': row['id']} for row in rows]
+            )
+            conn.execute(
+                text('INSERT INTO jobs_fts (job_id, title, description, requirements, skills) '
+                     'VALUES (:job_id, :title, :description, :requirements, :skills)'),
+                [self._to_fts_row(job) for job in (loads(row['payload']) for row in rows)]
+            )
+            self._bump_revision(conn)
+        return len(rows)
+
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job. Returns False if it did not exist."""
+        with self.engine.begin() as conn:
+            result = conn.execute(delete(jobs_table).where(jobs_table.c.id == str(job_id)))
+            if result.rowcount == 0:
+                return False
+            conn.execute(text('DELETE FROM jobs_fts WHERE job_id = :job_id'), {'job_id': str(job_id)})
+            self._bump_revision(conn)
+        return True
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a single job by id."""
+        with self.engine.connect() as conn:
+            payload = conn.execute(
+                select(jobs_table.c.payload).where(jobs_table.c.id == str(job_id))
+            ).scalar_one_or_none()
+        return loads(payload) if payload else None
+
+    def iter_jobs(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream all jobs in id order without loading the table at once."""
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+                select(jobs_table.c.payload).order_by(jobs_table.c.id)
+            )
+            for payload, in result:
+                yield loads(payload)
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Load every stored job."""
+        return list(self.iter_jobs())
+
+    def search_text(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Full-text search over title, description, requirements and skills.
+
+        Returns job ids ranked by BM25. Query words are quoted so user input
+        cannot inject FTS5 syntax.
+        """
+        tokens = FTS_TOKEN_PATTERN.findall(query)
+        if not tokens:
+            return []
+        match = ' '.join(f'"{token}"' for token in tokens)
+        sql = 'SELECT job_id FROM jobs_fts WHERE jobs_fts MATCH :match ORDER BY rank'
+        params: Dict[str, Any] = {'match': match}
+        if limit:
+            sql += ' LIMIT :limit'
+            params['limit'] = limit
+        with self.engine.connect() as conn:
+            return [row[0] for row in conn.execute(text(sql), params)]
+
+    @staticmethod
+    def _to_row(job: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': str(job['id']),
+            'payload': dumps(job).decode('utf-8'),
+            'location': job.get('location'),
+            'experience_level': job.get('experience_level'),
+            'remote_friendly': bool(job.get('remote_friendly', False)),
+            'updated_at': datetime.utcnow(),
+        }
+
+    @staticmethod
+    def _to_fts_row(job: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'job_id': str(job['id']),
+            'title': job.get('title', ''),
+            'description': job.get('description', ''),
+            'requirements': ' '.join(job.get('requirements', [])),
+            'skills': ' '.join(job.get('skills', [])),
+        }
+
+    @staticmethod
+    def _bump_revision(conn) -> None:
+        conn.execute(
+            store_meta_table.update()
+            .where(store_meta_table.c.key == 'revision')
+            .values(value=store_meta_table.c.value + 1)
+        )
@@ -0,0 +1,191 @@
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from ..serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Two-tier cache of parse results keyed by content hash and parser version.
+
+    The first tier is a bounded in-process LRU; the optional second tier is a
+    directory of JSON files shared by all workers, expired by TTL and trimmed
+    to a size budget (oldest files first).
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_memory_entries: int = 256,
+                 ttl_seconds: int = 7 * 24 * 3600, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self._counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+        }
+
+        # The directory itself is created by the first write
+        if directory:
+            self._disk_bytes = self._scan_disk_usage()
+
+    @staticmethod
+    def make_key(content: bytes, file_extension: str, parser_version: str) -> str:
+        """Content-addressed key: identical bytes parsed by the same parser share a key."""
+        digest = hashlib.sha256()
+        digest.update(parser_version.encode())
+        digest.update(b'\0')
+        digest.update(file_extension.lower().encode())
+        digest.update(b'\0')
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached entry, or None on a miss."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._counters['memory_hits'] += 1
+                return entry
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            self._counters['disk_hits'] += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in both tiers."""
+        with self._lock:
+            self._remember(key, entry)
+            self._counters['writes'] += 1
+        self._write_disk(key, entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes, for sizing the cache."""
+        with self._lock:
+            lookups = self._counters['memory_hits'] + self._counters['disk_hits'] + self._counters['misses']
+            hits = self._counters['memory_hits'] + self._counters['disk_hits']
+            return {
+                **self._counters,
+                'hit_ratio': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'max_memory_entries': self.max_memory_entries,
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes if self.directory else 0,
+            }
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f'{key}.json')
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                self._remove(path)
+                return None
+            with open(path, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {str(e)}")
+            self._remove(path)
+            return None
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dumps(entry))
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+            return
+
+        with self._lock:
+            self._disk_bytes += size - previous_size
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _scan_disk_usage(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def _evict(self) -> None:
+        """Drop expired files, then the oldest ones until 90% of the budget."""
+        now = time.time()
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+        for mtime, size, path in files:
+            if total <= target and now - mtime <= self.ttl_seconds:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._counters['evictions'] += evicted
+        logger.info(f"Parse cache evicted {evicted} entries, {total} bytes on disk")
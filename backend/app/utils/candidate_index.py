@@ -0,0 +1,357 @@
+import logging
+import itertools
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from scipy import sparse
+import numpy as np
+from ..models.resume_data import Experience
+from ..parsers.patterns import EXPERIENCE_DATE_PATTERN
+from .job_index import JobIndex, SkillVocabulary
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_experience_years(experience: List[Experience]) -> Optional[float]:
+    """Total years across experience entries with a parseable duration."""
+    years = None
+    current_year = datetime.utcnow().year
+    for exp in experience:
+        match = EXPERIENCE_DATE_PATTERN.search((exp.duration or '').lower())
+        if not match:
+            continue
+        start = int(match.group(1))
+        end = current_year if match.group(2) in ('present', 'current') else int(match.group(2))
+        years = (years or 0.0) + max(0, end - start)
+    return years
+
+
+class CandidateIndex:
+    """Candidate x term matrix for ranking stored resumes against a job.
+
+    Candidate vectors live in the job index's TF-IDF space, so a job row
+    can be scored against every candidate with one sparse product. New
+    candidates are buffered and stacked onto the matrix on the next query;
+    if the job vocabulary has been refitted since, every candidate is
+    re-vectorized first and ``on_revectorize`` is told the new vectors.
+    Rows are append-only with tombstones, like the job index, until
+    compact() drops the tombstones and renumbers the rest.
+
+    Vectors are passed around as ``(indices, data)`` array pairs. Each
+    candidate may also carry its stored top-k job matches, as
+    ``(job_id, match_percentage, similarity_score)`` tuples.
+    """
+
+    def __init__(self, job_index: JobIndex,
+                 on_revectorize: Optional[Callable[[Dict[str, Any], str], None]] = None):
+        self.job_index = job_index
+        self.on_revectorize = on_revectorize
+
+        self.vectorizer_key: Optional[str] = None
+        self.matrix = sparse.csr_matrix((0, 0))
+        self.norms = np.zeros(0)
+        self.skills = SkillVocabulary()
+        self.skill_matrix = sparse.csr_matrix((0, 0))
+        self.experience_years = np.zeros(0)
+
+        self._ids: List[str] = []
+        self._profiles: List[Optional[Dict[str, Any]]] = []
+        self._texts: List[Optional[str]] = []
+        self._matches: List[Optional[List[Tuple[str, int, float]]]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._active = np.zeros(0, dtype=bool)
+        self._skill_columns = None
+        # Rows added since the matrix was last stacked: (row, vector or None)
+        self._pending: List[Tuple[int, Any]] = []
+        # Bumped whenever compact() renumbers the rows
+        self.generation = 0
+
+    @property
+    def size(self) -> int:
+        """Number of active candidates."""
+        return len(self._row_by_id)
+
+    @property
+    def tombstones(self) -> int:
+        """Number of removed candidates whose rows have not been compacted away."""
+        return len(self._ids) - len(self._row_by_id)
+
+    @property
+    def active_rows(self) -> np.ndarray:
+        """Row positions of the active candidates."""
+        return np.flatnonzero(self._active[:len(self._ids)])
+
+    def add(self, candidate_id: str, profile: Dict[str, Any], match_text: str,
+            vector: Optional[Tuple[np.ndarray, np.ndarray]] = None, vector_key: Optional[str] = None,
+            matches: Optional[List[Tuple[str, int, float]]] = None) -> None:
+        """Add or replace a candidate.
+
+        ``vector`` is reused only if it was made by the current job
+        vectorizer (``vector_key``); otherwise it is recomputed from
+        ``match_text`` in a batch on the next query. ``matches`` is the
+        candidate's stored top-k, or None if it has to be computed.
+        """
+        candidate_id = str(candidate_id)
+        self.remove(candidate_id)
+        row = len(self._ids)
+        self._ids.append(candidate_id)
+        self._profiles.append(profile)
+        self._texts.append(match_text)
+        self._matches.append(matches)
+        self._row_by_id[candidate_id] = row
+        if row >= len(self._active):
+            # Grow geometrically so bulk loads stay linear
+            self._active = np.concatenate([self._active, np.zeros(max(16, len(self._active)), dtype=bool)])
+        self._active[row] = True
+        reusable = vector is not None and vector_key == self.job_index.vectorizer_key
+        self._pending.append((row, vector if reusable else None))
+
+    def remove(self, candidate_id: str) -> bool:
+        """Tombstone a candidate. Returns False if it was not indexed."""
+        row = self._row_by_id.pop(str(candidate_id), None)
+        if row is None:
+            return False
+        self._active[row] = False
+        self._profiles[row] = None
+        self._texts[row] = None
+        self._matches[row] = None
+        return True
+
+    def trim(self, max_size: int) -> List[str]:
+        """Remove the candidates added longest ago until at most ``max_size`` remain.
+
+        Replacing a candidate counts as adding it again. Returns the
+        removed ids.
+        """
+        # _row_by_id keeps insertion order, and add() re-inserts on replace
+        removed = list(itertools.islice(self._row_by_id, max(0, self.size - max_size)))
+        for candidate_id in removed:
+            self.remove(candidate_id)
+        return removed
+
+    def compact(self) -> int:
+        """Drop tombstoned rows and renumber the active ones. Returns the rows dropped.
+
+        Row positions held from before the call are invalid afterwards;
+        ``generation`` changes so holders can tell.
+        """
+        dropped = self.tombstones
+        if not dropped:
+            return 0
+        self._flush()
+        keep = self.active_rows
+        rows = keep.tolist()
+        self._ids = [self._ids[row] for row in rows]
+        self._profiles = [self._profiles[row] for row in rows]
+        self._texts = [self._texts[row] for row in rows]
+        self._matches = [self._matches[row] for row in rows]
+        self._row_by_id = {candidate_id: row for row, candidate_id in enumerate(self._ids)}
+        self._active = np.ones(len(rows), dtype=bool)
+        self.matrix = self.matrix[keep]
+        self.norms = self.norms[keep]
+        self.experience_years = self.experience_years[keep]
+        self.skill_matrix = self.skill_matrix[keep]
+        self._skill_columns = None
+        self.generation += 1
+        return dropped
+
+    def profile_at(self, row: int) -> Dict[str, Any]:
+        """Stored profile of the candidate at a row."""
+        return self._profiles[row]
+
+    def id_at(self, row: int) -> str:
+        """Candidate id at a row."""
+        return self._ids[row]
+
+    def text_at(self, row: int) -> str:
+        """Match text of the candidate at a row."""
+        return self._texts[row]
+
+    def row_of(self, candidate_id: str) -> Optional[int]:
+        """Row of an active candidate."""
+        return self._row_by_id.get(str(candidate_id))
+
+    def matches_at(self, row: int) -> Optional[List[Tuple[str, int, float]]]:
+        """Stored top-k job matches of the candidate at a row."""
+        return self._matches[row]
+
+    def set_matches(self, row: int, matches: List[Tuple[str, int, float]]) -> None:
+        """Replace the stored top-k job matches of an active candidate."""
+        if self._active[row]:
+            self._matches[row] = matches
+
+    def refresh(self) -> None:
+        """Stack pending candidates, re-vectorizing first if the job vocabulary changed."""
+        self._flush()
+
+    def score(self, job_vector, job_norm: float, job_skills: List[str]):
+        """Cosine similarity and skill overlap of every candidate against one job.
+
+        Returns the active candidate rows with a non-zero similarity or
+        overlap, their similarities and their overlap counts.
+        """
+        self._flush()
+        empty = np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0, dtype=np.int64)
+        if self.matrix.shape[0] == 0:
+            return empty
+
+        term_rows, similarities = np.zeros(0, dtype=np.int64), np.zeros(0)
+        if job_norm > 0 and job_vector.nnz:
+            # One sparse product: (candidates x terms) . (terms x 1)
+            product = self.matrix.dot(job_vector.T).tocoo()
+            term_rows = product.row.astype(np.int64)
+            denominators = self.norms[term_rows] * job_norm
+            similarities = np.divide(product.data, denominators, out=np.zeros(len(term_rows)),
+                                     where=denominators > 0)
+
+        skill_rows, overlaps = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        skill_ids = self.skills.lookup(job_skills)
+        if len(skill_ids) and self.skill_matrix.shape[0]:
+            postings = self._skill_column_index()[:, skill_ids]
+            skill_rows, overlaps = np.unique(postings.indices, return_counts=True)
+            skill_rows = skill_rows.astype(np.int64)
+
+        rows = np.union1d(term_rows, skill_rows).astype(np.int64)
+        rows = rows[self._active[rows]]
+        row_similarities = np.zeros(len(rows))
+        in_terms = np.isin(term_rows, rows)
+        row_similarities[np.searchsorted(rows, term_rows[in_terms])] = similarities[in_terms]
+        row_overlaps = np.zeros(len(rows), dtype=np.int64)
+        in_skills = np.isin(skill_rows, rows)
+        row_overlaps[np.searchsorted(rows, skill_rows[in_skills])] = overlaps[in_skills]
+        return rows, row_similarities, row_overlaps
+
+    def score_jobs(self, rows: np.ndarray, job_rows: Optional[np.ndarray] = None):
+        """Score candidate rows against job rows (default all) with JobIndex.pair_scores.
+
+        Returns parallel arrays of candidate rows, job rows, similarities
+        and skill overlaps for the pairs with a non-zero similarity or
+        overlap; tombstoned jobs and candidates are left out. Call
+        refresh() first.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        query_skills = self.skill_matrix[rows]
+        if query_skills.shape[1]:
+            query_skills = query_skills.dot(self._skill_projection())
+        else:
+            query_skills = sparse.csr_matrix((len(rows), self.job_index.skill_matrix.shape[1]))
+        positions, job_rows, similarities, overlaps = self.job_index.pair_scores(
+            self.matrix[rows], query_skills, job_rows
+        )
+        candidate_rows = rows[positions]
+        keep = self._active[candidate_rows]
+        return candidate_rows[keep], job_rows[keep], similarities[keep], overlaps[keep]
+
+    def filter_rows(self, rows: np.ndarray, location: Optional[str] = None,
+                    min_experience: Optional[float] = None,
+                    max_experience: Optional[float] = None) -> np.ndarray:
+        """Keep rows whose candidate matches the location and experience bounds.
+
+        Candidates with unknown experience are dropped when a bound is given.
+        """
+        keep = np.ones(len(rows), dtype=bool)
+        if min_experience is not None or max_experience is not None:
+            years = self.experience_years[rows]
+            known = ~np.isnan(years)
+            keep &= known
+            if min_experience is not None:
+                keep &= np.where(known, years, 0) >= min_experience
+            if max_experience is not None:
+                keep &= np.where(known, years, 0) <= max_experience
+        if location:
+            needle = location.lower()
+            keep &= np.array([
+                needle in (self._profiles[row].get('location') or '').lower() for row in rows.tolist()
+            ], dtype=bool)
+        return rows[keep]
+
+    def _flush(self) -> None:
+        """Bring the matrices up to date with pending rows and the job vocabulary."""
+        key = self.job_index.vectorizer_key
+        if key != self.vectorizer_key:
+            self._revectorize(key)
+            return
+        if not self._pending:
+            return
+
+        missing = [row for row, vector in self._pending if vector is None]
+        computed = dict(zip(missing, self._transform([self._texts[row] for row in missing])))
+        vectors = [computed[row] if vector is None else vector for row, vector in self._pending]
+        if self.on_revectorize and missing:
+            self.on_revectorize({self._ids[row]: computed[row] for row in missing
+                                 if self._active[row]}, key)
+        self._append_rows(self._pending[0][0], vectors)
+        self._pending = []
+
+    def _revectorize(self, key: str) -> None:
+        rows = list(range(len(self._ids)))
+        texts = [self._texts[row] or '' for row in rows]
+        vectors = self._transform(texts)
+        logger.info(f"Candidate index re-vectorized {self.size} candidates for a new job vocabulary")
+
+        self.vectorizer_key = key
+        self.matrix = sparse.csr_matrix((0, self._width()))
+        self.norms = np.zeros(0)
+        self.skills = SkillVocabulary()
+        self.skill_matrix = sparse.csr_matrix((0, 0))
+        self.experience_years = np.zeros(0)
+        self._pending = []
+        self._append_rows(0, vectors)
+        if self.on_revectorize:
+            self.on_revectorize({self._ids[row]: vectors[row] for row in rows if self._active[row]}, key)
+
+    def _append_rows(self, start: int, vectors: List[Tuple[np.ndarray, np.ndarray]]) -> None:
+        indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in vectors])
+        if vectors:
+            indices = np.concatenate([indices for indices, _ in vectors]).astype(np.int32)
+            data = np.concatenate([data for _, data in vectors]).astype(np.float64)
+        else:
+            indices, data = np.zeros(0, dtype=np.int32), np.zeros(0)
+        new_rows = sparse.csr_matrix((data, indices, indptr), shape=(len(vectors), self._width()))
+        profiles = [self._profiles[row] or {} for row in range(start, start + len(vectors))]
+
+        self.matrix = sparse.vstack([self.matrix, new_rows], format='csr') if self.matrix.shape[0] else new_rows
+        self.norms = np.concatenate([self.norms, np.sqrt(np.asarray(new_rows.multiply(new_rows).sum(axis=1)).ravel())])
+        self.experience_years = np.concatenate([self.experience_years, np.array([
+            np.nan if profile.get('experience_years') is None else profile['experience_years']
+            for profile in profiles
+        ], dtype=np.float64)])
+
+        indptr = [0]
+        indices: List[int] = []
+        for profile in profiles:
+            indices.extend(sorted({self.skills.add(skill) for skill in profile.get('skills', [])}))
+            indptr.append(len(indices))
+        skill_rows = sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                       shape=(len(profiles), len(self.skills)))
+        self.skill_matrix.resize((self.skill_matrix.shape[0], len(self.skills)))
+        self.skill_matrix = sparse.vstack([self.skill_matrix, skill_rows], format='csr')
+        self._skill_columns = None
+
+    def _transform(self, texts: List[str]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        if self.job_index.vectorizer is None or not texts:
+            return [(np.zeros(0, dtype=np.int32), np.zeros(0)) for _ in texts]
+        matrix = self.job_index.vectorizer.transform(texts).tocsr()
+        return [
+            (matrix.indices[start:end], matrix.data[start:end])
+            for start, end in zip(matrix.indptr[:-1], matrix.indptr[1:])
+        ]
+
+    def _width(self) -> int:
+        return len(self.job_index.vocabulary)
+
+    def _skill_projection(self):
+        # Binary (candidate skill id x job skill id) map between the two vocabularies
+        job_skills = self.job_index.skills.ids
+        n_candidate_skills, n_job_skills = self.skill_matrix.shape[1], self.job_index.skill_matrix.shape[1]
+        pairs = [(candidate_id, job_skills[name]) for name, candidate_id in self.skills.ids.items()
+                 if candidate_id < n_candidate_skills and job_skills.get(name, n_job_skills) < n_job_skills]
+        sources = np.array([source for source, _ in pairs], dtype=np.int64)
+        targets = np.array([target for _, target in pairs], dtype=np.int64)
+        return sparse.csr_matrix((np.ones(len(pairs)), (sources, targets)),
+                                 shape=(n_candidate_skills, n_job_skills))
+
+    def _skill_column_index(self):
+        if self._skill_columns is None:
+            self._skill_columns = self.skill_matrix.tocsc()
+        return self._skill_columns
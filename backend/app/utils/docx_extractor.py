@@ -0,0 +1,94 @@
+import zipfile
+import logging
+from xml.etree import ElementTree
+from typing import List, Union, BinaryIO, Iterator
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_PART = 'word/document.xml'
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_P, _T, _TR, _TC = f'{_W}p', f'{_W}t', f'{_W}tr', f'{_W}tc'
+# Run content python-docx renders as characters
+_RUN_CHARACTERS = {f'{_W}tab': '\t', f'{_W}ptab': '\t', f'{_W}cr': '\n', f'{_W}noBreakHyphen': '-'}
+_BR = f'{_W}br'
+# Drawings carry their text box twice: as DrawingML and as a VML fallback
+_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+
+def iter_docx_lines(document: Union[str, BinaryIO]) -> Iterator[str]:
+    """Yield the text of a DOCX body in document order, one line per paragraph or table row.
+
+    ``word/document.xml`` is streamed out of the zip with an incremental
+    parser and each element is discarded once read, so memory stays flat
+    however large the document. A table row is yielded as its cells'
+    text joined by spaces, where it appears in the body. Raises
+    zipfile.BadZipFile, KeyError or ElementTree.ParseError for input
+    that is not a readable DOCX.
+    """
+    with zipfile.ZipFile(document) as archive, archive.open(DOCUMENT_PART) as part:
+        # Runs of the paragraphs being read; text boxes nest paragraphs in paragraphs
+        paragraphs: List[List[str]] = []
+        # Cell paragraphs and row cells of the tables being read, innermost last
+        cells: List[List[str]] = []
+        rows: List[List[str]] = []
+        depth = fallback_depth = 0
+        body = None
+
+        for event, element in ElementTree.iterparse(part, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                depth += 1
+                if depth == 2:
+                    body = element
+                elif tag == _FALLBACK:
+                    fallback_depth += 1
+                elif fallback_depth:
+                    pass
+                elif tag == _P:
+                    paragraphs.append([])
+                elif tag == _TR:
+                    rows.append([])
+                elif tag == _TC:
+                    cells.append([])
+                continue
+
+            depth -= 1
+            if tag == _FALLBACK:
+                fallback_depth -= 1
+            elif fallback_depth:
+                pass
+            elif tag == _T:
+                if paragraphs and element.text:
+                    paragraphs[-1].append(element.text)
+            elif tag in _RUN_CHARACTERS:
+                if paragraphs:
+                    paragraphs[-1].append(_RUN_CHARACTERS[tag])
+            elif tag == _BR:
+                # Page and column breaks render as nothing
+                if paragraphs and element.get(f'{_W}type', 'textWrapping') == 'textWrapping':
+                    paragraphs[-1].append('\n')
+            elif tag == _P:
+                line = ''.join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(line)
+                else:
+                    yield line
+            elif tag == _TC:
+                rows[-1].append('\n'.join(cells.pop()))
+            elif tag == _TR:
+                line = ' '.join(rows.pop())
+                if cells:
+                    cells[-1].append(line)
+                else:
+                    yield line
+                # Rows are the unit of a table; drop each once read
+                element.clear()
+            if depth == 2:
+                # A top-level block is done with; keep the parsed tree from growing
+                body.clear()
+
+
+def extract_docx_text(document: Union[str, BinaryIO]) -> str:
+    """Text of a DOCX body, paragraphs and table rows in document order."""
+    return '\n'.join(iter_docx_lines(document)).strip()
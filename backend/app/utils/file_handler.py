@@ -1,84 +1,126 @@
+import io
 import os
 import logging
-from typing import Optional
-import PyPDF2
-import pdfplumber
-from docx import Document
+import tempfile
+from contextlib import contextmanager
+from typing import Optional, Union, BinaryIO, Iterator
+from .pdf_extractor import PdfExtractor
+from .docx_extractor import extract_docx_text
 
 logger = logging.getLogger(__name__)
 
+Source = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
 class FileHandler:
-    """Handle file operations and text extraction from various formats."""
+    """Handle file operations and text extraction from various formats.
+    
+    Sources may be a path, raw bytes (bytes, bytearray, memoryview) or a
+    binary file-like object such as a werkzeug upload stream. In-memory
+    sources are parsed directly and only spilled to a temporary file when
+    larger than ``spill_threshold`` bytes.
+    """
+    
+    def __init__(self, spill_threshold: int = 8 * 1024 * 1024,
+                 pdf_extractor: Optional[PdfExtractor] = None):
+        self.spill_threshold = spill_threshold
+        self.pdf_extractor = pdf_extractor or PdfExtractor()
     
-    def extract_text(self, file_path: str, file_extension: str) -> Optional[str]:
+    def warm_up(self) -> None:
+        """Import the PDF and DOCX backends, which are otherwise loaded on first use."""
+        import docx  # noqa: F401
+        self.pdf_extractor.warm_up()
+    
+    def extract_text(self, source: Source, file_extension: str) -> Optional[str]:
         """Extract text from uploaded file based on its extension."""
         try:
-            if file_extension == 'pdf':
-                return self._extract_from_pdf(file_path)
-            elif file_extension in ['doc', 'docx']:
-                return self._extract_from_docx(file_path)
-            else:
-                logger.error(f"Unsupported file extension: {file_extension}")
-                return None
+            with self._open_source(source) as document:
+                if file_extension == 'pdf':
+                    return self._extract_from_pdf(document)
+                elif file_extension in ['doc', 'docx']:
+                    return self._extract_from_docx(document)
+                else:
+                    logger.error(f"Unsupported file extension: {file_extension}")
+                    return None
                 
         except Exception as e:
-            logger.error(f"Error extracting text from {file_path}: {str(e)}")
+            logger.error(f"Error extracting text from {self._describe(source)}: {str(e)}")
             return None
     
-    def _extract_from_pdf(self, file_path: str) -> Optional[str]:
-        """Extract text from PDF file using pdfplumber (more reliable than PyPDF2)."""
+    @contextmanager
+    def _open_source(self, source: Source) -> Iterator[Union[str, BinaryIO]]:
+        """Yield a path or a seekable binary stream for the parsing libraries."""
+        if isinstance(source, (str, os.PathLike)):
+            yield os.fspath(source)
+            return
+        
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = source
+        elif source.seekable():
+            yield source
+            return
+        else:
+            data = source.read()
+        
+        if len(data) <= self.spill_threshold:
+            yield io.BytesIO(data)
+            return
+        
+        # Large documents are parsed from disk to bound memory use
+        with tempfile.NamedTemporaryFile(suffix='.upload') as spill:
+            spill.write(data)
+            spill.flush()
+            yield spill.name
+    
+    @staticmethod
+    def _rewind(document: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+        """Reset a stream before handing it to another parser."""
+        if not isinstance(document, str):
+            document.seek(0)
+        return document
+    
+    @staticmethod
+    def _describe(source: Source) -> str:
+        if isinstance(source, (str, os.PathLike)):
+            return os.fspath(source)
+        return f"in-memory {type(source).__name__}"
+    
+    def _extract_from_pdf(self, document: Union[str, BinaryIO]) -> Optional[str]:
+        """Extract text from PDF file with the budgeted extraction engine."""
         try:
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\\n"
-            
-            if not text.strip():
-                # Fallback to PyPDF2 if pdfplumber fails
-                logger.info("pdfplumber extraction failed, trying PyPDF2...")
-                return self._extract_from_pdf_pypdf2(file_path)
-                
-            return text.strip()
+            return self.pdf_extractor.extract(document)
             
         except Exception as e:
-            logger.error(f"Error extracting PDF with pdfplumber: {str(e)}")
-            # Fallback to PyPDF2
-            return self._extract_from_pdf_pypdf2(file_path)
+            logger.error(f"Error extracting PDF: {str(e)}")
+            return None
     
-    def _extract_from_pdf_pypdf2(self, file_path: str) -> Optional[str]:
-        """Fallback PDF extraction using PyPDF2."""
+    def _extract_from_docx(self, document: Union[str, BinaryIO]) -> Optional[str]:
+        """Extract text from DOCX file.
+        
+        The document XML is streamed straight out of the zip (see
+        docx_extractor), keeping paragraphs and tables in reading order;
+        python-docx is only loaded for documents that path cannot read.
+        """
         try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\\n"
-            return text.strip()
-            
+            return extract_docx_text(self._rewind(document))
         except Exception as e:
-            logger.error(f"Error extracting PDF with PyPDF2: {str(e)}")
-            return None
+            logger.warning(f"Streaming DOCX extraction failed, falling back to python-docx: {str(e)}")
+        return self._extract_from_docx_model(document)
     
-    def _extract_from_docx(self, file_path: str) -> Optional[str]:
-        """Extract text from DOCX file."""
+    def _extract_from_docx_model(self, document: Union[str, BinaryIO]) -> Optional[str]:
+        """Extract text from DOCX file through the python-docx object model."""
+        from docx import Document
         try:
-            doc = Document(file_path)
-            text = ""
+            doc = Document(self._rewind(document))
             
             # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\\n"
+            parts = [paragraph.text for paragraph in doc.paragraphs]
             
             # Extract text from tables
             for table in doc.tables:
                 for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\\n"
+                    parts.append(" ".join(cell.text for cell in row.cells))
             
-            return text.strip()
+            return "\n".join(parts).strip()
             
         except Exception as e:
             logger.error(f"Error extracting DOCX: {str(e)}")
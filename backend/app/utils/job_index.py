@@ -0,0 +1,700 @@
+import re
+import base64
+import hashlib
+import logging
+from typing import List, Dict, Any, Callable, Optional, Iterable, Set, Tuple
+from scipy import sparse
+import numpy as np
+from ..metrics import time_stage
+
+logger = logging.getLogger(__name__)
+
+LOCATION_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def select_top_k(rows: np.ndarray, percentages: np.ndarray, k: int,
+                 n_rows: int) -> np.ndarray:
+    """Return the k best rows by percentage, ties broken by row order.
+
+    Uses an O(n) partial selection and only sorts the k survivors. Ties are
+    resolved exactly like a stable descending sort over row order.
+    """
+    if k <= 0 or len(rows) == 0:
+        return rows[:0]
+
+    # Percentages are small integers, so (percentage, -row) packs into one
+    # exact int64 key.
+    keys = percentages.astype(np.int64) * n_rows + (n_rows - 1 - rows.astype(np.int64))
+    if len(keys) > k:
+        selected = np.argpartition(-keys, k - 1)[:k]
+    else:
+        selected = np.arange(len(keys))
+    order = selected[np.argsort(-keys[selected])]
+    return rows[order]
+
+
+def combine_scores(similarities: np.ndarray, overlaps: np.ndarray, totals) -> np.ndarray:
+    """Match percentages from cosine similarities and skill overlaps.
+
+    Up to 100 points from the similarity plus a bonus of up to 20 for the
+    share of the job's skills covered; ``totals`` is the job skill count
+    (per row or scalar).
+    """
+    match_percentages = np.minimum(100, (similarities * 100 * 1.5).astype(np.int64))
+
+    totals = np.broadcast_to(totals, overlaps.shape)
+    overlap_percentages = np.divide(overlaps, totals, out=np.zeros(len(overlaps)), where=totals > 0)
+    skill_bonus = np.minimum(20, (overlap_percentages * 20).astype(np.int64))
+    return np.minimum(100, match_percentages + skill_bonus)
+
+
+def latest_by_id(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop all but the last record of each job id, keeping the order of those last records."""
+    latest: Dict[str, Dict[str, Any]] = {}
+    for job in jobs:
+        job_id = str(job['id'])
+        latest.pop(job_id, None)
+        latest[job_id] = job
+    return list(latest.values())
+
+
+def query_norm(vector) -> float:
+    """L2 norm of a sparse query row."""
+    return float(np.sqrt(vector.multiply(vector).sum()))
+
+
+def posting_similarities(columns, row_norms: np.ndarray, active: np.ndarray,
+                         term_indices: np.ndarray, term_weights: np.ndarray, norm: float):
+    """Cosine similarity of a query against the rows sharing one of its terms.
+
+    ``columns`` is the job matrix in column-major (CSC) form, so only the
+    posting lists of the query's terms are read. Returns the active rows
+    with a shared term and their similarities, in row order.
+    """
+    empty = np.zeros(0, dtype=np.int64), np.zeros(0)
+    if norm == 0.0 or len(term_indices) == 0:
+        return empty
+
+    postings = columns[:, term_indices]
+    if postings.nnz == 0:
+        return empty
+    weights = np.repeat(term_weights, np.diff(postings.indptr))
+    rows, inverse = np.unique(postings.indices, return_inverse=True)
+    dots = np.bincount(inverse, weights=postings.data * weights)
+
+    keep = active[rows]
+    rows, dots = rows[keep], dots[keep]
+    denominators = row_norms[rows] * norm
+    scores = np.divide(dots, denominators, out=np.zeros_like(dots),
+                       where=denominators > 0)
+    return rows.astype(np.int64), scores
+
+
+def posting_overlaps(skill_columns, active: np.ndarray, skill_ids: np.ndarray):
+    """Shared skill counts of a skill-id set against every job, from the skills' posting lists.
+
+    ``skill_columns`` is the binary job skill matrix in CSC form. Returns
+    the active rows with a non-zero overlap and their overlap counts.
+    """
+    empty = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if len(skill_ids) == 0:
+        return empty
+
+    postings = skill_columns[:, skill_ids]
+    if postings.nnz == 0:
+        return empty
+    rows, counts = np.unique(postings.indices, return_counts=True)
+    keep = active[rows]
+    return rows[keep].astype(np.int64), counts[keep].astype(np.int64)
+
+
+class SkillVocabulary:
+    """Maps normalized skill names to stable integer ids."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def normalize(skill: str) -> str:
+        """Normalize a skill name the way overlap scoring compares them."""
+        return skill.lower()
+
+    def add(self, skill: str) -> int:
+        """Return the id of a skill, assigning a new one if unseen."""
+        key = self.normalize(skill)
+        skill_id = self.ids.get(key)
+        if skill_id is None:
+            skill_id = self.ids[key] = len(self.ids)
+        return skill_id
+
+    def lookup(self, skills: Iterable[str]) -> np.ndarray:
+        """Sorted, de-duplicated ids of known skills; unknown ones are skipped."""
+        ids = {self.ids.get(self.normalize(skill)) for skill in skills}
+        ids.discard(None)
+        return np.array(sorted(ids), dtype=np.int64)
+
+
+class JobIndex:
+    """TF-IDF index over the job corpus, fitted once and queried per resume.
+
+    Rows of the job matrix are append-only: updates append a fresh row and
+    tombstone the old one, removals only tombstone. Tombstoned rows are
+    compacted away on the next rebuild.
+    """
+
+    def __init__(self, text_builder: Callable[[Dict[str, Any]], str],
+                 rebuild_threshold: float = 0.25,
+                 max_oov_drift: float = 0.2,
+                 **vectorizer_options):
+        self.text_builder = text_builder
+        self.rebuild_threshold = rebuild_threshold
+        self.max_oov_drift = max_oov_drift
+        self.vectorizer_options = {
+            'max_features': 1000,
+            'stop_words': 'english',
+            'ngram_range': (1, 2),
+        }
+        self.vectorizer_options.update(vectorizer_options)
+
+        self.vectorizer = None
+        self.matrix = None
+        self.row_norms = np.zeros(0)
+        self.skills = SkillVocabulary()
+        self.skill_matrix = sparse.csr_matrix((0, 0))
+        self.skill_counts = np.zeros(0, dtype=np.int64)
+        self.version = 0
+        self.generation = 0
+        self._vectorizer_key: Optional[str] = None
+
+        self._rows: List[Optional[Dict[str, Any]]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._location_postings: Dict[str, Set[int]] = {}
+        self._level_postings: Dict[str, Set[int]] = {}
+        self._remote_rows: Set[int] = set()
+        self._columns = None
+        self._skill_columns = None
+        self._active = np.zeros(0, dtype=bool)
+        self._active_jobs: Optional[List[Dict[str, Any]]] = None
+        self._fitted_size = 0
+        self._changes_since_fit = 0
+        self._oov_terms = 0
+        self._seen_terms = 0
+        self._baseline_oov = 0.0
+
+    def fit(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        """Fit the vocabulary and job matrix from scratch."""
+        # scikit-learn is imported by the first fit, not at module import
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        jobs = latest_by_id(jobs)
+        self.vectorizer = TfidfVectorizer(**self.vectorizer_options)
+        texts = [self.text_builder(job) for job in jobs]
+        if texts:
+            with time_stage('index_fit'):
+                matrix = self.vectorizer.fit_transform(texts).tocsr()
+        else:
+            self.vectorizer = None
+            matrix = sparse.csr_matrix((0, 0))
+
+        self.skills = SkillVocabulary()
+        skill_matrix = self._skill_rows(jobs)
+        self._install(jobs, matrix, self._compute_row_norms(matrix), skill_matrix,
+                      self._sample_oov_ratio(texts))
+        logger.info(f"Job index fitted: {len(jobs)} jobs, "
+                    f"{len(self.vocabulary)} terms")
+
+    def restore(self, jobs: List[Dict[str, Any]], vectorizer, matrix, row_norms: np.ndarray,
+                skills: SkillVocabulary, skill_matrix, baseline_oov: float = 0.0) -> None:
+        """Install previously fitted state (e.g. from a snapshot) without refitting.
+
+        ``jobs`` must be in the same row order as ``matrix``.
+        """
+        self.vectorizer = vectorizer
+        self.skills = skills
+        self._install(list(jobs), matrix, row_norms, skill_matrix, baseline_oov)
+        logger.info(f"Job index restored: {len(jobs)} jobs, "
+                    f"{len(self.vocabulary)} terms")
+
+    @property
+    def baseline_oov(self) -> float:
+        """Out-of-vocabulary term ratio measured on the fitted corpus."""
+        return self._baseline_oov
+
+    def _install(self, jobs: List[Dict[str, Any]], matrix, row_norms: np.ndarray,
+                 skill_matrix, baseline_oov: float) -> None:
+        self.matrix = matrix
+        self.row_norms = row_norms
+        self.skill_matrix = skill_matrix
+        self.skill_counts = np.diff(skill_matrix.indptr)
+        self._columns = None
+        self._skill_columns = None
+
+        self._rows = list(jobs)
+        self._row_by_id = {str(job['id']): row for row, job in enumerate(jobs)}
+        self._location_postings = {}
+        self._level_postings = {}
+        self._remote_rows = set()
+        for row, job in enumerate(jobs):
+            self._post_attributes(row, job)
+        self._active = np.ones(len(jobs), dtype=bool)
+
+        self._fitted_size = len(jobs)
+        self._changes_since_fit = 0
+        self._oov_terms = 0
+        self._seen_terms = 0
+        self._baseline_oov = baseline_oov
+        self._vectorizer_key = None
+        self.generation += 1
+        self._touch()
+
+    def rebuild(self) -> None:
+        """Refit over the active jobs, dropping tombstoned rows."""
+        self.fit(self.jobs)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Whether incremental changes have drifted too far from the fit."""
+        if self.vectorizer is None:
+            return self.size > 0
+        if self._changes_since_fit / max(1, self._fitted_size) > self.rebuild_threshold:
+            return True
+        if self._seen_terms:
+            oov_ratio = self._oov_terms / self._seen_terms
+            if oov_ratio - self._baseline_oov > self.max_oov_drift:
+                return True
+        return False
+
+    def add_jobs(self, jobs: Iterable[Dict[str, Any]], rebuild: bool = True) -> None:
+        """Add or replace jobs without refitting the vocabulary.
+
+        With ``rebuild=False`` drift is only recorded, for a bulk load to
+        resolve with one rebuild_if_needed() at the end. When an id appears
+        more than once, its last record wins.
+        """
+        jobs = latest_by_id(jobs)
+        if not jobs:
+            return
+
+        for job in jobs:
+            self._tombstone(str(job['id']))
+
+        if self.vectorizer is None:
+            self.fit(self.jobs + jobs)
+            return
+
+        texts = [self.text_builder(job) for job in jobs]
+        self._track_drift(texts)
+        new_rows = self.vectorizer.transform(texts).tocsr()
+
+        start = len(self._rows)
+        self.matrix = sparse.vstack([self.matrix, new_rows], format='csr')
+        self._columns = None
+
+        new_skill_rows = self._skill_rows(jobs)
+        self.skill_matrix.resize((self.skill_matrix.shape[0], len(self.skills)))
+        self.skill_matrix = sparse.vstack([self.skill_matrix, new_skill_rows], format='csr')
+        self.skill_counts = np.concatenate([self.skill_counts, np.diff(new_skill_rows.indptr)])
+        self._skill_columns = None
+        self.row_norms = np.concatenate([self.row_norms, self._compute_row_norms(new_rows)])
+        self._active = np.concatenate([self._active, np.ones(len(jobs), dtype=bool)])
+        for offset, job in enumerate(jobs):
+            self._rows.append(job)
+            self._row_by_id[str(job['id'])] = start + offset
+            self._post_attributes(start + offset, job)
+
+        self._changes_since_fit += len(jobs)
+        self._touch()
+        if rebuild:
+            self.rebuild_if_needed()
+
+    def add_job(self, job: Dict[str, Any]) -> None:
+        """Add a single job to the index."""
+        self.add_jobs([job])
+
+    def update_job(self, job: Dict[str, Any]) -> None:
+        """Replace an existing job (or add it if unknown)."""
+        self.add_jobs([job])
+
+    def remove_job(self, job_id: str) -> bool:
+        """Remove a job from the index. Returns False if it was not indexed."""
+        if not self._tombstone(str(job_id)):
+            return False
+        self._changes_since_fit += 1
+        self._touch()
+        self.rebuild_if_needed()
+        return True
+
+    @property
+    def vocabulary(self) -> Dict[str, int]:
+        """Fitted term -> column mapping."""
+        if self.vectorizer is None:
+            return {}
+        return self.vectorizer.vocabulary_
+
+    @property
+    def vectorizer_key(self) -> str:
+        """Digest of the fitted vocabulary and idf weights.
+
+        Stable across processes and snapshot restores, so vectors stored
+        elsewhere can tell whether they were made by this vectorizer.
+        """
+        if self._vectorizer_key is None:
+            digest = hashlib.sha1()
+            if self.vectorizer is not None:
+                for term, column in sorted(self.vocabulary.items()):
+                    digest.update(f'{term}\0{column}\0'.encode())
+                digest.update(np.ascontiguousarray(self.vectorizer.idf_, dtype=np.float64).tobytes())
+            self._vectorizer_key = digest.hexdigest()
+        return self._vectorizer_key
+
+    @property
+    def size(self) -> int:
+        """Number of active jobs."""
+        return int(self._active.sum())
+
+    @property
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Active jobs in row order."""
+        if self._active_jobs is None:
+            self._active_jobs = [self._rows[row] for row in np.flatnonzero(self._active)]
+        return self._active_jobs
+
+    @property
+    def active_rows(self) -> np.ndarray:
+        """Row positions of the active jobs."""
+        return np.flatnonzero(self._active)
+
+    @property
+    def active_mask(self) -> np.ndarray:
+        """Boolean mask over matrix rows, False for tombstoned rows."""
+        return self._active
+
+    def job_at(self, row: int) -> Dict[str, Any]:
+        """Return the job stored at a matrix row."""
+        return self._rows[row]
+
+    def row_of(self, job_id: str) -> Optional[int]:
+        """Return the matrix row of an active job."""
+        return self._row_by_id.get(str(job_id))
+
+    def transform(self, text: str):
+        """Vectorize a query text with the fitted vocabulary."""
+        if self.vectorizer is None:
+            return sparse.csr_matrix((1, 0))
+        return self.vectorizer.transform([text]).tocsr()
+
+    def transform_many(self, texts: List[str]):
+        """Vectorize many query texts in one pass, one row per text."""
+        if self.vectorizer is None:
+            return sparse.csr_matrix((len(texts), 0))
+        return self.vectorizer.transform(texts).tocsr()
+
+    def skill_query_matrix(self, skill_lists: Iterable[Iterable[str]]):
+        """Binary (query x job skill) rows for overlap scoring; unknown skills are skipped."""
+        indptr = [0]
+        indices: List[int] = []
+        for skills in skill_lists:
+            indices.extend(self.skills.lookup(skills).tolist())
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                 shape=(len(indptr) - 1, self.skill_matrix.shape[1]))
+
+    def pair_scores(self, queries, query_skills, job_rows: Optional[np.ndarray] = None):
+        """Cosine similarity and skill overlap of many queries against many jobs.
+
+        ``queries`` is a (query x term) matrix in this index's TF-IDF space
+        and ``query_skills`` a binary (query x job skill) matrix, e.g. from
+        skill_query_matrix. Each signal is one sparse product against the
+        job rows (``job_rows``, default all). Returns parallel arrays of
+        query positions, job rows, similarities and overlap counts for the
+        pairs with a non-zero similarity or overlap, ordered by query then
+        job row. Tombstoned jobs are left out.
+        """
+        empty_rows = np.zeros(0, dtype=np.int64)
+        empty = empty_rows, empty_rows, np.zeros(0), empty_rows
+        if queries.shape[0] == 0 or self.matrix is None or self.matrix.shape[0] == 0:
+            return empty
+
+        job_matrix, job_norms, job_skills = self.matrix, self.row_norms, self.skill_matrix
+        if job_rows is not None:
+            job_matrix, job_norms, job_skills = job_matrix[job_rows], job_norms[job_rows], job_skills[job_rows]
+        n_jobs = job_matrix.shape[0]
+
+        # (queries x terms) . (terms x jobs)
+        dots = queries.dot(job_matrix.T).tocsr()
+        union = dots
+        products = None
+        if query_skills.nnz and job_skills.shape[1]:
+            # (queries x skills) . (skills x jobs)
+            products = query_skills.dot(job_skills.T).tocsr()
+            # Both are positive, so the sum's pattern is the union of pairs
+            union = dots + products
+
+        keys = self._pair_keys(union, n_jobs)
+        query_norms = self._compute_row_norms(queries)
+        term_keys = self._pair_keys(dots, n_jobs)
+        dots = dots.tocoo()
+        denominators = query_norms[dots.row] * job_norms[dots.col]
+        pair_similarities = np.zeros(len(keys))
+        pair_similarities[np.searchsorted(keys, term_keys)] = np.divide(
+            dots.data, denominators, out=np.zeros(len(dots.data)), where=denominators > 0
+        )
+        pair_overlaps = np.zeros(len(keys), dtype=np.int64)
+        if products is not None:
+            skill_keys = self._pair_keys(products, n_jobs)
+            pair_overlaps[np.searchsorted(keys, skill_keys)] = np.rint(products.tocoo().data).astype(np.int64)
+
+        positions = keys // n_jobs
+        matched_jobs = keys % n_jobs
+        if job_rows is not None:
+            matched_jobs = np.asarray(job_rows, dtype=np.int64)[matched_jobs]
+        keep = self._active[matched_jobs]
+        return positions[keep], matched_jobs[keep], pair_similarities[keep], pair_overlaps[keep]
+
+    def similarities(self, vector) -> np.ndarray:
+        """Cosine similarity of a query vector against every matrix row.
+
+        Tombstoned rows score 0.
+        """
+        if self.matrix is None or self.matrix.shape[0] == 0:
+            return np.zeros(0)
+
+        norm = query_norm(vector)
+        if norm == 0.0:
+            return np.zeros(self.matrix.shape[0])
+
+        dots = np.asarray(self.matrix.dot(vector.T).todense()).ravel()
+        denominators = self.row_norms * norm
+        scores = np.divide(dots, denominators, out=np.zeros_like(dots),
+                           where=denominators > 0)
+        scores[~self._active] = 0.0
+        return scores
+
+    def candidate_similarities(self, vector):
+        """Cosine similarity restricted to jobs sharing a term with the query.
+
+        Walks only the posting lists (matrix columns) of the query's terms,
+        so cost scales with the postings touched rather than the corpus.
+        Returns the candidate rows and their similarities.
+        """
+        if self.matrix is None or self.matrix.shape[0] == 0 or vector.nnz == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        return posting_similarities(self._column_index(), self.row_norms, self._active,
+                                    vector.indices, vector.data, query_norm(vector))
+
+    def skill_ids(self, skills: Iterable[str]) -> np.ndarray:
+        """Map skill names to ids in the job skill vocabulary."""
+        return self.skills.lookup(skills)
+
+    def skill_overlap(self, skill_ids: np.ndarray):
+        """Count shared skills between a skill-id set and every job.
+
+        Equivalent to the sparse product ``skill_matrix @ query`` for a
+        binary query, but only the posting lists of the given skills are
+        read. Returns the active rows with a non-zero overlap and their
+        overlap counts.
+        """
+        if len(skill_ids) == 0 or self.skill_matrix.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return posting_overlaps(self._skill_column_index(), self._active, skill_ids)
+
+    def search(self, location: Optional[str] = None,
+               experience_level: Optional[str] = None,
+               skills: Optional[Iterable[str]] = None,
+               restrict_to: Optional[Set[int]] = None) -> np.ndarray:
+        """Rows matching all given filters, in row order.
+
+        ``restrict_to`` optionally limits the result to a precomputed row set
+        (e.g. full-text search hits).
+
+        Each filter is resolved to a posting set and the sets are
+        intersected smallest first, so the cost follows the most selective
+        filter rather than the corpus size.
+        """
+        candidate_sets: List[Set[int]] = []
+        if restrict_to is not None:
+            candidate_sets.append(set(restrict_to))
+        location_query = location.lower() if location else None
+        location_verified = True
+
+        if location_query:
+            tokens = LOCATION_TOKEN_PATTERN.findall(location_query)
+            if tokens and all(token in self._location_postings for token in tokens):
+                token_sets = sorted((self._location_postings[t] for t in tokens), key=len)
+                location_rows = set.intersection(*token_sets)
+                if location_query == 'remote':
+                    location_rows = self._verify_locations(location_rows, location_query) | self._remote_rows
+                else:
+                    # Token postings over-approximate a substring match
+                    location_verified = False
+                candidate_sets.append(location_rows)
+            elif location_query == 'remote':
+                candidate_sets.append(self._scan_locations(location_query) | self._remote_rows)
+            else:
+                # Partial tokens have no postings; check the other filters' rows
+                location_verified = False
+
+        if experience_level:
+            candidate_sets.append(self._level_postings.get(experience_level.lower(), set()))
+
+        if skills:
+            skill_ids = self.skill_ids(skills)
+            postings = self._skill_column_index()[:, skill_ids] if len(skill_ids) else None
+            candidate_sets.append(set(postings.indices.tolist()) if postings is not None else set())
+
+        if not candidate_sets:
+            if location_verified:
+                return self.active_rows
+            candidate_sets.append(set(self.active_rows.tolist()))
+
+        candidate_sets.sort(key=len)
+        rows = set(candidate_sets[0])
+        for postings in candidate_sets[1:]:
+            if not rows:
+                break
+            rows &= postings
+
+        if not location_verified:
+            rows = self._verify_locations(rows, location_query)
+
+        rows = np.array(sorted(rows), dtype=np.int64)
+        return rows[self._active[rows]] if len(rows) else rows
+
+    def page(self, rows: np.ndarray, limit: int,
+             cursor: Optional[str] = None) -> Tuple[np.ndarray, Optional[str]]:
+        """Slice sorted rows after a cursor. Returns the page and the next cursor."""
+        start = 0
+        if cursor:
+            start = np.searchsorted(rows, self._decode_cursor(cursor), side='right')
+        page_rows = rows[start:start + limit]
+        next_cursor = None
+        if start + limit < len(rows) and len(page_rows):
+            next_cursor = self._encode_cursor(int(page_rows[-1]))
+        return page_rows, next_cursor
+
+    def _encode_cursor(self, row: int) -> str:
+        # Rows are only stable within one fit generation.
+        raw = f"{self.generation}:{row}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def _decode_cursor(self, cursor: str) -> int:
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            generation, row = base64.urlsafe_b64decode(padded).decode().split(':')
+            generation, row = int(generation), int(row)
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError('Invalid cursor')
+        if generation != self.generation:
+            raise ValueError('Cursor expired, the job index was rebuilt')
+        return row
+
+    def _scan_locations(self, location_query: str) -> Set[int]:
+        return {
+            row for row in self.active_rows.tolist()
+            if location_query in self._rows[row].get('location', '').lower()
+        }
+
+    def _verify_locations(self, rows: Set[int], location_query: str) -> Set[int]:
+        return {
+            row for row in rows
+            if self._rows[row] is not None and
+            location_query in self._rows[row].get('location', '').lower()
+        }
+
+    def _post_attributes(self, row: int, job: Dict[str, Any]) -> None:
+        for token in set(LOCATION_TOKEN_PATTERN.findall(job.get('location', '').lower())):
+            self._location_postings.setdefault(token, set()).add(row)
+        level = job.get('experience_level', '').lower()
+        self._level_postings.setdefault(level, set()).add(row)
+        if job.get('remote_friendly', False):
+            self._remote_rows.add(row)
+
+    def _unpost_attributes(self, row: int, job: Dict[str, Any]) -> None:
+        for token in set(LOCATION_TOKEN_PATTERN.findall(job.get('location', '').lower())):
+            self._location_postings.get(token, set()).discard(row)
+        self._level_postings.get(job.get('experience_level', '').lower(), set()).discard(row)
+        self._remote_rows.discard(row)
+
+    def _column_index(self):
+        # Column-major copy of the job matrix: each column is the posting
+        # list of one term. Rebuilt lazily after the matrix changes.
+        if self._columns is None:
+            self._columns = self.matrix.tocsc()
+        return self._columns
+
+    def _skill_column_index(self):
+        if self._skill_columns is None:
+            self._skill_columns = self.skill_matrix.tocsc()
+        return self._skill_columns
+
+    def _skill_rows(self, jobs: List[Dict[str, Any]]):
+        # Binary job x skill rows; assigns ids to unseen skills.
+        indptr = [0]
+        indices: List[int] = []
+        for job in jobs:
+            ids = {self.skills.add(skill) for skill in job.get('skills', [])}
+            indices.extend(sorted(ids))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return sparse.csr_matrix((data, indices, indptr),
+                                 shape=(len(jobs), len(self.skills)))
+
+    @staticmethod
+    def _pair_keys(matrix, n_columns: int) -> np.ndarray:
+        # Sorts the matrix's indices in place, so its COO order matches the keys
+        matrix.sort_indices()
+        coo = matrix.tocoo()
+        return coo.row.astype(np.int64) * n_columns + coo.col
+
+    @staticmethod
+    def _compute_row_norms(matrix) -> np.ndarray:
+        if matrix is None or matrix.shape[0] == 0:
+            return np.zeros(0)
+        return np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+
+    def _tombstone(self, job_id: str) -> bool:
+        row = self._row_by_id.pop(job_id, None)
+        if row is None:
+            return False
+        self._unpost_attributes(row, self._rows[row])
+        self._active[row] = False
+        self._rows[row] = None
+        return True
+
+    def _count_oov(self, texts: List[str]):
+        analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        oov = seen = 0
+        for text in texts:
+            terms = analyzer(text)
+            seen += len(terms)
+            oov += sum(1 for term in terms if term not in vocabulary)
+        return oov, seen
+
+    def _sample_oov_ratio(self, texts: List[str], sample_size: int = 200) -> float:
+        # Terms pruned by max_features are out of vocabulary even for the
+        # fitted corpus, so drift is measured relative to this baseline.
+        if self.vectorizer is None or not texts:
+            return 0.0
+        step = max(1, len(texts) // sample_size)
+        oov, seen = self._count_oov(texts[::step])
+        return oov / seen if seen else 0.0
+
+    def _track_drift(self, texts: List[str]) -> None:
+        oov, seen = self._count_oov(texts)
+        self._oov_terms += oov
+        self._seen_terms += seen
+
+    def rebuild_if_needed(self) -> bool:
+        """Rebuild if drift exceeded the thresholds. Returns whether it did."""
+        if not self.needs_rebuild:
+            return False
+        logger.info("Job index drift exceeded threshold, rebuilding")
+        self.rebuild()
+        return True
+
+    def _touch(self) -> None:
+        self.version += 1
+        self._active_jobs = None
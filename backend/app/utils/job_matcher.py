@@ -1,22 +1,238 @@
+import time
+import uuid
 import logging
-from typing import List, Dict, Any
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Set, Tuple
 import numpy as np
 from ..models.resume_data import ResumeData
+from .job_index import JobIndex, select_top_k, combine_scores, query_norm, latest_by_id
+from .candidate_index import CandidateIndex, estimate_experience_years
+from .semantic_index import SemanticIndex
+from .sharded_index import ShardedIndex, ShardError
+from ..storage.index_snapshot import load_snapshot, save_snapshot
+from ..metrics import time_stage
 
 logger = logging.getLogger(__name__)
 
+TFIDF = 'tfidf'
+SEMANTIC = 'semantic'
+MATCH_MODES = (TFIDF, SEMANTIC)
+
 class JobMatcher:
-    """Match resumes to relevant job opportunities."""
-    
-    def __init__(self):
-        self.jobs_database = self._load_mock_jobs()
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
+    """Match resumes to relevant job opportunities.
+    
+    The job index (and with it scikit-learn) is built in the constructor,
+    or with ``lazy=True`` on first use, so a process that only serves
+    health checks never pays for it. With ``shards`` >= 1, TF-IDF matching
+    is scattered across that many worker processes (see ShardedIndex).
+    Without a ``candidate_store``, ``candidate_memory_limit`` caps the
+    candidates kept in memory; the ones added longest ago are dropped.
+    Without a ``job_store`` the mock jobs are served; an empty store stays
+    empty unless ``seed_mock_jobs`` is set. With ``store_check_interval``,
+    queries compare the store's revision with the loaded one at most that
+    often (in seconds) and reload the index when another process, such as
+    another server worker or the job feed, has changed the store.
+    """
+    
+    def __init__(self, parity_check: bool = False, job_store=None, snapshot_dir: Optional[str] = None,
+                 candidate_store=None, match_mode: str = TFIDF,
+                 semantic_index: Optional[SemanticIndex] = None, lazy: bool = False,
+                 candidate_top_k: int = 10, shards: int = 0,
+                 shard_start_method: Optional[str] = None,
+                 candidate_memory_limit: Optional[int] = None, seed_mock_jobs: bool = False,
+                 store_check_interval: Optional[float] = None):
+        if match_mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode: {match_mode}")
+        self.parity_check = parity_check
+        self.match_mode = match_mode
+        self.semantic = semantic_index or SemanticIndex()
+        self.job_store = job_store
+        self.snapshot_dir = snapshot_dir
+        self.candidate_store = candidate_store
+        self.candidate_top_k = candidate_top_k
+        self.candidate_memory_limit = candidate_memory_limit
+        self.seed_mock_jobs = seed_mock_jobs
+        self.store_check_interval = store_check_interval
+        self.sharded = ShardedIndex(shards, shard_start_method) if shards >= 1 else None
+        # Called with the ids of added, changed or removed jobs (None: every job)
+        self.on_jobs_changed: Optional[Callable[[Optional[List[str]]], None]] = None
+        # Serializes index and candidate updates with background re-matching
+        self._update_lock = threading.RLock()
+        # Ids changed inside bulk_update(), notified when it exits
+        self._bulk_changes: Optional[Set[str]] = None
+        self._bulk_refitted = False
+        # Re-matches in progress; they hold candidate rows, so compaction waits
+        self._rematches = 0
+        self._index: Optional[JobIndex] = None
+        self._candidates: Optional[CandidateIndex] = None
+        self._load_lock = threading.Lock()
+        # Store revision the index reflects, and when it was last compared with the store's
+        self._store_revision: Optional[int] = None
+        self._store_checked = 0.0
+        self._store_check_lock = threading.Lock()
+        self._instance_id = uuid.uuid4().hex
+        if not lazy:
+            self.load()
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the job index has been built."""
+        return self._index is not None
+    
+    @property
+    def index(self) -> JobIndex:
+        """The job index, built on first access when lazy."""
+        if self._index is None:
+            self.load()
+        return self._index
+    
+    @property
+    def candidates(self) -> CandidateIndex:
+        """Stored candidates, loaded alongside the job index."""
+        if self._candidates is None:
+            self.load()
+        return self._candidates
+    
+    def load(self) -> None:
+        """Build the job index and load stored candidates, once."""
+        with self._load_lock:
+            if self._index is not None:
+                return
+            index, candidates, revision = self._build()
+            # Published last, so other threads never see a half-built index
+            self._store_revision = revision
+            self._store_checked = time.monotonic()
+            self._candidates = candidates
+            self._index = index
+    
+    def _build(self) -> Tuple[JobIndex, CandidateIndex, Optional[int]]:
+        """A new job index and candidate index, with the store revision they were loaded at."""
+        index = JobIndex(self._create_job_text)
+        revision = self._load_index(index)
+        candidates = CandidateIndex(
+            index,
+            on_revectorize=self.candidate_store.update_vectors if self.candidate_store is not None else None
         )
+        self._load_candidates(candidates)
+        return index, candidates, revision
+    
+    def refresh_from_store(self) -> bool:
+        """Reload the index if another process changed the job store. Returns whether it did.
+        
+        Compares revisions at most every ``store_check_interval`` seconds;
+        one thread checks and reloads while the others keep querying the
+        current index. Candidates kept only in memory are carried over and
+        re-matched; stored ones are read back with their stored lists.
+        """
+        if self.store_check_interval is None or self.job_store is None or self._index is None:
+            return False
+        if time.monotonic() - self._store_checked < self.store_check_interval:
+            return False
+        if not self._store_check_lock.acquire(blocking=False):
+            return False
+        try:
+            self._store_checked = time.monotonic()
+            if self._bulk_changes is not None or self.job_store.revision == self._store_revision:
+                return False
+            logger.info(f"Job store changed since revision {self._store_revision}, reloading the index")
+            index, candidates, revision = self._build()
+            with self._update_lock:
+                # Continue the old generation, so cursors and the semantic index read as stale
+                index.generation += self._index.generation + 1
+                carried = 0
+                if self.candidate_store is None:
+                    for row in self._candidates.active_rows.tolist():
+                        candidates.add(self._candidates.id_at(row), self._candidates.profile_at(row),
+                                       self._candidates.text_at(row))
+                        carried += 1
+                self._store_revision = revision
+                self._candidates = candidates
+                self._index = index
+            if carried:
+                self._jobs_changed(None)
+            return True
+        finally:
+            self._store_check_lock.release()
+    
+    def _write_store(self, write: Callable[[], Any]) -> Tuple[int, int]:
+        """Run a job store write. Returns the store revisions before and after it."""
+        before = self.job_store.revision
+        write()
+        return before, self.job_store.revision
+    
+    def _follow_store(self, revisions: Optional[Tuple[int, int]]) -> None:
+        """Move the loaded revision past this process's own write once the index has it. Call with the update lock held.
+        
+        If anything else wrote in between, the loaded revision stays
+        behind and the next revision check reloads the index.
+        """
+        if revisions is not None and self._store_revision is not None \
+                and revisions == (self._store_revision, self._store_revision + 1):
+            self._store_revision = revisions[1]
+    
+    def _load_index(self, index: JobIndex) -> Optional[int]:
+        """Build the job index, mapping a snapshot instead of refitting when possible.
+        
+        Returns the store revision the jobs were read at, or None without a store.
+        """
+        if self.job_store is None:
+            index.fit(self._load_mock_jobs())
+            return None
+        
+        if self.seed_mock_jobs and self.job_store.count() == 0:
+            logger.info("Job store is empty, seeding it with mock jobs")
+            self.job_store.upsert_jobs(self._load_mock_jobs())
+        
+        # Read before the jobs: a write in between then only costs a reload
+        revision = self.job_store.revision
+        jobs = self.job_store.load_all()
+        if self.snapshot_dir and load_snapshot(index, self.snapshot_dir, jobs, revision):
+            return revision
+        
+        index.fit(jobs)
+        if self.snapshot_dir and index.vectorizer is not None:
+            save_snapshot(index, self.snapshot_dir, revision)
+        return revision
+    
+    def _load_candidates(self, candidates: CandidateIndex) -> None:
+        """Load stored candidates, reusing their vectors while the job vocabulary is unchanged."""
+        if self.candidate_store is None:
+            return
+        
+        # Top-k lists scored with another vocabulary are recomputed on the next re-match
+        stored_matches = self.candidate_store.load_matches(candidates.job_index.vectorizer_key)
+        for candidate in self.candidate_store.iter_candidates():
+            vector = None
+            if candidate['vector_indices'] is not None:
+                vector = (candidate['vector_indices'], candidate['vector_data'])
+            candidates.add(candidate['id'], candidate['profile'], candidate['match_text'],
+                           vector=vector, vector_key=candidate['vector_key'],
+                           matches=stored_matches.get(candidate['id']))
+        logger.info(f"Candidate index loaded: {candidates.size} candidates")
+    
+    def save_snapshot(self) -> Optional[str]:
+        """Persist the fitted index so other workers can map it at startup."""
+        if not self.snapshot_dir or self.job_store is None or self.index.vectorizer is None:
+            return None
+        with self._update_lock:
+            # Labelled with the revision the index reflects, which lags the store's after outside writes
+            return save_snapshot(self.index, self.snapshot_dir, self._store_revision)
+    
+    @property
+    def jobs_database(self) -> List[Dict[str, Any]]:
+        """Active jobs held by the index."""
+        return self.index.jobs
+    
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever match results for the same resume may change."""
+        return f"{self._instance_id}:{self.index.version}"
+    
+    @property
+    def vectorizer(self):
+        """Vectorizer fitted on the job corpus."""
+        return self.index.vectorizer
     
     def _load_mock_jobs(self) -> List[Dict[str, Any]]:
         """Load mock job data. In production, this would connect to a job board API."""
@@ -123,54 +339,279 @@ class JobMatcher:
             }
         ]
     
-    def find_matches(self, resume_data: ResumeData) -> List[Dict[str, Any]]:
-        """Find job matches for a given resume."""
+    def find_matches(self, resume_data: ResumeData, k: int = 10, min_score: int = 0,
+                     mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Find the top-k job matches for a given resume.
+        
+        Only jobs sharing a term or a skill with the resume are scored; the
+        rest score 0 and are used solely to pad short result lists. With
+        ``mode='semantic'`` jobs are retrieved by LSA similarity instead
+        (see _find_semantic_matches); ``mode`` defaults to ``match_mode``.
+        """
+        self.refresh_from_store()
+        if (mode or self.match_mode) == SEMANTIC:
+            return self._find_semantic_matches(resume_data, k, min_score)
+        if self.sharded is not None:
+            return self._find_sharded_matches([resume_data], k, min_score)[0]
         try:
             # Create text representation of resume for matching
             resume_text = self._create_resume_text(resume_data)
             
-            # Create text representations of all jobs
-            job_texts = [self._create_job_text(job) for job in self.jobs_database]
+            # Only the resume is vectorized; the job matrix is prefitted
+            resume_vector = self.index.transform(resume_text)
+            term_rows, term_similarities = self.index.candidate_similarities(resume_vector)
             
-            # Add resume text to the corpus for vectorization
-            all_texts = job_texts + [resume_text]
+            # Jobs with no shared terms can still earn a skill overlap bonus
+            skill_ids = self.index.skill_ids(resume_data.skills or [])
+            skill_rows, skill_overlaps = self.index.skill_overlap(skill_ids)
             
-            # Vectorize texts
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+            rows = np.union1d(term_rows, skill_rows).astype(np.int64)
+            similarities = np.zeros(len(rows))
+            similarities[np.searchsorted(rows, term_rows)] = term_similarities
+            overlaps = np.zeros(len(rows), dtype=np.int64)
+            overlaps[np.searchsorted(rows, skill_rows)] = skill_overlaps
             
-            # Calculate similarity between resume and each job
-            resume_vector = tfidf_matrix[-1]  # Resume is the last item
-            job_vectors = tfidf_matrix[:-1]   # All job vectors
+            percentages = self._score_rows(rows, similarities, overlaps)
+            matches = self._select_matches(rows, similarities, percentages, k, min_score)
             
-            similarities = cosine_similarity(resume_vector, job_vectors).flatten()
+            if self.parity_check:
+                self._check_parity(resume_data, matches, k, min_score)
+            
+            return matches
+            
+        except Exception as e:
+            logger.error(f"Error finding job matches: {str(e)}")
+            return []
+    
+    def _find_semantic_matches(self, resume_data: ResumeData, k: int = 10,
+                               min_score: int = 0) -> List[Dict[str, Any]]:
+        """Find matches by nearest neighbours in the LSA space.
+        
+        The resume's TF-IDF vector is projected like the job rows, the
+        nearest jobs are fetched from the IVF index and then scored with
+        the usual formula, the LSA cosine standing in for the TF-IDF one.
+        """
+        try:
+            semantic = self._semantic_index()
+            resume_vector = self.index.transform(self._create_resume_text(resume_data))
+            query = semantic.embed(resume_vector)[0]
             
-            # Create match results with similarity scores
-            matches = []
-            for i, similarity_score in enumerate(similarities):
-                job = self.jobs_database[i].copy()
-                
-                # Calculate match percentage (0-100)
-                match_percentage = min(100, int(similarity_score * 100 * 1.5))  # Boost for better UX
-                
-                # Add skill overlap bonus
-                skill_bonus = self._calculate_skill_overlap(resume_data.skills, job['skills'])
-                match_percentage = min(100, match_percentage + skill_bonus)
-                
-                job['match_percentage'] = match_percentage
-                job['similarity_score'] = float(similarity_score)
-                
-                matches.append(job)
+            # Over-fetch, since the skill bonus can reorder close neighbours
+            rows, similarities = semantic.search(query, max(4 * k, 50), active=self.index.active_mask)
+            order = np.argsort(rows)
+            rows, similarities = rows[order], np.clip(similarities[order], 0.0, None)
             
-            # Sort by match percentage (descending)
-            matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+            skill_rows, skill_overlaps = self.index.skill_overlap(
+                self.index.skill_ids(resume_data.skills or [])
+            )
+            overlaps = np.zeros(len(rows), dtype=np.int64)
+            shared = np.isin(skill_rows, rows)
+            overlaps[np.searchsorted(rows, skill_rows[shared])] = skill_overlaps[shared]
             
-            # Return top matches
-            return matches[:10]
+            percentages = self._score_rows(rows, similarities, overlaps)
+            return self._select_matches(rows, similarities, percentages, k, min_score)
             
         except Exception as e:
-            logger.error(f"Error finding job matches: {str(e)}")
+            logger.error(f"Error finding semantic job matches: {str(e)}")
             return []
     
+    def find_matches_many(self, resumes: List[ResumeData], k: int = 10, min_score: int = 0,
+                          mode: Optional[str] = None, chunk_size: int = 256,
+                          max_pairs: int = 2000000) -> List[List[Dict[str, Any]]]:
+        """Find the top-k job matches for many resumes at once.
+        
+        The resumes are vectorized together and scored against every job
+        with one sparse product for term similarity and one for skill
+        overlap per chunk. A chunk holds at most ``chunk_size`` resumes and
+        roughly ``max_pairs`` resume x job pairs. Results are the same as
+        calling find_matches per resume. Semantic mode falls back to
+        exactly that. Unlike find_matches, errors are raised rather than
+        returned as empty results, since they would blank the whole batch.
+        """
+        self.refresh_from_store()
+        if (mode or self.match_mode) == SEMANTIC:
+            return [self._find_semantic_matches(resume_data, k, min_score) for resume_data in resumes]
+        if self.sharded is not None:
+            return self._find_sharded_matches(resumes, k, min_score, chunk_size)
+        return self._find_batched_matches(resumes, k, min_score, chunk_size, max_pairs)
+    
+    def _find_batched_matches(self, resumes: List[ResumeData], k: int, min_score: int,
+                              chunk_size: int = 256, max_pairs: int = 2000000) -> List[List[Dict[str, Any]]]:
+        """The in-process TF-IDF path of find_matches_many."""
+        index = self.index
+        n_jobs = index.matrix.shape[0] if index.matrix is not None else 0
+        step = max(1, min(chunk_size, max_pairs // max(1, n_jobs)))
+        results = []
+        for start in range(0, len(resumes), step):
+            chunk = resumes[start:start + step]
+            queries = index.transform_many([self._create_resume_text(resume_data) for resume_data in chunk])
+            query_skills = index.skill_query_matrix(resume_data.skills or [] for resume_data in chunk)
+            positions, rows, similarities, overlaps = index.pair_scores(queries, query_skills)
+            percentages = self._score_rows(rows, similarities, overlaps)
+            
+            # Pairs come out grouped by resume
+            bounds = np.searchsorted(positions, np.arange(len(chunk) + 1)).tolist()
+            for position, resume_data in enumerate(chunk):
+                lo, hi = bounds[position], bounds[position + 1]
+                matches = self._select_matches(rows[lo:hi], similarities[lo:hi], percentages[lo:hi],
+                                               k, min_score)
+                if self.parity_check:
+                    self._check_parity(resume_data, matches, k, min_score)
+                results.append(matches)
+        return results
+    
+    def _find_sharded_matches(self, resumes: List[ResumeData], k: int = 10, min_score: int = 0,
+                              chunk_size: int = 256) -> List[List[Dict[str, Any]]]:
+        """Find matches by scatter-gather over the shard workers.
+        
+        Resumes are vectorized here and sent ``chunk_size`` at a time; each
+        shard returns its local top-k and the merged result is the same as
+        find_matches on the whole index. If the shards fail, matching falls
+        back to the unsharded path.
+        """
+        try:
+            index = self.index
+            results = []
+            for start in range(0, len(resumes), max(1, chunk_size)):
+                chunk = resumes[start:start + max(1, chunk_size)]
+                vectors = index.transform_many([self._create_resume_text(resume_data) for resume_data in chunk])
+                queries = []
+                for position, resume_data in enumerate(chunk):
+                    vector = vectors[position]
+                    queries.append((vector.indices, vector.data, query_norm(vector),
+                                    index.skill_ids(resume_data.skills or [])))
+                # Held until the matches are built, so rows still point at the same jobs
+                with self._update_lock:
+                    sharded = self._sharded_index()
+                    for resume_data, (rows, percentages, similarities) in zip(
+                            chunk, sharded.top_k(queries, k, min_score)):
+                        matches = [
+                            self._build_match(row, percentage, similarity)
+                            for row, percentage, similarity in zip(
+                                rows.tolist(), percentages.tolist(), similarities.tolist())
+                        ]
+                        if self.parity_check:
+                            self._check_parity(resume_data, matches, k, min_score)
+                        results.append(matches)
+            return results
+            
+        except ShardError as e:
+            # The shards are restarted and republished on the next call
+            logger.warning(f"Sharded matching failed, matching in process: {str(e)}")
+            return self._find_batched_matches(resumes, k, min_score, chunk_size)
+    
+    def _sharded_index(self) -> ShardedIndex:
+        """The shards, republished if the index changed since they were last loaded."""
+        with self._update_lock:
+            if not self.sharded.is_current(self.index):
+                with time_stage('shard_publish'):
+                    self.sharded.publish(self.index)
+        return self.sharded
+    
+    def _select_matches(self, rows: np.ndarray, similarities: np.ndarray, percentages: np.ndarray,
+                        k: int, min_score: int) -> List[Dict[str, Any]]:
+        """Top-k matches among the scored rows (in ascending row order), padded like an exhaustive ranking."""
+        # Zero scores are left to the padding pass so they keep row order
+        keep = percentages >= max(min_score, 1)
+        top_rows = select_top_k(rows[keep], percentages[keep], k, self.index.matrix.shape[0])
+        positions = np.searchsorted(rows, top_rows).tolist()
+        matches = [
+            self._build_match(row, int(percentages[position]), float(similarities[position]))
+            for row, position in zip(top_rows.tolist(), positions)
+        ]
+        if len(matches) < k and min_score <= 0:
+            scored = dict(zip(rows.tolist(), zip(percentages.tolist(), similarities.tolist())))
+            self._pad_matches(matches, scored, k, min_score)
+        return matches
+    
+    def _semantic_index(self) -> SemanticIndex:
+        """The semantic index, refitted after an index rebuild and extended after appends."""
+        if self.semantic.generation != self.index.generation:
+            with time_stage('semantic_fit'):
+                self.semantic.fit(self.index.matrix, self.index.generation)
+            if self.semantic.centroids is not None:
+                logger.info(f"Semantic index recall@10: {self.semantic_recall():.3f}")
+        elif self.semantic.size < self.index.matrix.shape[0]:
+            self.semantic.add(self.index.matrix[self.semantic.size:])
+        return self.semantic
+    
+    def semantic_recall(self, k: int = 10, sample_size: int = 200) -> float:
+        """Recall@k of the IVF search against exact search, using sampled jobs as queries."""
+        semantic = self._semantic_index()
+        rows = self.index.active_rows
+        if len(rows) > sample_size:
+            rows = np.random.default_rng(0).choice(rows, sample_size, replace=False)
+        return semantic.recall_at_k(semantic.embeddings[rows], k, active=self.index.active_mask)
+    
+    def semantic_stats(self) -> Dict[str, Any]:
+        """Shape and measured recall of the semantic index."""
+        semantic = self._semantic_index()
+        return {
+            'rows': semantic.size,
+            'components': semantic.embeddings.shape[1],
+            'lists': 0 if semantic.centroids is None else len(semantic.centroids),
+            'n_probe': semantic.n_probe,
+            'recall_at_10': round(self.semantic_recall(), 4)
+        }
+    
+    def _pad_matches(self, matches: List[Dict[str, Any]], scored: Dict[int, Any],
+                     k: int, min_score: int) -> None:
+        """Pad with zero-score jobs, as an exhaustive ranking would."""
+        if len(matches) >= k or min_score > 0:
+            return
+        for row in self.index.active_rows.tolist():
+            if len(matches) >= k:
+                break
+            percentage, similarity = scored.get(row, (0, 0.0))
+            if percentage == 0:
+                matches.append(self._build_match(row, 0, similarity))
+    
+    def _find_matches_exhaustive(self, resume_data: ResumeData, k: int = 10, min_score: int = 0) -> List[Dict[str, Any]]:
+        """Reference scorer: rank every job and fully sort. Used for parity checks."""
+        resume_text = self._create_resume_text(resume_data)
+        resume_vector = self.index.transform(resume_text)
+        similarities = self.index.similarities(resume_vector)
+        
+        matches = []
+        for row in self.index.active_rows:
+            similarity_score = float(similarities[row])
+            match_percentage = self._score(resume_data.skills, self.index.job_at(row), similarity_score)
+            if match_percentage >= min_score:
+                matches.append(self._build_match(int(row), match_percentage, similarity_score))
+        
+        # Sort by match percentage (descending)
+        matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+        return matches[:k]
+    
+    def _check_parity(self, resume_data: ResumeData, matches: List[Dict[str, Any]],
+                      k: int, min_score: int) -> None:
+        """Compare pruned results against the exhaustive scorer."""
+        expected = self._find_matches_exhaustive(resume_data, k, min_score)
+        got = [(m['id'], m['match_percentage']) for m in matches]
+        want = [(m['id'], m['match_percentage']) for m in expected]
+        if got != want:
+            logger.error(f"Match parity mismatch: pruned={got} exhaustive={want}")
+    
+    def _score(self, resume_skills: List[str], job: Dict[str, Any], similarity_score: float) -> int:
+        """Combine cosine similarity and skill overlap into a 0-100 score."""
+        # Calculate match percentage (0-100)
+        match_percentage = min(100, int(similarity_score * 100 * 1.5))  # Boost for better UX
+        
+        # Add skill overlap bonus
+        skill_bonus = self._calculate_skill_overlap(resume_skills, job['skills'])
+        return min(100, match_percentage + skill_bonus)
+    
+    def _score_rows(self, rows: np.ndarray, similarities: np.ndarray, overlaps: np.ndarray) -> np.ndarray:
+        """Vectorized _score: same arithmetic as the per-job path, in bulk."""
+        return combine_scores(similarities, overlaps, self.index.skill_counts[rows])
+    
+    def _build_match(self, row: int, match_percentage: int, similarity_score: float) -> Dict[str, Any]:
+        """Materialize the response dict for a matched job."""
+        job = self.index.job_at(row).copy()
+        job['match_percentage'] = match_percentage
+        job['similarity_score'] = float(similarity_score)
+        return job
+    
     def _create_resume_text(self, resume_data: ResumeData) -> str:
         """Create a text representation of the resume for matching."""
         text_parts = []
@@ -224,38 +665,363 @@ class JobMatcher:
         overlap_percentage = overlap / total_job_skills
         return min(20, int(overlap_percentage * 20))
     
+    def add_jobs(self, jobs: List[Dict[str, Any]]) -> None:
+        """Add or replace jobs without refitting the whole index. A repeated id keeps its last record."""
+        jobs = latest_by_id(jobs)
+        # Loaded before the store write, or the load would already include the jobs
+        self.load()
+        revisions = None
+        if self.job_store is not None:
+            revisions = self._write_store(lambda: self.job_store.upsert_jobs(jobs))
+        with self._update_lock:
+            generation = self.index.generation
+            self.index.add_jobs(jobs, rebuild=self._bulk_changes is None)
+            self._follow_store(revisions)
+            # A refit rescales every similarity, so every list is stale
+            refitted = self.index.generation != generation
+            if self._bulk_changes is not None:
+                self._bulk_changes.update(str(job['id']) for job in jobs)
+                self._bulk_refitted = self._bulk_refitted or refitted
+                return
+        self._jobs_changed(None if refitted else [str(job['id']) for job in jobs])
+    
+    def update_job(self, job: Dict[str, Any]) -> None:
+        """Replace a single job in the index."""
+        self.add_jobs([job])
+    
+    def remove_job(self, job_id: str) -> bool:
+        """Remove a job from the index."""
+        self.load()
+        revisions = None
+        if self.job_store is not None:
+            revisions = self._write_store(lambda: self.job_store.delete_job(job_id))
+        with self._update_lock:
+            generation = self.index.generation
+            removed = self.index.remove_job(job_id)
+            self._follow_store(revisions)
+            refitted = self.index.generation != generation
+        if removed:
+            self._jobs_changed(None if refitted else [str(job_id)])
+        return removed
+    
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Defer index rebuilds and change notifications to the end of a block of add_jobs calls.
+        
+        A bulk load then costs at most one refit, when the block exits,
+        and one queued re-match, instead of a refit whenever a chunk
+        pushes drift over the threshold.
+        """
+        with self._update_lock:
+            if self._bulk_changes is not None:
+                raise RuntimeError('bulk_update() is already active')
+            self._bulk_changes = set()
+            self._bulk_refitted = False
+        try:
+            yield
+        finally:
+            with self._update_lock:
+                changes, refitted = self._bulk_changes, self._bulk_refitted
+                self._bulk_changes = None
+                refitted = self.index.rebuild_if_needed() or refitted
+            if refitted or changes:
+                self._jobs_changed(None if refitted else sorted(changes))
+    
+    def _jobs_changed(self, job_ids: Optional[List[str]]) -> None:
+        if self.on_jobs_changed is not None:
+            self.on_jobs_changed(job_ids)
+    
+    def add_candidate(self, candidate_id: str, resume_data: ResumeData,
+                      job_matches: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Store a parsed resume so it can be ranked against job postings.
+        
+        The candidate's top ``candidate_top_k`` job matches are stored with
+        it. ``job_matches`` may pass a find_matches result to reuse; it must
+        come from TF-IDF mode with ``min_score=0`` and at least that many
+        results.
+        """
+        match_text = self._create_resume_text(resume_data)
+        if job_matches is None:
+            job_matches = self.find_matches(resume_data, k=self.candidate_top_k, mode=TFIDF)
+        matches = [
+            (str(match['id']), match['match_percentage'], match['similarity_score'])
+            for match in job_matches[:self.candidate_top_k] if match['match_percentage'] > 0
+        ]
+        vector = self.index.transform(match_text)
+        vector = (vector.indices, vector.data)
+        vector_key = self.index.vectorizer_key
+        profile = {
+            'name': resume_data.personal_info.name,
+            'email': resume_data.personal_info.email,
+            'location': resume_data.personal_info.location,
+            'skills': resume_data.skills,
+            'experience_years': estimate_experience_years(resume_data.experience),
+            'summary': resume_data.summary,
+        }
+        if self.candidate_store is not None:
+            self.candidate_store.upsert_candidates([{
+                'id': candidate_id, 'profile': profile, 'match_text': match_text,
+                'vector_key': vector_key, 'vector': vector
+            }])
+            self.candidate_store.upsert_matches({candidate_id: matches}, vector_key)
+        with self._update_lock:
+            self.candidates.add(candidate_id, profile, match_text, vector=vector, vector_key=vector_key,
+                                matches=matches)
+            if self.candidate_store is None and self.candidate_memory_limit:
+                evicted = self.candidates.trim(self.candidate_memory_limit)
+                if evicted:
+                    logger.info(f"Dropped {len(evicted)} candidates over the in-memory limit "
+                                f"of {self.candidate_memory_limit}")
+            self._compact_candidates()
+    
+    def remove_candidate(self, candidate_id: str) -> bool:
+        """Remove a stored candidate."""
+        if self.candidate_store is not None:
+            self.candidate_store.delete_candidate(candidate_id)
+        with self._update_lock:
+            removed = self.candidates.remove(candidate_id)
+            self._compact_candidates()
+            return removed
+    
+    def _compact_candidates(self) -> None:
+        """Reclaim removed candidates' rows once they outnumber the live ones. Call with the update lock held."""
+        if self._rematches == 0 and self.candidates.tombstones > max(self.candidates.size, 64):
+            self.candidates.compact()
+    
+    def candidate_matches(self, candidate_id: str) -> Optional[List[Dict[str, Any]]]:
+        """A stored candidate's top-k job matches, or None if the candidate is unknown."""
+        self.refresh_from_store()
+        with self._update_lock:
+            row = self.candidates.row_of(candidate_id)
+            if row is None:
+                return None
+            stored = self.candidates.matches_at(row) or []
+        matches = []
+        for job_id, percentage, similarity in stored:
+            job_row = self.index.row_of(job_id)
+            if job_row is not None:
+                matches.append(self._build_match(job_row, percentage, similarity))
+        return matches
+    
+    def rematch_candidates(self, job_ids: Optional[Iterable[str]] = None, chunk_size: int = 1000,
+                           max_pairs: int = 2000000,
+                           progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """Bring stored candidates' top-k lists up to date after jobs changed.
+        
+        Only the rows of the added or changed jobs are scored, against all
+        candidates in one sparse product per chunk. A chunk holds at most
+        ``chunk_size`` candidates and roughly ``max_pairs`` candidate x job
+        pairs, which bounds memory. The new scores are merged into each
+        stored list in place. A candidate whose full list held a changed
+        or removed job is re-matched against every job, because its next
+        best job is unknown. The same applies to a candidate with no list.
+        ``job_ids=None`` re-matches everyone in full. ``progress(done,
+        total)`` is called after each chunk. Returns the number of lists
+        that changed.
+        """
+        with self._update_lock:
+            self.candidates.refresh()
+            index = self.index
+            generation = index.generation
+            rows = self.candidates.active_rows
+            changed = job_rows = None
+            if job_ids is not None:
+                changed = {str(job_id) for job_id in job_ids}
+                job_rows = np.array(sorted(
+                    row for row in (index.row_of(job_id) for job_id in changed) if row is not None
+                ), dtype=np.int64)
+            self._rematches += 1
+        
+        started = time.perf_counter()
+        try:
+            updated, stale = self._rematch_rows(index, generation, rows, job_rows, changed,
+                                                chunk_size, max_pairs, progress, 0, len(rows))
+            if stale:
+                more, _ = self._rematch_rows(index, generation, np.array(stale, dtype=np.int64), None, None,
+                                             chunk_size, max_pairs, progress, len(rows), len(rows) + len(stale))
+                updated += more
+        finally:
+            with self._update_lock:
+                self._rematches -= 1
+        logger.info(f"Re-matched {len(rows)} candidates against "
+                    f"{'all' if job_rows is None else len(job_rows)} jobs ({len(stale)} in full): "
+                    f"{updated} lists changed in {time.perf_counter() - started:.2f}s")
+        return updated
+    
+    def _rematch_rows(self, index: JobIndex, generation: int, rows: np.ndarray,
+                      job_rows: Optional[np.ndarray], changed: Optional[Set[str]],
+                      chunk_size: int, max_pairs: int, progress: Optional[Callable[[int, int], None]],
+                      done: int, total: int) -> Tuple[int, List[int]]:
+        """Re-match candidate rows chunk by chunk. Returns the lists changed and the stale rows."""
+        n_jobs = index.matrix.shape[0] if job_rows is None else len(job_rows)
+        step = max(1, min(chunk_size, max_pairs // max(1, n_jobs)))
+        updated, stale = 0, []
+        for start in range(0, len(rows), step):
+            chunk = rows[start:start + step]
+            with self._update_lock:
+                if self._index is not index or index.generation != generation:
+                    # The refit queued a full re-match of its own
+                    logger.info("Job index refitted during re-matching, stopping early")
+                    break
+                updates, chunk_stale = self._rematch_chunk(index, chunk, job_rows, changed)
+                for row, matches in updates.items():
+                    self.candidates.set_matches(row, matches)
+                if self.candidate_store is not None and updates:
+                    self.candidate_store.upsert_matches(
+                        {self.candidates.id_at(row): matches for row, matches in updates.items()},
+                        index.vectorizer_key
+                    )
+            updated += len(updates)
+            stale.extend(chunk_stale)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total + len(stale))
+        return updated, stale
+    
+    def _rematch_chunk(self, index: JobIndex, chunk: np.ndarray, job_rows: Optional[np.ndarray],
+                       changed: Optional[Set[str]]) -> Tuple[Dict[int, List[Tuple[str, int, float]]], List[int]]:
+        """Merge fresh scores for the given job rows into each candidate's list."""
+        candidate_rows, matched_jobs, similarities, overlaps = self.candidates.score_jobs(chunk, job_rows)
+        percentages = combine_scores(similarities, overlaps, index.skill_counts[matched_jobs])
+        keep = percentages >= 1
+        candidate_rows, matched_jobs = candidate_rows[keep], matched_jobs[keep]
+        similarities, percentages = similarities[keep], percentages[keep]
+        
+        # Pairs come out grouped by candidate, in chunk order
+        starts = np.searchsorted(candidate_rows, chunk, side='left')
+        ends = np.searchsorted(candidate_rows, chunk, side='right')
+        updates, stale = {}, []
+        for row, lo, hi in zip(chunk.tolist(), starts.tolist(), ends.tolist()):
+            old = self.candidates.matches_at(row)
+            job_list = matched_jobs[lo:hi].tolist()
+            percentage_list = percentages[lo:hi].tolist()
+            similarity_list = similarities[lo:hi].tolist()
+            if changed is not None:
+                if old is None:
+                    stale.append(row)
+                    continue
+                kept = [(index.row_of(job_id), percentage, similarity)
+                        for job_id, percentage, similarity in old if job_id not in changed]
+                kept = [entry for entry in kept if entry[0] is not None]
+                if len(kept) < len(old) and len(old) >= self.candidate_top_k:
+                    stale.append(row)
+                    continue
+                if not job_list and len(kept) == len(old):
+                    continue
+                job_list += [entry[0] for entry in kept]
+                percentage_list += [entry[1] for entry in kept]
+                similarity_list += [entry[2] for entry in kept]
+            
+            scored = dict(zip(job_list, zip(percentage_list, similarity_list)))
+            top_rows = select_top_k(np.array(job_list, dtype=np.int64), np.array(percentage_list, dtype=np.int64),
+                                    self.candidate_top_k, index.matrix.shape[0])
+            matches = [(str(index.job_at(job_row)['id']), *scored[job_row]) for job_row in top_rows.tolist()]
+            if matches != old:
+                updates[row] = matches
+        return updates, stale
+    
+    def find_candidates(self, job_id: str, k: int = 10, min_score: int = 0,
+                        location: Optional[str] = None, min_experience: Optional[float] = None,
+                        max_experience: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """Rank stored candidates for a job, scored exactly as find_matches scores jobs.
+        
+        Returns None if the job is unknown. Candidates sharing no term or
+        skill with the job score 0 and are not returned.
+        """
+        self.refresh_from_store()
+        # Held throughout: a removal, compaction or reload would invalidate the rows
+        with self._update_lock:
+            row = self.index.row_of(job_id)
+            if row is None:
+                return None
+            
+            job = self.index.job_at(row)
+            job_skills = job.get('skills', [])
+            with time_stage('candidate_score'):
+                rows, similarities, overlaps = self.candidates.score(
+                    self.index.matrix[row], float(self.index.row_norms[row]), job_skills
+                )
+            keep = self.candidates.filter_rows(rows, location, min_experience, max_experience)
+            positions = np.searchsorted(rows, keep)
+            rows, similarities, overlaps = keep, similarities[positions], overlaps[positions]
+            
+            total_skills = len({skill.lower() for skill in job_skills})
+            percentages = combine_scores(similarities, overlaps, total_skills)
+            keep = percentages >= max(min_score, 1)
+            top_rows = select_top_k(rows[keep], percentages[keep], k, self.candidates.matrix.shape[0])
+            
+            scored = dict(zip(rows.tolist(), zip(percentages.tolist(), similarities.tolist())))
+            results = []
+            for candidate_row in top_rows.tolist():
+                percentage, similarity = scored[candidate_row]
+                results.append({
+                    'candidate_id': self.candidates.id_at(candidate_row),
+                    **self.candidates.profile_at(candidate_row),
+                    'match_percentage': percentage,
+                    'similarity_score': float(similarity)
+                })
+        return results
+    
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """Get all available jobs."""
+        self.refresh_from_store()
         return self.jobs_database
     
     def search_jobs(self, search_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search jobs based on criteria."""
-        filtered_jobs = self.jobs_database.copy()
-        
-        # Filter by location
-        if search_criteria.get('location'):
-            location = search_criteria['location'].lower()
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if location in job['location'].lower() or 
-                (location == 'remote' and job.get('remote_friendly', False))
-            ]
-        
-        # Filter by experience level
-        if search_criteria.get('experience_level'):
-            level = search_criteria['experience_level'].lower()
-            filtered_jobs = [
-                job for job in filtered_jobs 
-                if job.get('experience_level', '').lower() == level
-            ]
-        
-        # Filter by skills
-        if search_criteria.get('skills'):
-            required_skills = [skill.lower() for skill in search_criteria['skills']]
-            filtered_jobs = [
-                job for job in filtered_jobs
-                if any(skill.lower() in [j_skill.lower() for j_skill in job['skills']] 
-                      for skill in required_skills)
-            ]
-        
-        return filtered_jobs
\ No newline at end of file
+        self.refresh_from_store()
+        rows = self._search_rows(search_criteria)
+        return [self.index.job_at(row) for row in rows.tolist()]
+    
+    def page_jobs(self, search_criteria: Optional[Dict[str, Any]] = None, limit: int = 50,
+                  cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Return one page of jobs matching the criteria.
+        
+        Raises ValueError for an invalid or expired cursor.
+        """
+        self.refresh_from_store()
+        with time_stage('job_search'):
+            rows = self._search_rows(search_criteria or {})
+        page_rows, next_cursor = self.index.page(rows, limit, cursor)
+        jobs = [self.index.job_at(row) for row in page_rows.tolist()]
+        if fields:
+            jobs = [self._project(job, fields) for job in jobs]
+        return {
+            'jobs': jobs,
+            'total': len(rows),
+            'next_cursor': next_cursor
+        }
+    
+    def _search_rows(self, search_criteria: Dict[str, Any]):
+        """Resolve search criteria to matching index rows."""
+        text_rows = None
+        if search_criteria.get('query'):
+            text_rows = self._text_search_rows(search_criteria['query'])
+        
+        return self.index.search(
+            location=search_criteria.get('location'),
+            experience_level=search_criteria.get('experience_level'),
+            skills=search_criteria.get('skills'),
+            restrict_to=text_rows
+        )
+    
+    def _text_search_rows(self, query: str) -> set:
+        """Rows whose text matches a free-text query (FTS5 when a store is configured)."""
+        if self.job_store is not None:
+            rows = (self.index.row_of(job_id) for job_id in self.job_store.search_text(query))
+            return {row for row in rows if row is not None}
+        
+        words = query.lower().split()
+        return {
+            row for row in self.index.active_rows.tolist()
+            if all(word in self._create_job_text(self.index.job_at(row)) for word in words)
+        }
+    
+    @staticmethod
+    def _project(job: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+        """Keep only the requested fields (the id is always kept)."""
+        projected = {'id': job['id']}
+        for field in fields:
+            if field in job:
+                projected[field] = job[field]
+        return projected
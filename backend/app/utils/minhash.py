@@ -0,0 +1,115 @@
+import re
+import zlib
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Prime just above 2**32: with 32-bit shingle hashes and multipliers,
+# a * h + b stays below 2**64, so uint64 arithmetic never wraps
+MERSENNE_PRIME = np.uint64(4294967311)
+MAX_HASH = np.uint64(2 ** 32 - 1)
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(bands, rows) splitting ``num_perm`` so the LSH S-curve turns near ``threshold``.
+
+    Two documents with Jaccard similarity s share at least one band with
+    probability 1 - (1 - s**rows)**bands, which rises steepest around
+    (1 / bands) ** (1 / rows).
+    """
+    splits = [(bands, num_perm // bands) for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+    return min(splits, key=lambda split: abs((1.0 / split[0]) ** (1.0 / split[1]) - threshold))
+
+
+class MinHashLSH:
+    """Near-duplicate detection over word shingles with MinHash and banded LSH.
+
+    Each text is reduced to ``num_perm`` min-hashes of its word
+    ``shingle_size``-grams. Signatures are split into bands; texts sharing
+    any band are candidates, and a candidate counts as a near-duplicate
+    when the fraction of equal min-hashes (an estimate of the Jaccard
+    similarity of the shingle sets) reaches ``threshold``.
+
+    Only signatures and band buckets are kept, about 1 KB per distinct
+    text with the defaults, never the texts themselves.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError('threshold must be in (0, 1]')
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = generator.randint(0, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+        # Odd multipliers combining token hashes into shingle hashes
+        self._mix = generator.randint(1, 2 ** 31, size=shingle_size, dtype=np.uint64) * 2 + 1
+
+        self._buckets: List[Dict[int, int]] = [{} for _ in range(self.bands)]
+        self._keys: List[str] = []
+        self._signatures = np.zeros((1024, num_perm), dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text's word shingles."""
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        if not tokens:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+        hashes = np.array([zlib.crc32(token.encode('utf-8')) for token in tokens], dtype=np.uint64)
+        size = min(self.shingle_size, len(hashes))
+        shingles = np.zeros(len(hashes) - size + 1, dtype=np.uint64)
+        for offset in range(size):
+            shingles += hashes[offset:offset + len(shingles)] * self._mix[offset]
+        shingles &= MAX_HASH
+        return ((self._a * shingles + self._b) % MERSENNE_PRIME).min(axis=1).astype(np.uint32)
+
+    def query(self, signature: np.ndarray, exclude: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """Most similar stored key at or above the threshold, with its estimated similarity."""
+        candidates = set()
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            position = bucket.get(band)
+            if position is not None:
+                candidates.add(position)
+        best = None
+        for position in candidates:
+            key = self._keys[position]
+            if key == exclude:
+                continue
+            similarity = float(np.mean(self._signatures[position] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Store a signature under ``key``; earlier entries keep their buckets."""
+        position = len(self._keys)
+        if position == len(self._signatures):
+            self._signatures = np.concatenate([self._signatures, np.zeros_like(self._signatures)])
+        self._signatures[position] = signature
+        self._keys.append(key)
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            bucket.setdefault(band, position)
+
+    def check(self, key: str, text: str) -> Optional[Tuple[str, float]]:
+        """Return the stored near-duplicate of ``text``, or store it and return None.
+
+        An entry under the same ``key`` is an earlier version of the same
+        document, not a duplicate of it.
+        """
+        signature = self.signature(text)
+        duplicate = self.query(signature, exclude=key)
+        if duplicate is None:
+            self.insert(key, signature)
+        return duplicate
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        return [hash(band.tobytes()) for band in signature[:self.bands * self.rows].reshape(self.bands, self.rows)]
@@ -0,0 +1,269 @@
+import io
+import os
+import time
+import signal
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Union, BinaryIO, List, Tuple, Dict
+
+logger = logging.getLogger(__name__)
+
+PDFPLUMBER = 'pdfplumber'
+PYPDF2 = 'pypdf2'
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+class _Deadline(Exception):
+    """Raised inside a page-range task when its time budget runs out."""
+
+
+def _get_executor(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """Shared process pool for long documents, created lazily and per process.
+
+    The pool outlives single uploads, so its workers are started once per
+    server process rather than per PDF.
+    """
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            methods = multiprocessing.get_all_start_methods()
+            # Forked workers start with the PDF libraries already imported
+            context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+            _executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    logger.error("PDF page pool is broken, it will be recreated")
+    with _executor_lock:
+        _executor = None
+
+
+def _open_pdf(document: Union[str, bytes, BinaryIO], backend: str):
+    if isinstance(document, bytes):
+        document = io.BytesIO(document)
+    # Imported on first use so processes that never read a PDF skip them
+    if backend == PDFPLUMBER:
+        import pdfplumber
+        return pdfplumber.open(document)
+    import PyPDF2
+    return PyPDF2.PdfReader(document)
+
+
+def _page_text(pdf, backend: str, page_number: int) -> str:
+    page = pdf.pages[page_number]
+    text = page.extract_text() or ''
+    if backend == PDFPLUMBER and hasattr(page, 'close'):
+        # Release the page's parsed layout objects as we go
+        page.close()
+    return text
+
+
+def _read_page(pdf, backend: str, page_number: int) -> str:
+    try:
+        return _page_text(pdf, backend, page_number)
+    except _Deadline:
+        raise
+    except Exception as e:
+        logger.warning(f"Skipping unreadable PDF page {page_number}: {str(e)}")
+        return ''
+
+
+def _raise_deadline(signum, frame):
+    raise _Deadline()
+
+
+def _extract_page_range(document: Union[str, bytes], backend: str,
+                        start: int, stop: int, deadline: float) -> List[str]:
+    """Process-pool task: extract text for pages [start, stop) until the wall-clock ``deadline``.
+
+    A timer interrupts a page still being parsed at the deadline, so a
+    pathological page gives its pool worker back instead of holding it.
+    Returns the pages read by then.
+    """
+    texts: List[str] = []
+    timed = hasattr(signal, 'setitimer')
+    if timed:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return texts
+        previous = signal.signal(signal.SIGALRM, _raise_deadline)
+        signal.setitimer(signal.ITIMER_REAL, remaining)
+    try:
+        pdf = _open_pdf(document, backend)
+        try:
+            for page_number in range(start, stop):
+                texts.append(_read_page(pdf, backend, page_number))
+        finally:
+            if backend == PDFPLUMBER:
+                pdf.close()
+    except _Deadline:
+        pass
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return texts
+
+
+class PdfExtractor:
+    """Extract PDF text within a page cap and a wall-clock budget.
+
+    The document is probed in process to choose a backend (pdfplumber,
+    else PyPDF2): pages are read in order until one has text, so a blank
+    or image-only cover page does not end the probe. Documents of up to
+    ``parallel_threshold`` pages are then read sequentially from the probed
+    handle, checking the budget between pages. Longer ones are split into
+    page ranges extracted by a shared process pool, whose tasks stop
+    themselves at the deadline. Extraction stops early once ``max_chars``
+    of text have been collected.
+    """
+
+    def __init__(self, max_pages: int = 50, time_budget: float = 10.0,
+                 max_chars: int = 100000, parallel_threshold: int = 8,
+                 pages_per_task: int = 4, max_workers: Optional[int] = None):
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.max_chars = max_chars
+        self.parallel_threshold = parallel_threshold
+        self.pages_per_task = pages_per_task
+        self.max_workers = max_workers
+
+    def warm_up(self) -> None:
+        """Import both PDF backends now rather than on the first upload."""
+        import pdfplumber  # noqa: F401
+        import PyPDF2  # noqa: F401
+
+    def extract(self, document: Union[str, BinaryIO]) -> Optional[str]:
+        """Extract text from a PDF path or seekable binary stream."""
+        deadline = time.monotonic() + self.time_budget
+        probe = self._probe(document, deadline)
+        if probe is None:
+            logger.info("No extractable text found in PDF (possibly scanned)")
+            return None
+
+        backend, pdf, page_count, texts = probe
+        pages = min(page_count, self.max_pages)
+        if page_count > self.max_pages:
+            logger.info(f"PDF has {page_count} pages, extracting the first {self.max_pages}")
+
+        try:
+            if pages <= self.parallel_threshold:
+                texts = self._extract_sequential(pdf, backend, pages, texts, deadline)
+            else:
+                texts = self._extract_parallel(document, pdf, backend, pages, texts, deadline)
+        finally:
+            if backend == PDFPLUMBER:
+                pdf.close()
+
+        text = "\n".join(page_text for page_text in texts if page_text)
+        return text.strip() or None
+
+    def _probe(self, document: Union[str, BinaryIO],
+               deadline: float) -> Optional[Tuple[str, object, int, List[str]]]:
+        """Open the document once per backend until one yields text within the page cap.
+
+        Returns the backend, the open document, its page count and the
+        texts of the pages read so far (the last one has text), so the
+        probe work is not repeated.
+        """
+        for backend in (PDFPLUMBER, PYPDF2):
+            try:
+                pdf = _open_pdf(self._rewind(document), backend)
+                page_count = len(pdf.pages)
+            except Exception as e:
+                logger.info(f"{backend} could not open PDF: {str(e)}")
+                continue
+
+            texts: List[str] = []
+            for page_number in range(min(page_count, self.max_pages)):
+                if time.monotonic() > deadline:
+                    logger.warning(f"PDF extraction budget exceeded while probing page {page_number}")
+                    break
+                texts.append(_read_page(pdf, backend, page_number))
+                if texts[-1].strip():
+                    return backend, pdf, page_count, texts
+            if backend == PDFPLUMBER:
+                pdf.close()
+            if time.monotonic() > deadline:
+                return None
+        return None
+
+    def _extract_sequential(self, pdf, backend: str, pages: int, texts: List[str],
+                            deadline: float) -> List[str]:
+        texts = list(texts)
+        collected = sum(len(text) for text in texts)
+        for page_number in range(len(texts), pages):
+            if collected >= self.max_chars:
+                break
+            if time.monotonic() > deadline:
+                logger.warning(f"PDF extraction budget exceeded after {page_number} pages")
+                break
+            texts.append(_read_page(pdf, backend, page_number))
+            collected += len(texts[-1])
+        return texts
+
+    def _extract_parallel(self, document: Union[str, BinaryIO], pdf, backend: str, pages: int,
+                          texts: List[str], deadline: float) -> List[str]:
+        # Workers reopen the document themselves, so send a path or raw bytes
+        source = document if isinstance(document, str) else self._rewind(document).read()
+        # Tasks check the budget against the wall clock, which workers share
+        wall_deadline = time.time() + (deadline - time.monotonic())
+
+        futures: Dict[object, int] = {}
+        try:
+            executor = _get_executor(self.max_workers)
+            for start in range(len(texts), pages, self.pages_per_task):
+                stop = min(pages, start + self.pages_per_task)
+                futures[executor.submit(_extract_page_range, source, backend, start, stop,
+                                        wall_deadline)] = start
+        except RuntimeError as e:
+            # BrokenProcessPool, or a pool shut down under us: read the rest here
+            logger.warning(f"PDF page pool unavailable, reading in process: {str(e)}")
+            _reset_executor()
+            for future in futures:
+                future.cancel()
+            return self._extract_sequential(pdf, backend, pages, texts, deadline)
+
+        results: Dict[int, List[str]] = {0: list(texts)}
+        collected = sum(len(text) for text in texts)
+        pending = set(futures)
+        try:
+            while pending and collected < self.max_chars:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"PDF extraction budget exceeded, {len(pending)} page ranges skipped")
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        range_texts = future.result()
+                    except BrokenProcessPool as e:
+                        logger.warning(f"PDF page range failed: {str(e)}")
+                        _reset_executor()
+                        continue
+                    except Exception as e:
+                        logger.warning(f"PDF page range failed: {str(e)}")
+                        continue
+                    results[futures[future]] = range_texts
+                    collected += sum(len(text) for text in range_texts)
+        finally:
+            # Queued ranges are dropped; running ones stop at the deadline on their own
+            for future in pending:
+                future.cancel()
+
+        return [text for start in sorted(results) for text in results[start]]
+
+    @staticmethod
+    def _rewind(document: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+        if not isinstance(document, str):
+            document.seek(0)
+        return document
@@ -0,0 +1,159 @@
+import logging
+from typing import Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticIndex:
+    """Dense low-rank (LSA) embeddings of the job matrix with an IVF search index.
+
+    The TF-IDF matrix is projected with a truncated SVD, so terms that occur
+    in similar jobs land close together even when a resume and a job share
+    no literal term. Embeddings are L2-normalized, making the dot product a
+    cosine similarity.
+
+    Above ``min_ivf_rows`` jobs, the embeddings are clustered into
+    ``n_lists`` inverted lists and a query only scans the ``n_probe`` lists
+    whose centroids are closest to it; smaller corpora are scanned
+    exhaustively. Everything runs on CPU with scikit-learn and NumPy.
+    """
+
+    def __init__(self, n_components: int = 128, n_lists: Optional[int] = None, n_probe: int = 8,
+                 min_ivf_rows: int = 2000, random_state: int = 0):
+        self.n_components = n_components
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_ivf_rows = min_ivf_rows
+        self.random_state = random_state
+
+        self.svd = None  # TruncatedSVD, once fitted
+        self.embeddings = np.zeros((0, 0), dtype=np.float32)
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.zeros(0, dtype=np.int64)
+        # Index state this was built from; see JobMatcher._semantic_index
+        self.generation: Optional[int] = None
+
+        self._list_order: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+
+    @property
+    def size(self) -> int:
+        """Number of embedded rows (including tombstoned ones)."""
+        return self.embeddings.shape[0]
+
+    def fit(self, matrix, generation: Optional[int] = None) -> None:
+        """Fit the projection on a TF-IDF matrix and build the inverted lists."""
+        n_rows, n_terms = matrix.shape
+        self.generation = generation
+        self.svd = None
+        self.centroids = None
+        self.embeddings = np.zeros((n_rows, 0), dtype=np.float32)
+        self.assignments = np.zeros(n_rows, dtype=np.int64)
+        self._list_order = None
+
+        # TruncatedSVD needs fewer components than either dimension
+        n_components = min(self.n_components, n_rows - 1, n_terms - 1)
+        if n_components < 1:
+            return
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.cluster import MiniBatchKMeans
+        self.svd = TruncatedSVD(n_components=n_components, algorithm='randomized',
+                                random_state=self.random_state)
+        self.embeddings = self._normalize(self.svd.fit_transform(matrix))
+
+        if n_rows >= self.min_ivf_rows:
+            n_lists = self.n_lists or int(np.sqrt(n_rows))
+            kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=self.random_state,
+                                     batch_size=4096, n_init=3)
+            self.assignments = kmeans.fit_predict(self.embeddings).astype(np.int64)
+            self.centroids = self._normalize(kmeans.cluster_centers_)
+        logger.info(f"Semantic index fitted: {n_rows} rows, {n_components} components, "
+                    f"{0 if self.centroids is None else len(self.centroids)} lists")
+
+    def add(self, matrix) -> None:
+        """Embed rows appended to the TF-IDF matrix since the last fit.
+
+        New rows are projected with the existing SVD and assigned to their
+        nearest list; the projection itself is only refreshed by ``fit``.
+        """
+        if matrix.shape[0] == 0:
+            return
+        embeddings = self.embed(matrix)
+        self.embeddings = np.vstack([self.embeddings, embeddings]) if self.size else embeddings
+        if self.centroids is not None:
+            new_assignments = np.argmax(embeddings @ self.centroids.T, axis=1)
+        else:
+            new_assignments = np.zeros(matrix.shape[0], dtype=np.int64)
+        self.assignments = np.concatenate([self.assignments, new_assignments])
+        self._list_order = None
+
+    def embed(self, matrix) -> np.ndarray:
+        """Project TF-IDF rows into the normalized semantic space."""
+        if self.svd is None:
+            return np.zeros((matrix.shape[0], self.embeddings.shape[1]), dtype=np.float32)
+        return self._normalize(self.svd.transform(matrix))
+
+    def search(self, query: np.ndarray, k: int, active: Optional[np.ndarray] = None,
+               n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k rows by cosine similarity to an embedded query.
+
+        ``active`` masks out tombstoned rows. Returns rows and similarities,
+        best first.
+        """
+        if self.centroids is None:
+            return self.search_exact(query, k, active)
+
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        order, offsets = self._inverted_lists()
+        rows = np.concatenate([order[offsets[index]:offsets[index + 1]] for index in lists])
+        return self._top_k(rows, query, k, active)
+
+    def search_exact(self, query: np.ndarray, k: int,
+                     active: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Exhaustive top-k by cosine similarity; the reference for recall."""
+        return self._top_k(np.arange(self.size), query, k, active)
+
+    def recall_at_k(self, queries: np.ndarray, k: int = 10, active: Optional[np.ndarray] = None,
+                    n_probe: Optional[int] = None) -> float:
+        """Mean fraction of the exact top-k that the approximate search returns."""
+        if len(queries) == 0:
+            return 1.0
+        recalls = []
+        for query in queries:
+            exact, _ = self.search_exact(query, k, active)
+            if len(exact) == 0:
+                continue
+            approximate, _ = self.search(query, k, active, n_probe)
+            recalls.append(len(np.intersect1d(exact, approximate)) / len(exact))
+        return float(np.mean(recalls)) if recalls else 1.0
+
+    def _top_k(self, rows: np.ndarray, query: np.ndarray, k: int,
+               active: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        if active is not None and len(rows):
+            rows = rows[active[rows]]
+        if k <= 0 or len(rows) == 0 or self.embeddings.shape[1] == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        scores = self.embeddings[rows] @ query
+        if len(rows) > k:
+            selected = np.argpartition(-scores, k - 1)[:k]
+        else:
+            selected = np.arange(len(rows))
+        # Ties go to the lower row, as in the sparse scorer
+        order = selected[np.lexsort((rows[selected], -scores[selected]))]
+        return rows[order].astype(np.int64), scores[order].astype(np.float64)
+
+    def _inverted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._list_order is None:
+            self._list_order = np.argsort(self.assignments, kind='stable')
+            self._list_offsets = np.searchsorted(
+                self.assignments[self._list_order], np.arange(len(self.centroids) + 1)
+            )
+        return self._list_order, self._list_offsets
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
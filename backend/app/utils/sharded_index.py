@@ -0,0 +1,315 @@
+import os
+import logging
+import threading
+import weakref
+import multiprocessing
+from multiprocessing import shared_memory, resource_tracker
+from typing import List, Dict, Any, Optional, Tuple
+from scipy import sparse
+import numpy as np
+from .job_index import JobIndex, select_top_k, combine_scores, posting_similarities, posting_overlaps
+
+logger = logging.getLogger(__name__)
+
+# Term indices, term weights and norm of a vectorized resume, and its skill ids
+ShardQuery = Tuple[np.ndarray, np.ndarray, float, np.ndarray]
+# Rows, percentages and similarities, best first
+ShardMatches = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ShardError(RuntimeError):
+    """Raised when a shard worker fails or goes away."""
+
+
+def _share(arrays: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, Any]]:
+    """Copy arrays into new shared memory segments; returns the segments and a spec to attach them by."""
+    segments, spec = [], {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        # Zero-sized segments are not allowed
+        segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+        segments.append(segment)
+        spec[name] = (segment.name, array.dtype.str, array.shape)
+    return segments, spec
+
+
+def _unlink(segments: List[shared_memory.SharedMemory], owner: Optional[int] = None) -> None:
+    if owner is not None and owner != os.getpid():
+        return
+    for segment in segments:
+        try:
+            segment.close()
+            segment.unlink()
+        except (OSError, BufferError):
+            pass
+
+
+class _Shard:
+    """A worker's view of its rows: column-major matrices mapped from shared memory."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.segments = []
+        arrays = {}
+        for name, (segment_name, dtype, shape) in spec['arrays'].items():
+            segment = shared_memory.SharedMemory(name=segment_name)
+            self.segments.append(segment)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+
+        n_rows = len(arrays['row_norms'])
+        self.offset = spec['offset']
+        self.n_rows = spec['n_rows']
+        self.columns = sparse.csc_matrix(
+            (arrays['columns_data'], arrays['columns_indices'], arrays['columns_indptr']),
+            shape=(n_rows, spec['n_terms']), copy=False
+        )
+        self.skill_columns = sparse.csc_matrix(
+            (np.ones(len(arrays['skill_indices'])), arrays['skill_indices'], arrays['skill_indptr']),
+            shape=(n_rows, spec['n_skills']), copy=False
+        )
+        self.row_norms = arrays['row_norms']
+        self.skill_counts = arrays['skill_counts']
+        self.active = arrays['active']
+        self.active_rows = np.flatnonzero(self.active)
+
+    def top_k(self, query: ShardQuery, k: int, min_score: int) -> Tuple[np.ndarray, ...]:
+        """Local top-k as global rows, plus the first k zero-score rows for padding.
+
+        Mirrors JobMatcher.find_matches: rows sharing a term or a skill are
+        scored, the rest score 0.
+        """
+        term_indices, term_weights, norm, skill_ids = query
+        term_rows, term_similarities = posting_similarities(
+            self.columns, self.row_norms, self.active, term_indices, term_weights, norm
+        )
+        if len(skill_ids) and self.skill_columns.shape[0]:
+            skill_rows, skill_overlaps = posting_overlaps(self.skill_columns, self.active, skill_ids)
+        else:
+            skill_rows, skill_overlaps = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        rows = np.union1d(term_rows, skill_rows).astype(np.int64)
+        similarities = np.zeros(len(rows))
+        similarities[np.searchsorted(rows, term_rows)] = term_similarities
+        overlaps = np.zeros(len(rows), dtype=np.int64)
+        overlaps[np.searchsorted(rows, skill_rows)] = skill_overlaps
+        percentages = combine_scores(similarities, overlaps, self.skill_counts[rows])
+
+        keep = percentages >= max(min_score, 1)
+        top = select_top_k(rows[keep] + self.offset, percentages[keep], k, self.n_rows) - self.offset
+        positions = np.searchsorted(rows, top)
+        pad_rows, pad_similarities = np.zeros(0, dtype=np.int64), np.zeros(0)
+        if min_score <= 0:
+            # The first k zero-score rows lie within the first k + len(kept) active rows
+            window = self.active_rows[:k + int(keep.sum())]
+            pad_rows = window[~np.isin(window, rows[keep])][:k]
+            pad_similarities = np.zeros(len(pad_rows))
+            scored = np.isin(pad_rows, rows)
+            pad_similarities[scored] = similarities[np.searchsorted(rows, pad_rows[scored])]
+        return (top + self.offset, percentages[positions], similarities[positions],
+                pad_rows + self.offset, pad_similarities)
+
+    def close(self) -> None:
+        for segment in self.segments:
+            segment.close()
+
+
+def _shard_worker(connection, parent_end) -> None:
+    """Worker loop: attach shards, score query batches, until told to stop."""
+    # A forked worker inherits the coordinator's end as well; it is closed so
+    # that recv() sees EOF, and the worker exits, if the coordinator dies
+    parent_end.close()
+    shard: Optional[_Shard] = None
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        command = message[0]
+        if command == 'stop':
+            break
+        try:
+            if command == 'load':
+                if shard is not None:
+                    shard.close()
+                shard = _Shard(message[1])
+                connection.send(('ok', None))
+            elif command == 'score':
+                _, queries, k, min_score = message
+                connection.send(('ok', [shard.top_k(query, k, min_score) for query in queries]))
+            else:
+                connection.send(('error', f"Unknown command: {command}"))
+        except Exception as e:
+            connection.send(('error', f"{type(e).__name__}: {str(e)}"))
+    if shard is not None:
+        shard.close()
+
+
+class ShardedIndex:
+    """Scatter-gather scoring of a JobIndex split by row range across worker processes.
+
+    publish() copies each shard's slice of the job matrix, in column-major
+    form, into shared memory and has one worker process per shard attach
+    it. top_k() sends a batch of queries to every shard at once; each
+    returns its local top-k and the merge reproduces exactly the ranking
+    of the unsharded index (shards hold contiguous row ranges, so ties
+    still break by row order).
+
+    Workers are started on first publish, so each forked server process
+    gets its own. Only one scatter-gather round runs at a time.
+    """
+
+    def __init__(self, n_shards: int, start_method: Optional[str] = None):
+        if n_shards < 1:
+            raise ValueError('n_shards must be at least 1')
+        self.n_shards = n_shards
+        self.start_method = start_method
+        # (id, version) of the published index
+        self.published: Optional[Tuple[int, int]] = None
+        self.n_rows = 0
+        self._workers: List[Tuple[Any, Any]] = []
+        self._lock = threading.Lock()
+        self._claim()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def is_current(self, index: JobIndex) -> bool:
+        """Whether the shards hold this index as it is now."""
+        return self._pid == os.getpid() and self.published == (id(index), index.version)
+
+    def publish(self, index: JobIndex) -> None:
+        """Split the index's current rows across the shards, replacing what they held."""
+        with self._lock:
+            self._ensure_workers()
+            n_rows = index.matrix.shape[0] if index.matrix is not None else 0
+            n_terms = index.matrix.shape[1] if index.matrix is not None else 0
+            bounds = np.linspace(0, n_rows, self.n_shards + 1).astype(np.int64)
+            segments, messages = [], []
+            try:
+                for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                    if index.matrix is not None and n_rows:
+                        columns = index.matrix[lo:hi].tocsc()
+                        skill_columns = index.skill_matrix[lo:hi].tocsc()
+                    else:
+                        columns = sparse.csc_matrix((hi - lo, n_terms))
+                        skill_columns = sparse.csc_matrix((hi - lo, 0))
+                    columns.sort_indices()
+                    skill_columns.sort_indices()
+                    shard_segments, arrays = _share({
+                        'columns_data': columns.data,
+                        'columns_indices': columns.indices,
+                        'columns_indptr': columns.indptr,
+                        'skill_indices': skill_columns.indices,
+                        'skill_indptr': skill_columns.indptr,
+                        'row_norms': index.row_norms[lo:hi],
+                        'skill_counts': index.skill_counts[lo:hi],
+                        'active': index.active_mask[lo:hi],
+                    })
+                    segments.extend(shard_segments)
+                    messages.append(('load', {
+                        'arrays': arrays, 'offset': lo, 'n_rows': n_rows,
+                        'n_terms': n_terms, 'n_skills': skill_columns.shape[1],
+                    }))
+                self._round(messages)
+            except Exception:
+                _unlink(segments)
+                raise
+
+            # Workers have moved to the new segments
+            _unlink(self._segments)
+            self._segments[:] = segments
+            self.n_rows = n_rows
+            self.published = (id(index), index.version)
+        logger.info(f"Job index published to {self.n_shards} shards: {n_rows} rows")
+
+    def top_k(self, queries: List[ShardQuery], k: int, min_score: int = 0) -> List[ShardMatches]:
+        """Merged top-k rows, percentages and similarities per query, padded like find_matches."""
+        with self._lock:
+            if not self._workers or self._pid != os.getpid():
+                raise ShardError('Shards have not been published')
+            replies = self._round([('score', queries, k, min_score)] * self.n_shards)
+
+        results = []
+        for position in range(len(queries)):
+            parts = [reply[position] for reply in replies]
+            rows = np.concatenate([part[0] for part in parts])
+            percentages = np.concatenate([part[1] for part in parts])
+            similarities = np.concatenate([part[2] for part in parts])
+
+            top = select_top_k(rows, percentages, k, max(1, self.n_rows))
+            order = np.argsort(rows)
+            positions = order[np.searchsorted(rows[order], top)]
+            top_rows, top_percentages, top_similarities = top, percentages[positions], similarities[positions]
+            if len(top) < k and min_score <= 0:
+                # Shards hold ascending row ranges, so concatenation keeps row order
+                pad_rows = np.concatenate([part[3] for part in parts])[:k - len(top)].astype(np.int64)
+                pad_similarities = np.concatenate([part[4] for part in parts])[:k - len(top)]
+                top_rows = np.concatenate([top_rows, pad_rows])
+                top_percentages = np.concatenate([top_percentages, np.zeros(len(pad_rows), dtype=np.int64)])
+                top_similarities = np.concatenate([top_similarities, pad_similarities])
+            results.append((top_rows, top_percentages, top_similarities))
+        return results
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        with self._lock:
+            self._stop_workers()
+            _unlink(self._segments)
+            self._segments[:] = []
+            self.published = None
+
+    def _ensure_workers(self) -> None:
+        if self._pid != os.getpid():
+            # Forked: the workers and segments belong to the parent process
+            self._workers = []
+            self._claim()
+        if self._workers and all(process.is_alive() for process, _ in self._workers):
+            return
+        self._stop_workers()
+        # Started before the workers, so they share it: a tracker of their
+        # own would unlink the segments they attach when they exit
+        resource_tracker.ensure_running()
+        context = multiprocessing.get_context(self.start_method)
+        for shard in range(self.n_shards):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=_shard_worker, args=(child_end, parent_end),
+                                      name=f'job-shard-{shard}', daemon=True)
+            process.start()
+            child_end.close()
+            self._workers.append((process, parent_end))
+        self.published = None
+
+    def _claim(self) -> None:
+        self._pid = os.getpid()
+        self._segments: List[shared_memory.SharedMemory] = []
+        # Unlinks the segments if close() is never called; not in a fork of this process
+        self._finalizer = weakref.finalize(self, _unlink, self._segments, self._pid)
+
+    def _stop_workers(self) -> None:
+        for process, connection in self._workers:
+            try:
+                connection.send(('stop',))
+            except (OSError, ValueError):
+                pass
+            connection.close()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
+
+    def _round(self, messages: List[Tuple[Any, ...]]) -> List[Any]:
+        """Send one message to each shard, then collect every reply; shards work in parallel."""
+        try:
+            for (_, connection), message in zip(self._workers, messages):
+                connection.send(message)
+            replies = [connection.recv() for _, connection in self._workers]
+        except (OSError, EOFError) as e:
+            # A half-finished round leaves replies queued; start over
+            self._stop_workers()
+            self.published = None
+            raise ShardError(f"Shard worker failed: {str(e)}")
+        errors = [payload for status, payload in replies if status != 'ok']
+        if errors:
+            raise ShardError(f"Shard worker failed: {errors[0]}")
+        return [payload for _, payload in replies]
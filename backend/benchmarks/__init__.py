@@ -0,0 +1,6 @@
+"""Benchmarks for the resume parsing and job matching backend.
+
+Run from the backend directory:
+    python -m benchmarks.run --scales 1k,10k -o results.json
+    python -m benchmarks.compare before.json after.json
+"""
@@ -0,0 +1,73 @@
+"""Compare two benchmark results files stage by stage.
+
+Usage (from the backend directory):
+    python -m benchmarks.compare before.json after.json [--threshold 10]
+
+Exits with status 1 if any mean stage latency regressed by more than the
+threshold (in percent), so it can gate a CI job.
+"""
+import sys
+import json
+import argparse
+from typing import Dict, Any, List, Tuple
+
+from benchmarks.run import STAGES
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _change(before: float, after: float) -> float:
+    return 100.0 * (after - before) / before if before else 0.0
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any]) -> List[Tuple[str, float, float, float]]:
+    """Rows of (metric, before, after, % change) for metrics present in both runs."""
+    rows = []
+    for scale, after_scale in after['scales'].items():
+        before_scale = before['scales'].get(scale)
+        if before_scale is None:
+            continue
+        for metric in ('index_build_seconds', 'peak_rss_mb'):
+            rows.append((f'{scale} {metric}', before_scale[metric], after_scale[metric],
+                         _change(before_scale[metric], after_scale[metric])))
+        for file_format, after_format in after_scale['formats'].items():
+            before_format = before_scale['formats'].get(file_format)
+            if before_format is None:
+                continue
+            for stage in STAGES:
+                old = before_format['stages'].get(stage, {}).get('mean_ms')
+                new = after_format['stages'].get(stage, {}).get('mean_ms')
+                if old is not None and new is not None:
+                    rows.append((f'{scale} {file_format} {stage} mean_ms', old, new, _change(old, new)))
+            old, new = before_format['documents_per_second'], after_format['documents_per_second']
+            # Lower throughput is the regression, so the sign is flipped
+            rows.append((f'{scale} {file_format} documents_per_second', old, new, -_change(old, new)))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compare two benchmark results files.')
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='percent slowdown reported as a regression')
+    args = parser.parse_args(argv)
+
+    before, after = _load(args.before), _load(args.after)
+    print(f"before: {before.get('commit')}  after: {after.get('commit')}")
+    regressions = 0
+    for metric, old, new, change in compare(before, after):
+        flag = ''
+        # Memory and latency regress upwards; see compare() for throughput
+        if change > args.threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print(f"{metric:<48} {old:>12.3f} {new:>12.3f} {change:>+8.1f}%{flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Compare streaming DOCX extraction with the python-docx object model.
+
+Usage (from the backend directory):
+    python -m benchmarks.docx_extract --resumes 200 --jobs-per-resume 3,30
+
+Renders synthetic resumes as DOCX, as plain paragraphs and with the
+experience bullets in tables, and times FileHandler's streaming path
+against the python-docx fallback on the same documents. Reports
+documents/sec, MB/sec of document XML and how many extractions reproduce
+the source text in reading order, and exits with status 1 if the
+streaming path loses text the python-docx path finds.
+"""
+import io
+import sys
+import time
+import random
+import zipfile
+import argparse
+from typing import Callable, List, Tuple
+
+from app.utils.file_handler import FileHandler
+from app.utils.docx_extractor import DOCUMENT_PART
+from benchmarks.generators import generate_resume, to_docx
+
+
+def build_corpus(count: int, jobs_per_resume: int, tables: bool, seed: int) -> List[Tuple[str, bytes]]:
+    rng = random.Random(seed)
+    texts = [generate_resume(rng, n_jobs=jobs_per_resume) for _ in range(count)]
+    return [(text, to_docx(text, tables=tables)) for text in texts]
+
+
+def xml_megabytes(documents: List[bytes]) -> float:
+    total = 0
+    for document in documents:
+        with zipfile.ZipFile(io.BytesIO(document)) as archive:
+            total += archive.getinfo(DOCUMENT_PART).file_size
+    return total / 1e6
+
+
+def timed(extract: Callable[[io.BytesIO], str], documents: List[bytes], repeat: int) -> Tuple[List[str], float]:
+    """Texts and best-of-``repeat`` seconds for extracting every document."""
+    best = None
+    for _ in range(repeat):
+        streams = [io.BytesIO(document) for document in documents]
+        started = time.perf_counter()
+        texts = [extract(stream) for stream in streams]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return texts, best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark DOCX text extraction.')
+    parser.add_argument('--resumes', type=int, default=200)
+    parser.add_argument('--jobs-per-resume', default='3,30',
+                        help='comma-separated experience entries per resume (document sizes)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per configuration; the best is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    file_handler = FileHandler()
+    # Outside the timings: the fallback imports python-docx on first use
+    file_handler.warm_up()
+    failures = 0
+    for jobs_per_resume in [int(value) for value in args.jobs_per_resume.split(',') if value.strip()]:
+        for tables in (False, True):
+            corpus = build_corpus(args.resumes, jobs_per_resume, tables, args.seed)
+            sources = [text.strip() for text, _ in corpus]
+            documents = [document for _, document in corpus]
+            megabytes = xml_megabytes(documents)
+            print(f"{len(documents)} resumes, {jobs_per_resume} jobs each, "
+                  f"{'tables' if tables else 'paragraphs'}: {megabytes / len(documents) * 1000:.1f} KB XML per document")
+
+            rates = {}
+            for name, extract in (('python-docx', file_handler._extract_from_docx_model),
+                                  ('streaming', file_handler._extract_from_docx)):
+                texts, seconds = timed(extract, documents, args.repeat)
+                rates[name] = len(documents) / seconds
+                in_order = sum(text == source for text, source in zip(texts, sources))
+                print(f"  {name:<12} {rates[name]:>9.1f} docs/sec {megabytes / seconds:>8.1f} MB/sec  "
+                      f"source text in order: {in_order}/{len(documents)}")
+                if name == 'python-docx':
+                    expected = texts
+            lost = sum(
+                sorted(filter(None, text.split('\n'))) != sorted(filter(None, want.split('\n')))
+                for text, want in zip(texts, expected)
+            )
+            failures += lost
+            print(f"  speedup x{rates['streaming'] / rates['python-docx']:.2f}, "
+                  f"{lost} documents whose lines differ from python-docx")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
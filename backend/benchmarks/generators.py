@@ -0,0 +1,175 @@
+"""Seeded generators for synthetic resumes (text, DOCX, PDF) and job corpora."""
+import io
+import random
+from typing import List, Dict, Any, Iterator
+from docx import Document
+
+FIRST_NAMES = ['Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn', 'Drew',
+               'Maria', 'Wei', 'Priya', 'Omar', 'Elena', 'Kenji', 'Fatima', 'Lucas', 'Amara', 'Sven']
+LAST_NAMES = ['Smith', 'Johnson', 'Garcia', 'Chen', 'Patel', 'Nguyen', 'Kim', 'Okafor', 'Muller', 'Rossi',
+              'Silva', 'Cohen', 'Ivanova', 'Tanaka', 'Haddad', 'Larsen', 'Novak', 'Brown', 'Lopez', 'Singh']
+CITIES = ['San Francisco, CA', 'New York, NY', 'Austin, TX', 'Seattle, WA', 'Boston, MA', 'Denver, CO',
+          'Chicago, IL', 'Atlanta, GA', 'Remote', 'Portland, OR']
+COMPANIES = ['Innovation Labs', 'Growth Solutions', 'Creative Agency', 'Data Solutions Inc', 'Cloud Systems',
+             'Acme Corp', 'Blue Harbor', 'Northwind', 'Globex', 'Initech', 'Umbrella Analytics', 'Stark Digital']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Frontend Developer', 'Backend Developer',
+          'Full Stack Engineer', 'Data Scientist', 'DevOps Engineer', 'Machine Learning Engineer',
+          'Python Developer', 'React Developer', 'Site Reliability Engineer', 'Data Engineer']
+LEVELS = ['Junior', 'Mid', 'Senior', 'Lead']
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract']
+DEGREES = ['Bachelor of Science', 'Master of Science', 'Bachelor of Arts', 'PhD', 'MBA']
+FIELDS = ['Computer Science', 'Software Engineering', 'Mathematics', 'Statistics', 'Electrical Engineering',
+          'Information Systems']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'Polytechnic University']
+SKILLS = ['Python', 'JavaScript', 'TypeScript', 'Java', 'Go', 'Rust', 'C++', 'C#', 'Ruby', 'PHP', 'SQL',
+          'React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring', 'Express',
+          'HTML', 'CSS', 'SASS', 'Redux', 'GraphQL', 'REST APIs',
+          'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform', 'Jenkins', 'Linux', 'Bash', 'Git',
+          'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Kafka',
+          'Machine Learning', 'Pandas', 'NumPy', 'TensorFlow', 'PyTorch', 'Scikit-learn', 'Spark']
+VERBS = ['Built', 'Designed', 'Led', 'Maintained', 'Migrated', 'Optimized', 'Shipped', 'Scaled', 'Automated',
+         'Refactored', 'Owned', 'Launched']
+OBJECTS = ['a customer-facing web application', 'the payments service', 'data pipelines', 'internal tooling',
+           'the CI/CD pipeline', 'a recommendation engine', 'the public API', 'monitoring and alerting',
+           'the mobile backend', 'an analytics dashboard', 'search infrastructure', 'the design system']
+OUTCOMES = ['reducing latency by {n}%', 'serving {n}k daily users', 'cutting cloud costs by {n}%',
+            'improving conversion by {n}%', 'with a team of {n} engineers', 'handling {n}M events per day']
+
+
+def generate_resume(rng: random.Random, n_jobs: int = 3) -> str:
+    """One resume as plain text, with contact, summary, skills, experience and education sections."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    skills = rng.sample(SKILLS, rng.randint(6, 14))
+    title = rng.choice(TITLES)
+    lines = [
+        f'{first} {last}',
+        f'{first.lower()}.{last.lower()}@example.com | ({rng.randint(200, 989)}) '
+        f'{rng.randint(200, 999)}-{rng.randint(1000, 9999)} | {rng.choice(CITIES)}',
+        f'linkedin.com/in/{first.lower()}{last.lower()} | github.com/{first.lower()}{rng.randint(1, 99)}',
+        '',
+        'Summary',
+        f'{title} with {rng.randint(2, 15)} years of experience in {", ".join(skills[:3])}. '
+        f'{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}.',
+        '',
+        'Skills',
+        ', '.join(skills),
+        '',
+        'Experience',
+    ]
+    year = 2024
+    for _ in range(n_jobs):
+        start = year - rng.randint(1, 5)
+        end = 'Present' if year == 2024 else str(year)
+        lines.append(f'{rng.choice(TITLES)} at {rng.choice(COMPANIES)} {start} - {end}')
+        for _ in range(rng.randint(2, 4)):
+            lines.append(f'- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)}, '
+                         f'{rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}.')
+        year = start
+    lines += [
+        '',
+        'Education',
+        f'{rng.choice(DEGREES)} in {rng.choice(FIELDS)}, {rng.choice(SCHOOLS)} {year - rng.randint(0, 2)}',
+    ]
+    return '\n'.join(lines)
+
+
+def generate_resumes(count: int, seed: int = 0) -> List[str]:
+    """``count`` plain-text resumes, identical for the same seed."""
+    rng = random.Random(seed)
+    return [generate_resume(rng) for _ in range(count)]
+
+
+def to_docx(text: str, tables: bool = False) -> bytes:
+    """Render resume text as a DOCX, one paragraph per line.
+
+    With ``tables``, each run of ``- `` bullet lines becomes a two-column
+    table (marker, text) instead, as in table-based resume templates.
+    """
+    document = Document()
+    table = None
+    for line in text.split('\n'):
+        if not (tables and line.startswith('- ')):
+            document.add_paragraph(line)
+            table = None
+            continue
+        if table is None:
+            table = document.add_table(rows=0, cols=2)
+        cells = table.add_row().cells
+        cells[0].text, cells[1].text = '-', line[2:]
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def to_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """Render resume text as a minimal PDF (Helvetica, one text line per line).
+
+    Written by hand so the benchmarks need no PDF library beyond the
+    extractors under test.
+    """
+    lines = text.split('\n')
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Object 1: catalog, 2: page tree, 3: font, then a page and content stream per page
+    objects = []
+    page_ids = [4 + 2 * index for index in range(len(pages))]
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects.append(f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode())
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    for page_id, page_lines in zip(page_ids, pages):
+        stream = ['BT', '/F1 10 Tf', '14 TL', '50 770 Td']
+        stream += [f'({_pdf_escape(line)}) Tj T*' for line in page_lines]
+        stream.append('ET')
+        content = '\n'.join(stream).encode('latin-1')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>'.encode())
+        objects.append(b'<< /Length ' + str(len(content)).encode() + b' >>\nstream\n' + content + b'\nendstream')
+
+    output = io.BytesIO()
+    output.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f'{number} 0 obj\n'.encode() + body + b'\nendobj\n')
+    xref = output.tell()
+    output.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    for offset in offsets:
+        output.write(f'{offset:010d} 00000 n \n'.encode())
+    output.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return output.getvalue()
+
+
+def generate_job(rng: random.Random, job_id: int) -> Dict[str, Any]:
+    """One job posting in the shape JobMatcher expects."""
+    title = rng.choice(TITLES)
+    level = rng.choice(LEVELS)
+    skills = rng.sample(SKILLS, rng.randint(4, 9))
+    low = rng.randint(60, 180)
+    return {
+        'id': str(job_id),
+        'title': f'{level} {title}' if level != 'Mid' else title,
+        'company': rng.choice(COMPANIES),
+        'location': rng.choice(CITIES),
+        'type': rng.choice(JOB_TYPES),
+        'salary': f'${low}k - ${low + rng.randint(10, 50)}k',
+        'description': f'{rng.choice(COMPANIES)} is hiring a {title.lower()} to work on {rng.choice(OBJECTS)} '
+                       f'and {rng.choice(OBJECTS)} with {", ".join(skills[:3])}.',
+        'requirements': [f'{rng.randint(1, 8)}+ years of {skill} experience' for skill in skills[:3]]
+                        + [f'Experience with {rng.choice(OBJECTS)}'],
+        'skills': skills,
+        'remote_friendly': rng.random() < 0.4,
+        'experience_level': level,
+    }
+
+
+def generate_jobs(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Stream ``count`` job postings, identical for the same seed."""
+    rng = random.Random(seed)
+    for job_id in range(1, count + 1):
+        yield generate_job(rng, job_id)
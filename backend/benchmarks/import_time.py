@@ -0,0 +1,74 @@
+"""Check that importing the app stays fast and leaves heavy dependencies unloaded.
+
+Usage (from the backend directory):
+    python -m benchmarks.import_time [--budget 1.0] [--module main]
+
+Imports the module in a fresh interpreter under ``python -X importtime``
+(with ``PRELOAD`` off) and exits with status 1 if the import took longer
+than the budget or pulled in any of the deferred packages, so it can gate
+a CI job.
+"""
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+# Imported on first use; see ResumeParser.load_model, JobIndex.fit, FileHandler
+DEFERRED = ('spacy', 'sklearn', 'pdfplumber', 'PyPDF2', 'docx', 'sqlalchemy')
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every module imported by ``import module``."""
+    env = dict(os.environ, PRELOAD='false', PRELOAD_MODEL='false')
+    env.pop('DATABASE_URL', None)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env, check=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def top_level_costs(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Self time summed per top-level package, in microseconds."""
+    costs: Dict[str, int] = {}
+    for name, self_us, _ in rows:
+        package = name.split('.')[0]
+        costs[package] = costs.get(package, 0) + self_us
+    return costs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Check the import time budget of the app.')
+    parser.add_argument('--module', default='main')
+    parser.add_argument('--budget', type=float, default=1.0, help='seconds')
+    parser.add_argument('--top', type=int, default=10, help='slowest packages to list')
+    args = parser.parse_args(argv)
+
+    rows = measure(args.module)
+    total = next((cumulative for name, _, cumulative in rows if name == args.module), 0) / 1e6
+    print(f"import {args.module}: {total:.3f}s (budget {args.budget:.3f}s)")
+    for package, self_us in sorted(top_level_costs(rows).items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {package:<32} {self_us / 1000:>9.1f} ms")
+
+    failures = 0
+    if total > args.budget:
+        print(f"FAIL: import took {total:.3f}s, over the {args.budget:.3f}s budget")
+        failures += 1
+    loaded = sorted({name.split('.')[0] for name, _, _ in rows} & set(DEFERRED))
+    if loaded:
+        print(f"FAIL: deferred packages imported eagerly: {', '.join(loaded)}")
+        failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
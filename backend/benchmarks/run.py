@@ -0,0 +1,262 @@
+"""Measure per-stage latency, throughput and peak RSS over synthetic resumes and job corpora.
+
+Usage (from the backend directory):
+    python -m benchmarks.run --scales 1k,10k --resumes 50 -o results.json
+
+Each corpus scale runs in a fresh process so its peak RSS is its own. The
+results file records the git commit, so runs can be compared with
+``python -m benchmarks.compare``.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import resource
+import argparse
+import logging
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from app.models.resume_data import ResumeData
+from app.parsers.resume_parser import ResumeParser, DEFAULT_MODEL
+from app.parsers.section_segmenter import segment
+from app.serialization import dumps
+from app.utils.file_handler import FileHandler
+from app.utils.job_matcher import JobMatcher
+from benchmarks.generators import generate_resumes, generate_jobs, to_docx, to_pdf
+
+logger = logging.getLogger('benchmarks')
+
+SCALES = {'1k': 1000, '10k': 10000, '100k': 100000, '1m': 1000000}
+FORMATS = ('txt', 'docx', 'pdf')
+STAGES = ('extract', 'clean', 'ner', 'skills', 'fields', 'match', 'serialize')
+
+
+def parse_scale(value: str) -> int:
+    """'10k' -> 10000; plain integers are accepted too."""
+    value = value.strip().lower()
+    if value in SCALES:
+        return SCALES[value]
+    multiplier = {'k': 1000, 'm': 1000000}.get(value[-1:], 1)
+    return int(float(value.rstrip('km')) * multiplier)
+
+
+def git_commit() -> Dict[str, Any]:
+    """Commit of the working tree and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary of per-document stage timings (seconds in, milliseconds out)."""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return round(1000 * ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {
+        'count': len(ordered),
+        'mean_ms': round(1000 * sum(ordered) / len(ordered), 3),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'max_ms': round(1000 * ordered[-1], 3),
+    }
+
+
+def render(texts: List[str], file_format: str) -> List[bytes]:
+    if file_format == 'docx':
+        return [to_docx(text) for text in texts]
+    if file_format == 'pdf':
+        return [to_pdf(text) for text in texts]
+    return [text.encode('utf-8') for text in texts]
+
+
+def process_document(content: bytes, file_format: str, file_handler: FileHandler,
+                     resume_parser: ResumeParser, job_matcher: JobMatcher, k: int) -> Dict[str, float]:
+    """Run one document through every stage, timing each.
+
+    Mirrors ResumeParser.parse and ResumePipeline.finish step by step so
+    the cost of each stage can be attributed.
+    """
+    timings = {}
+    started = time.perf_counter()
+    if file_format == 'txt':
+        text = content.decode('utf-8')
+    else:
+        text = file_handler.extract_text(memoryview(content), file_format)
+    timings['extract'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cleaned_text = resume_parser._clean_text(text)
+    timings['clean'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    doc = resume_parser.nlp(resume_parser._header(cleaned_text))
+    timings['ner'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    resume_data = ResumeData(raw_text=text)
+    sections = segment(text)
+    resume_data.skills = resume_parser._extract_skills(sections, doc)
+    resume_data.skill_categories = resume_parser._categorize_skills(resume_data.skills)
+    timings['skills'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    resume_data.personal_info = resume_parser._extract_personal_info(sections, doc)
+    resume_data.experience = resume_parser._extract_experience(sections, doc)
+    resume_data.education = resume_parser._extract_education(sections, doc)
+    resume_data.summary = resume_parser._extract_summary(sections, doc)
+    resume_data.confidence_score = resume_parser._calculate_confidence_score(resume_data)
+    timings['fields'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    job_matches = job_matcher.find_matches(resume_data, k=k)
+    timings['match'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dumps({'resume': resume_data.to_dict(), 'job_matches': job_matches})
+    timings['serialize'] = time.perf_counter() - started
+    return timings
+
+
+def run_scale(n_jobs: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Benchmark every resume format against a job corpus of ``n_jobs`` postings."""
+    logging.basicConfig(level=logging.WARNING)
+    result: Dict[str, Any] = {'jobs': n_jobs}
+
+    started = time.perf_counter()
+    jobs = list(generate_jobs(n_jobs, seed=args.seed))
+    result['job_generation_seconds'] = round(time.perf_counter() - started, 3)
+
+    job_matcher = JobMatcher()
+    started = time.perf_counter()
+    job_matcher.index.fit(jobs)
+    result['index_build_seconds'] = round(time.perf_counter() - started, 3)
+    result['vocabulary_size'] = len(job_matcher.index.vocabulary)
+    del jobs
+
+    started = time.perf_counter()
+    resume_parser = ResumeParser(model_name=args.spacy_model)
+    resume_parser.warm_up()
+    result['model_load_seconds'] = round(time.perf_counter() - started, 3)
+    file_handler = FileHandler()
+
+    texts = generate_resumes(args.resumes, seed=args.seed)
+    result['formats'] = {}
+    for file_format in args.formats:
+        documents = render(texts, file_format)
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        for content in documents[:args.warmup]:
+            process_document(content, file_format, file_handler, resume_parser, job_matcher, args.k)
+
+        started = time.perf_counter()
+        for content in documents:
+            for stage, seconds in process_document(content, file_format, file_handler,
+                                                   resume_parser, job_matcher, args.k).items():
+                samples[stage].append(seconds)
+        elapsed = time.perf_counter() - started
+
+        result['formats'][file_format] = {
+            'documents': len(documents),
+            'elapsed_seconds': round(elapsed, 3),
+            'documents_per_second': round(len(documents) / elapsed, 2) if elapsed else 0.0,
+            'stages': {stage: summarize(samples[stage]) for stage in STAGES},
+        }
+
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    report = {
+        **git_commit(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {
+            'resumes': args.resumes, 'formats': list(args.formats), 'k': args.k,
+            'seed': args.seed, 'spacy_model': args.spacy_model,
+        },
+        'scales': {},
+    }
+    for label in args.scales:
+        n_jobs = parse_scale(label)
+        logger.info(f"Benchmarking {n_jobs} jobs")
+        if args.isolate:
+            # A fresh interpreter per scale, so peak RSS is not carried over
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_scale, n_jobs, args).result()
+        else:
+            result = run_scale(n_jobs, args)
+        report['scales'][label] = result
+        logger.info(f"{label}: " + ', '.join(
+            f"{file_format} {data['documents_per_second']} docs/sec"
+            for file_format, data in result['formats'].items()
+        ) + f", peak RSS {result['peak_rss_mb']} MB")
+    return report
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Benchmark parsing and matching on synthetic data.')
+    parser.add_argument('--scales', default='1k,10k',
+                        help='comma-separated job corpus sizes, e.g. 1k,10k,100k,1m')
+    parser.add_argument('--resumes', type=int, default=50, help='resumes per format')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='comma-separated resume formats')
+    parser.add_argument('--warmup', type=int, default=3, help='untimed documents per format')
+    parser.add_argument('-k', type=int, default=10, help='job matches per resume')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--spacy-model', default=os.environ.get('SPACY_MODEL', DEFAULT_MODEL))
+    parser.add_argument('--no-isolate', dest='isolate', action='store_false',
+                        help='run every scale in this process')
+    parser.add_argument('-o', '--output', help='write results JSON here (default: stdout)')
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = build_arg_parser().parse_args(argv)
+    args.scales = [scale for scale in args.scales.split(',') if scale.strip()]
+    args.formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    unknown = set(args.formats) - set(FORMATS)
+    if unknown:
+        logger.error(f"Unknown formats: {', '.join(sorted(unknown))}")
+        return 2
+
+    report = run(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        logger.info(f"Results written to {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Measure matching throughput of the sharded job index against the unsharded one.
+
+Usage (from the backend directory):
+    python -m benchmarks.shards --jobs 100k --resumes 500 --shards 1,2,4,8
+
+Matches the same resumes in process (one find_matches call per resume,
+and batched with find_matches_many) and with each shard count, reports
+queries/sec and the speedup over the per-resume path, and exits with
+status 1 if any sharded result differs from find_matches. Speedup is
+bounded by the number of cores; publishing the shards is timed separately.
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+from typing import List, Dict, Any
+
+from app.parsers.resume_parser import ResumeParser, DEFAULT_MODEL
+from app.utils.job_matcher import JobMatcher
+from benchmarks.generators import generate_resumes, generate_jobs
+from benchmarks.run import parse_scale
+
+logger = logging.getLogger('benchmarks')
+
+
+def match_keys(results: List[List[Dict[str, Any]]]) -> List[List[tuple]]:
+    return [[(m['id'], m['match_percentage'], m['similarity_score']) for m in matches] for matches in results]
+
+
+def timed_matches(match, repeat: int):
+    """Result and best-of-``repeat`` seconds of ``match()``."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = match()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return results, best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark sharded job matching.')
+    parser.add_argument('--jobs', default='20k', help='job corpus size, e.g. 20k or 1m')
+    parser.add_argument('--resumes', type=int, default=200)
+    parser.add_argument('--shards', default='1,2,4', help='comma-separated shard counts')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--chunk-size', type=int, default=256, help='resumes per batch (per round sent to the shards)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per configuration; the best is kept')
+    parser.add_argument('--start-method', help='worker start method (default: platform default)')
+    parser.add_argument('--model', default=DEFAULT_MODEL)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    n_jobs = parse_scale(args.jobs)
+    jobs = list(generate_jobs(n_jobs, seed=args.seed))
+    resume_parser = ResumeParser(model_name=args.model)
+    resumes = [resume_parser.parse(text) for text in generate_resumes(args.resumes, seed=args.seed + 1)]
+    print(f"{n_jobs} jobs, {len(resumes)} resumes, k={args.k}, {os.cpu_count()} cpus")
+
+    baseline = JobMatcher()
+    baseline.index.fit(jobs)
+    expected, seconds = timed_matches(
+        lambda: [baseline.find_matches(resume_data, k=args.k) for resume_data in resumes], args.repeat
+    )
+    baseline_rate = len(resumes) / seconds
+    print(f"  {'per resume':<12} {baseline_rate:>10.1f} queries/sec")
+    _, seconds = timed_matches(
+        lambda: baseline.find_matches_many(resumes, k=args.k, chunk_size=args.chunk_size), args.repeat
+    )
+    print(f"  {'batched':<12} {len(resumes) / seconds:>10.1f} queries/sec  x{len(resumes) / seconds / baseline_rate:.2f}")
+
+    failures = 0
+    for n_shards in [int(value) for value in args.shards.split(',') if value.strip()]:
+        job_matcher = JobMatcher(shards=n_shards, shard_start_method=args.start_method)
+        job_matcher.index.fit(jobs)
+        started = time.perf_counter()
+        job_matcher._sharded_index()
+        publish_seconds = time.perf_counter() - started
+        try:
+            results, seconds = timed_matches(
+                lambda: job_matcher.find_matches_many(resumes, k=args.k, chunk_size=args.chunk_size), args.repeat
+            )
+        finally:
+            job_matcher.sharded.close()
+        rate = len(resumes) / seconds
+        identical = match_keys(results) == match_keys(expected)
+        failures += not identical
+        print(f"  {f'{n_shards} shards':<12} {rate:>10.1f} queries/sec  x{rate / baseline_rate:.2f}  "
+              f"publish {publish_seconds:.2f}s  {'identical' if identical else 'MISMATCH'}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Stream a JSONL or CSV job feed into the job store and index.
+
+Usage:
+    python import_jobs.py jobs.jsonl
+    python import_jobs.py feed.csv.gz --chunk-size 10000 --dedupe-threshold 0.9
+    zcat feed.jsonl.gz | python import_jobs.py - --format jsonl --rejects rejects.ndjson
+
+Records are validated against the job schema, reposts of a posting
+already seen (near-duplicates by MinHash/LSH) are skipped, and the rest
+are loaded in chunks, so memory stays flat however large the feed. With
+DATABASE_URL set the jobs are written to the job store, stored candidates
+are re-matched and the index snapshot (INDEX_SNAPSHOT_DIR) is refreshed,
+for API workers to pick up when they next load. Without it the jobs only
+go into an in-memory index, which still checks the feed and measures
+load throughput.
+"""
+import os
+import sys
+import json
+import argparse
+import logging
+from typing import Dict, Any
+
+from app.job_feed import FeedImporter, FEED_FORMATS, detect_format, open_feed, iter_records
+from app.serialization import dumps
+from app.utils.job_matcher import JobMatcher
+from app.utils.minhash import MinHashLSH
+
+logger = logging.getLogger('import_jobs')
+
+
+def build_job_matcher(args: argparse.Namespace) -> JobMatcher:
+    job_store = candidate_store = None
+    if args.database_url:
+        # SQLAlchemy is only imported when there is a database to write to
+        from app.storage.job_store import JobStore
+        from app.storage.candidate_store import CandidateStore
+        job_store = JobStore(args.database_url)
+        if args.rematch:
+            candidate_store = CandidateStore(args.database_url)
+    else:
+        logger.warning("No DATABASE_URL; jobs are loaded into an in-memory index only")
+    job_matcher = JobMatcher(job_store=job_store, snapshot_dir=args.snapshot_dir,
+                             candidate_store=candidate_store, lazy=True)
+    if candidate_store is not None:
+        # Synchronous here: the process exits once the import is done
+        job_matcher.on_jobs_changed = lambda job_ids: job_matcher.rematch_candidates(job_ids)
+    return job_matcher
+
+
+def run(args: argparse.Namespace) -> int:
+    feed_format = args.format or detect_format(args.source)
+    job_matcher = build_job_matcher(args)
+    deduplicator = None
+    if args.dedupe:
+        deduplicator = MinHashLSH(threshold=args.dedupe_threshold, num_perm=args.num_perm)
+
+    rejects = open(args.rejects, 'wb') if args.rejects else None
+
+    def write_reject(entry: Dict[str, Any]) -> None:
+        rejects.write(dumps(entry) + b'\n')
+
+    importer = FeedImporter(
+        job_matcher,
+        chunk_size=args.chunk_size,
+        deduplicator=deduplicator,
+        dedupe_existing=args.dedupe_existing,
+        on_reject=write_reject if rejects else None,
+        progress_every=args.progress_every,
+        dry_run=args.dry_run
+    )
+    stream = open_feed(args.source)
+    try:
+        report = importer.run(iter_records(stream, feed_format, list_separator=args.list_separator))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if rejects:
+            rejects.close()
+
+    if not args.dry_run and job_matcher.save_snapshot():
+        logger.info("Index snapshot refreshed")
+    print(json.dumps(report, indent=2), file=sys.stderr)
+    return 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Import a JSONL or CSV job feed.')
+    parser.add_argument('source', help='.jsonl/.ndjson or .csv feed, optionally gzipped; - reads stdin')
+    parser.add_argument('--format', choices=FEED_FORMATS, help='feed format (default: from the file name)')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='jobs loaded per chunk')
+    parser.add_argument('--list-separator', default='|', help='separator of CSV requirements/skills cells')
+    parser.add_argument('--no-dedupe', dest='dedupe', action='store_false', help='skip near-duplicate detection')
+    parser.add_argument('--dedupe-threshold', type=float, default=0.8,
+                        help='estimated Jaccard similarity of word shingles counted as a repost')
+    parser.add_argument('--num-perm', type=int, default=64, help='MinHash permutations')
+    parser.add_argument('--dedupe-existing', action='store_true',
+                        help='also treat reposts of jobs already in the index as duplicates')
+    parser.add_argument('--rejects', help='NDJSON file invalid and duplicate records are written to')
+    parser.add_argument('--dry-run', action='store_true', help='validate and de-duplicate only, load nothing')
+    parser.add_argument('--no-rematch', dest='rematch', action='store_false',
+                        help='leave stored candidates\' job matches for the API to refresh')
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--snapshot-dir', default=os.environ.get('INDEX_SNAPSHOT_DIR'))
+    parser.add_argument('--progress-every', type=int, default=10000, help='log progress every N records')
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = build_arg_parser().parse_args(argv)
+    try:
+        return run(args)
+    except (ValueError, OSError) as e:
+        logger.error(str(e))
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
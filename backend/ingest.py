@@ -0,0 +1,235 @@
+"""Bulk-ingest a directory or archive of resumes, writing one JSON result per line.
+
+Usage:
+    python ingest.py resumes/ -o results.ndjson
+    python ingest.py resumes.zip -o results.ndjson --workers 8 -k 5
+
+Interrupted runs pick up where they left off: every finished file is
+recorded in a checkpoint next to the output, and is skipped on the next run.
+"""
+import os
+import sys
+import json
+import time
+import tarfile
+import zipfile
+import argparse
+import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from typing import Dict, Any, Iterator, Optional, Set, Tuple, Union
+
+from app.parsers.resume_parser import ResumeParser, DEFAULT_MODEL
+from app.pipeline import ResumePipeline
+from app.serialization import dumps
+from app.utils.file_handler import FileHandler
+from app.utils.pdf_extractor import PdfExtractor
+from app.utils.job_matcher import JobMatcher
+
+logger = logging.getLogger('ingest')
+
+ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
+STAGES = ('read', 'extract', 'parse', 'match')
+
+# Set in each worker process by _init_worker
+_pipeline: Optional[ResumePipeline] = None
+
+
+def _init_worker(pipeline: ResumePipeline) -> None:
+    global _pipeline
+    _pipeline = pipeline
+    if not pipeline.resume_parser.nlp:
+        pipeline.resume_parser.load_model()
+
+
+def _process(name: str, source: Union[str, bytes], k: int, match: bool) -> Dict[str, Any]:
+    """Worker task: read, extract, parse and optionally match one resume."""
+    timings = {}
+    started = time.perf_counter()
+    record: Dict[str, Any] = {'file': name}
+    try:
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                source = f.read()
+        timings['read'] = time.perf_counter() - started
+
+        stage_started = time.perf_counter()
+        text = _pipeline.extract(source, _extension(name))
+        timings['extract'] = time.perf_counter() - stage_started
+
+        stage_started = time.perf_counter()
+        parsed_data = _pipeline.resume_parser.parse(text)
+        timings['parse'] = time.perf_counter() - stage_started
+        record['resume'] = parsed_data.to_dict()
+
+        if match:
+            stage_started = time.perf_counter()
+            record['job_matches'] = _pipeline.job_matcher.find_matches(parsed_data, k=k)
+            timings['match'] = time.perf_counter() - stage_started
+        record['status'] = 'ok'
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = _pipeline.failure(name, e)['error']
+    record['timings'] = timings
+    return record
+
+
+def _extension(name: str) -> str:
+    return name.rsplit('.', 1)[1].lower() if '.' in name else ''
+
+
+def _allowed(name: str) -> bool:
+    return _extension(name) in ALLOWED_EXTENSIONS and not os.path.basename(name).startswith('.')
+
+
+def iter_sources(path: str, skip: Set[str] = frozenset()) -> Iterator[Tuple[str, Union[str, bytes]]]:
+    """Yield (name, path-or-bytes) for each resume in a directory, zip or tar archive.
+
+    Directory entries are yielded as paths for the workers to read; archive
+    members are read one at a time as they are yielded. Names in ``skip``
+    are passed over without being read.
+    """
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                full_path = os.path.join(root, filename)
+                name = os.path.relpath(full_path, path)
+                if _allowed(filename) and name not in skip:
+                    yield name, full_path
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _allowed(info.filename) and info.filename not in skip:
+                    yield info.filename, archive.read(info)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as archive:
+            for member in archive:
+                if member.isfile() and _allowed(member.name) and member.name not in skip:
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        raise ValueError(f"{path} is not a directory, zip or tar archive")
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    """Names of files finished by earlier runs."""
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {line.rstrip('\n') for line in f if line.strip()}
+
+
+def run(args: argparse.Namespace) -> int:
+    checkpoint_path = args.checkpoint or f'{args.output}.checkpoint'
+    done = load_checkpoint(checkpoint_path)
+    if done:
+        logger.info(f"Resuming: {len(done)} files already processed")
+
+    # Files are parsed in parallel already, so each PDF is read in its
+    # parse worker rather than fanning out to the page pool.
+    resume_parser = ResumeParser(model_name=args.spacy_model)
+    pipeline = ResumePipeline(
+        FileHandler(pdf_extractor=PdfExtractor(max_pages=args.pdf_max_pages,
+                                               parallel_threshold=args.pdf_max_pages)),
+        resume_parser,
+        JobMatcher() if args.match else None
+    )
+    # Loaded once here so forked workers share it
+    resume_parser.warm_up()
+
+    totals = {'ok': 0, 'error': 0}
+    stage_seconds: Dict[str, float] = defaultdict(float)
+    started = time.perf_counter()
+
+    def record_result(record: Dict[str, Any]) -> None:
+        output.write(dumps(record) + b'\n')
+        output.flush()
+        # Output first, then checkpoint: a crash in between re-processes the
+        # file rather than losing it.
+        checkpoint.write(record['file'] + '\n')
+        checkpoint.flush()
+        totals[record['status']] += 1
+        for stage, seconds in record['timings'].items():
+            stage_seconds[stage] += seconds
+        processed = totals['ok'] + totals['error']
+        if processed % args.progress_every == 0:
+            rate = processed / (time.perf_counter() - started)
+            logger.info(f"{processed} files processed ({rate:.1f} files/sec)")
+
+    interrupted = False
+    with open(args.output, 'ab') as output, open(checkpoint_path, 'a') as checkpoint, \
+            ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                initargs=(pipeline,)) as executor:
+        in_flight = set()
+        try:
+            for name, source in iter_sources(args.source, skip=done):
+                # Bounded submission keeps memory flat however large the input
+                if len(in_flight) >= args.max_in_flight:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record_result(future.result())
+                in_flight.add(executor.submit(_process, name, source, args.k, args.match))
+
+            for future in as_completed(in_flight):
+                record_result(future.result())
+        except KeyboardInterrupt:
+            interrupted = True
+            logger.warning("Interrupted; finished files are checkpointed, rerun to resume")
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    processed = totals['ok'] + totals['error']
+    report = {
+        'processed': processed,
+        'succeeded': totals['ok'],
+        'failed': totals['error'],
+        'skipped': len(done),
+        'elapsed_seconds': round(elapsed, 3),
+        'files_per_second': round(processed / elapsed, 2) if elapsed else 0.0,
+        # Summed across workers, so they can exceed the wall-clock time
+        'stage_seconds': {stage: round(stage_seconds[stage], 3) for stage in STAGES if stage in stage_seconds},
+        'stage_mean_ms': {
+            stage: round(1000 * stage_seconds[stage] / processed, 2)
+            for stage in STAGES if stage in stage_seconds and processed
+        },
+    }
+    print(json.dumps(report, indent=2), file=sys.stderr)
+    return 130 if interrupted else 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Parse (and match) a directory or archive of resumes.')
+    parser.add_argument('source', help='directory, .zip or .tar(.gz) of PDF/DOC/DOCX resumes')
+    parser.add_argument('-o', '--output', required=True, help='NDJSON file results are appended to')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.checkpoint)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='files queued or in progress at once (default: 4 x workers)')
+    parser.add_argument('-k', '--top-k', dest='k', type=int, default=10, help='job matches per resume')
+    parser.add_argument('--no-match', dest='match', action='store_false', help='parse only, skip job matching')
+    parser.add_argument('--pdf-max-pages', type=int, default=50, help='pages read per PDF')
+    parser.add_argument('--spacy-model', default=os.environ.get('SPACY_MODEL', DEFAULT_MODEL))
+    parser.add_argument('--progress-every', type=int, default=1000, help='log progress every N files')
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = build_arg_parser().parse_args(argv)
+    if args.max_in_flight is None:
+        args.max_in_flight = 4 * args.workers
+    try:
+        return run(args)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
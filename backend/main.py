@@ -1,15 +1,28 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, Response
 from flask_cors import CORS
-from werkzeug.utils import secure_filename
 import os
-import uuid
+import gc
+import hmac
+import time
+import argparse
+import zipfile
 from datetime import datetime
 import logging
 
-from app.parsers.resume_parser import ResumeParser
+from app.parsers.resume_parser import ResumeParser, DEFAULT_MODEL, DEFAULT_EXCLUDED_COMPONENTS, DEFAULT_NER_HEADER_CHARS
 from app.models.resume_data import ResumeData
+from app.pipeline import ResumePipeline, ExtractionError
+from app.parse_queue import ParseQueue, QueueFull, QueueUnavailable
+from app.rematcher import Rematcher
+from app.job_feed import validate_job
 from app.utils.file_handler import FileHandler
-from app.utils.job_matcher import JobMatcher
+from app.utils.pdf_extractor import PdfExtractor
+from app.utils.job_matcher import JobMatcher, MATCH_MODES, TFIDF
+from app.utils.semantic_index import SemanticIndex
+from app.storage.parse_cache import ParseCache
+from app.metrics import REGISTRY, HTTP_REQUEST_SECONDS, HTTP_REQUESTS, time_stage
+from app.request_profiler import RequestProfiler
+from app.serialization import FastJSONProvider, stream_object
 
 # Configure logging
 logging.basicConfig(
@@ -20,26 +33,374 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+# One encoder (orjson when installed) for every JSON response
+app.json = FastJSONProvider(app)
 CORS(app)
 
 # Configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['EXTRACT_SPILL_THRESHOLD'] = int(os.environ.get('EXTRACT_SPILL_THRESHOLD', 8 * 1024 * 1024))
 app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'doc', 'docx'}
-
-# Ensure upload folder exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+app.config['PDF_MAX_PAGES'] = int(os.environ.get('PDF_MAX_PAGES', 50))
+app.config['PDF_TIME_BUDGET'] = float(os.environ.get('PDF_TIME_BUDGET', 10.0))
+app.config['PDF_MAX_CHARS'] = int(os.environ.get('PDF_MAX_CHARS', 100000))
+app.config['PDF_PARALLEL_THRESHOLD'] = int(os.environ.get('PDF_PARALLEL_THRESHOLD', 8))
+app.config['PDF_MAX_WORKERS'] = int(os.environ['PDF_MAX_WORKERS']) if os.environ.get('PDF_MAX_WORKERS') else None
+app.config['SPACY_MODEL'] = os.environ.get('SPACY_MODEL', DEFAULT_MODEL)
+app.config['SPACY_EXCLUDE'] = [
+    name.strip() for name in os.environ.get('SPACY_EXCLUDE', ','.join(DEFAULT_EXCLUDED_COMPONENTS)).split(',')
+    if name.strip()
+]
+app.config['NER_HEADER_CHARS'] = int(os.environ.get('NER_HEADER_CHARS', DEFAULT_NER_HEADER_CHARS))
+app.config['SKILL_TAXONOMY_PATH'] = os.environ.get('SKILL_TAXONOMY_PATH')
+# PRELOAD_MODEL is the older name for PRELOAD
+app.config['PRELOAD'] = os.environ.get('PRELOAD', os.environ.get('PRELOAD_MODEL', 'false')).lower() in ('1', 'true', 'yes')
+app.config['BATCH_MAX_FILES'] = int(os.environ.get('BATCH_MAX_FILES', 100))
+# Total decompressed size of one batch, archive members included
+app.config['BATCH_MAX_BYTES'] = int(os.environ.get('BATCH_MAX_BYTES', 64 * 1024 * 1024))
+app.config['PARSE_BATCH_SIZE'] = int(os.environ.get('PARSE_BATCH_SIZE', 32))
+app.config['PARSE_N_PROCESS'] = int(os.environ.get('PARSE_N_PROCESS', 1))
+app.config['PARSE_QUEUE_WORKERS'] = int(os.environ.get('PARSE_QUEUE_WORKERS', 2))
+app.config['PARSE_QUEUE_MAX_PENDING'] = int(os.environ.get('PARSE_QUEUE_MAX_PENDING', 64))
+app.config['PARSE_RESULT_TTL'] = int(os.environ.get('PARSE_RESULT_TTL', 3600))
+app.config['PARSE_RESULTS_DIR'] = os.environ.get('PARSE_RESULTS_DIR', 'parse_results')
+app.config['MATCH_TOP_K'] = int(os.environ.get('MATCH_TOP_K', 10))
+app.config['MATCH_MAX_K'] = int(os.environ.get('MATCH_MAX_K', 100))
+app.config['MATCH_BATCH_MAX'] = int(os.environ.get('MATCH_BATCH_MAX', 1000))
+app.config['JOBS_PAGE_SIZE'] = int(os.environ.get('JOBS_PAGE_SIZE', 50))
+app.config['JOBS_MAX_PAGE_SIZE'] = int(os.environ.get('JOBS_MAX_PAGE_SIZE', 500))
+app.config['MATCH_MODE'] = os.environ.get('MATCH_MODE', TFIDF)
+app.config['SEMANTIC_COMPONENTS'] = int(os.environ.get('SEMANTIC_COMPONENTS', 128))
+app.config['SEMANTIC_LISTS'] = int(os.environ['SEMANTIC_LISTS']) if os.environ.get('SEMANTIC_LISTS') else None
+app.config['SEMANTIC_PROBE'] = int(os.environ.get('SEMANTIC_PROBE', 8))
+app.config['MATCH_SHARDS'] = int(os.environ.get('MATCH_SHARDS', 0))
+app.config['SHARD_START_METHOD'] = os.environ.get('SHARD_START_METHOD') or None
+app.config['MATCH_PARITY_CHECK'] = os.environ.get('MATCH_PARITY_CHECK', '').lower() in ('1', 'true', 'yes')
+app.config['DATABASE_URL'] = os.environ.get('DATABASE_URL')
+# Parsed resumes are personal data: kept by default only when there is a database to keep them in
+app.config['STORE_CANDIDATES'] = os.environ.get(
+    'STORE_CANDIDATES', 'true' if app.config['DATABASE_URL'] else 'false'
+).lower() in ('1', 'true', 'yes')
+# Fill an empty job store with the mock postings (for demos; never on a real database)
+app.config['SEED_MOCK_JOBS'] = os.environ.get('SEED_MOCK_JOBS', '').lower() in ('1', 'true', 'yes')
+app.config['CANDIDATE_MEMORY_LIMIT'] = int(os.environ.get('CANDIDATE_MEMORY_LIMIT', 1000))
+app.config['CANDIDATE_TOP_K'] = int(os.environ.get('CANDIDATE_TOP_K', 10))
+app.config['REMATCH_CHUNK_SIZE'] = int(os.environ.get('REMATCH_CHUNK_SIZE', 1000))
+app.config['REMATCH_MAX_PAIRS'] = int(os.environ.get('REMATCH_MAX_PAIRS', 2000000))
+app.config['INDEX_SNAPSHOT_DIR'] = os.environ.get('INDEX_SNAPSHOT_DIR')
+# Seconds between checks for job store writes by other workers or the job feed
+app.config['STORE_CHECK_INTERVAL'] = float(os.environ.get('STORE_CHECK_INTERVAL', 5.0))
+# Bearer token for POST /jobs and POST /candidates/rematch; both are disabled without one
+app.config['ADMIN_TOKEN'] = os.environ.get('ADMIN_TOKEN')
+app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR')
+app.config['PROFILE_SAMPLE_RATE'] = float(os.environ.get('PROFILE_SAMPLE_RATE', 0.0))
+app.config['PROFILE_HEADER'] = os.environ.get('PROFILE_HEADER', 'X-Profile')
+app.config['PROFILE_TOKEN'] = os.environ.get('PROFILE_TOKEN')
+app.config['PARSE_CACHE_DIR'] = os.environ.get('PARSE_CACHE_DIR', 'parse_cache')
+app.config['PARSE_CACHE_MEMORY_ENTRIES'] = int(os.environ.get('PARSE_CACHE_MEMORY_ENTRIES', 256))
+app.config['PARSE_CACHE_TTL'] = int(os.environ.get('PARSE_CACHE_TTL', 7 * 24 * 3600))
+app.config['PARSE_CACHE_MAX_BYTES'] = int(os.environ.get('PARSE_CACHE_MAX_BYTES', 256 * 1024 * 1024))
 
 # Initialize components
-file_handler = FileHandler()
-resume_parser = ResumeParser()
-job_matcher = JobMatcher()
+file_handler = FileHandler(
+    spill_threshold=app.config['EXTRACT_SPILL_THRESHOLD'],
+    pdf_extractor=PdfExtractor(
+        max_pages=app.config['PDF_MAX_PAGES'],
+        time_budget=app.config['PDF_TIME_BUDGET'],
+        max_chars=app.config['PDF_MAX_CHARS'],
+        parallel_threshold=app.config['PDF_PARALLEL_THRESHOLD'],
+        max_workers=app.config['PDF_MAX_WORKERS']
+    )
+)
+resume_parser = ResumeParser(
+    model_name=app.config['SPACY_MODEL'],
+    exclude=app.config['SPACY_EXCLUDE'],
+    ner_header_chars=app.config['NER_HEADER_CHARS'],
+    skill_taxonomy_path=app.config['SKILL_TAXONOMY_PATH']
+)
+parse_cache = ParseCache(
+    directory=app.config['PARSE_CACHE_DIR'] or None,
+    max_memory_entries=app.config['PARSE_CACHE_MEMORY_ENTRIES'],
+    ttl_seconds=app.config['PARSE_CACHE_TTL'],
+    max_disk_bytes=app.config['PARSE_CACHE_MAX_BYTES']
+)
+job_store = None
+# Without a database, stored candidates live only as long as the process
+candidate_store = None
+if app.config['DATABASE_URL']:
+    # SQLAlchemy is only imported when there is a database to talk to
+    from app.storage.job_store import JobStore
+    from app.storage.candidate_store import CandidateStore
+    job_store = JobStore(app.config['DATABASE_URL'])
+    if app.config['STORE_CANDIDATES']:
+        candidate_store = CandidateStore(app.config['DATABASE_URL'])
+job_matcher = JobMatcher(
+    parity_check=app.config['MATCH_PARITY_CHECK'],
+    job_store=job_store,
+    snapshot_dir=app.config['INDEX_SNAPSHOT_DIR'],
+    candidate_store=candidate_store,
+    match_mode=app.config['MATCH_MODE'],
+    semantic_index=SemanticIndex(
+        n_components=app.config['SEMANTIC_COMPONENTS'],
+        n_lists=app.config['SEMANTIC_LISTS'],
+        n_probe=app.config['SEMANTIC_PROBE']
+    ),
+    shards=app.config['MATCH_SHARDS'],
+    shard_start_method=app.config['SHARD_START_METHOD'],
+    # Built on first use, or up front by preload()
+    lazy=True,
+    candidate_top_k=app.config['CANDIDATE_TOP_K'],
+    candidate_memory_limit=app.config['CANDIDATE_MEMORY_LIMIT'],
+    seed_mock_jobs=app.config['SEED_MOCK_JOBS'],
+    store_check_interval=app.config['STORE_CHECK_INTERVAL']
+)
+rematcher = Rematcher(
+    job_matcher,
+    chunk_size=app.config['REMATCH_CHUNK_SIZE'],
+    max_pairs=app.config['REMATCH_MAX_PAIRS']
+)
+# Stored candidates' top-k lists follow job changes in the background
+job_matcher.on_jobs_changed = rematcher.submit
+resume_pipeline = ResumePipeline(
+    file_handler,
+    resume_parser,
+    job_matcher,
+    parse_cache=parse_cache,
+    batch_size=app.config['PARSE_BATCH_SIZE'],
+    n_process=app.config['PARSE_N_PROCESS'],
+    store_candidates=app.config['STORE_CANDIDATES']
+)
+parse_queue = ParseQueue(
+    resume_pipeline,
+    workers=app.config['PARSE_QUEUE_WORKERS'],
+    max_pending=app.config['PARSE_QUEUE_MAX_PENDING'],
+    result_ttl=app.config['PARSE_RESULT_TTL'],
+    results_dir=app.config['PARSE_RESULTS_DIR'] or None
+)
+request_profiler = RequestProfiler(
+    directory=app.config['PROFILE_DIR'] or None,
+    sample_rate=app.config['PROFILE_SAMPLE_RATE'],
+    header=app.config['PROFILE_HEADER'],
+    token=app.config['PROFILE_TOKEN']
+)
+
+def register_metrics():
+    """Expose component state read at scrape time."""
+    REGISTRY.register_callback('jobs_indexed', 'Active jobs in the match index.',
+                               lambda: job_matcher.index.size if job_matcher.loaded else 0)
+    REGISTRY.register_callback('candidates_indexed', 'Candidates available for reverse matching.',
+                               lambda: job_matcher.candidates.size if job_matcher.loaded else 0)
+    REGISTRY.register_callback('parse_queue_pending', 'Asynchronous parse jobs not yet finished.',
+                               lambda: parse_queue.stats()['pending'])
+    REGISTRY.register_callback(
+        'parse_cache_lookups_total', 'Parse cache lookups by tier hit or miss.',
+        lambda: [({'result': result}, parse_cache.stats()[key])
+                 for result, key in (('memory_hit', 'memory_hits'), ('disk_hit', 'disk_hits'),
+                                     ('miss', 'misses'))],
+        kind='counter'
+    )
+
+register_metrics()
+
+@app.before_request
+def start_request_timing():
+    """Start the latency clock and, if selected, the profiler for this request."""
+    g.request_started = time.perf_counter()
+    g.profiler = request_profiler.start() if request_profiler.should_profile(request.headers) else None
+
+@app.after_request
+def record_request_metrics(response):
+    """Record request latency and finish any profile."""
+    started = g.pop('request_started', None)
+    if started is None:
+        return response
+    # Route templates, not raw paths, keep label cardinality bounded
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    labels = {'endpoint': endpoint, 'method': request.method, 'status': str(response.status_code)}
+    HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, **labels)
+    HTTP_REQUESTS.inc(**labels)
+    
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profile_file = request_profiler.finish(profiler, endpoint)
+        if profile_file:
+            response.headers['X-Profile-File'] = profile_file
+    return response
+
+@app.teardown_request
+def stop_profiler(error=None):
+    """Never leave a profiler running after a request that raised."""
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
+def match_options():
+    """Read top-k and minimum score options from the request."""
+    k = request.values.get('k', app.config['MATCH_TOP_K'], type=int)
+    min_score = request.values.get('min_score', 0, type=int)
+    if k is None or not 1 <= k <= app.config['MATCH_MAX_K']:
+        raise ValueError(f"k must be between 1 and {app.config['MATCH_MAX_K']}")
+    if min_score is None or not 0 <= min_score <= 100:
+        raise ValueError('min_score must be between 0 and 100')
+    return k, min_score
+
+def match_mode():
+    """Read the matching mode ('tfidf' or 'semantic') from the request, if given."""
+    mode = request.values.get('mode') or None
+    if mode is not None and mode not in MATCH_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(MATCH_MODES)}")
+    return mode
+
+def candidate_filters():
+    """Read location and experience filters for candidate ranking."""
+    filters = {'location': request.args.get('location') or None}
+    for name in ('min_experience', 'max_experience'):
+        value = request.args.get(name)
+        if value in (None, ''):
+            filters[name] = None
+            continue
+        try:
+            filters[name] = float(value)
+        except ValueError:
+            raise ValueError(f'{name} must be a number')
+        if filters[name] < 0:
+            raise ValueError(f'{name} must not be negative')
+    return filters
+
+def page_options(options):
+    """Read limit, cursor and field projection from request options."""
+    try:
+        limit = int(options.get('limit', app.config['JOBS_PAGE_SIZE']))
+    except (TypeError, ValueError):
+        raise ValueError('limit must be an integer')
+    if not 1 <= limit <= app.config['JOBS_MAX_PAGE_SIZE']:
+        raise ValueError(f"limit must be between 1 and {app.config['JOBS_MAX_PAGE_SIZE']}")
+    
+    fields = options.get('fields')
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(',') if field.strip()]
+    
+    return limit, options.get('cursor'), fields or None
+
+# Fields of a ResumeData payload that must hold text (or null) and lists that must hold strings
+RESUME_TEXT_FIELDS = {
+    'personal_info': ('name', 'email', 'phone', 'location', 'linkedin', 'github', 'website'),
+    'experience': ('company', 'position', 'start_date', 'end_date', 'duration', 'description', 'location'),
+    'education': ('institution', 'degree', 'field_of_study', 'start_date', 'end_date', 'gpa', 'location'),
+    'certifications': ('name', 'issuing_organization', 'issue_date', 'expiry_date', 'credential_id'),
+}
+RESUME_STRING_LISTS = ('skills', 'languages')
+
+def resume_payload_error(payload):
+    """Describe why a ResumeData JSON payload cannot be matched, or return None if it can."""
+    for name in ('summary', 'raw_text'):
+        if payload.get(name) is not None and not isinstance(payload[name], str):
+            return f'{name} must be a string'
+    for name in RESUME_STRING_LISTS:
+        values = payload.get(name)
+        if values is not None and (not isinstance(values, list) or
+                                   not all(isinstance(value, str) for value in values)):
+            return f'{name} must be a list of strings'
+    categories = payload.get('skill_categories')
+    if categories is not None and (not isinstance(categories, dict) or not all(
+            isinstance(values, list) and all(isinstance(value, str) for value in values)
+            for values in categories.values())):
+        return 'skill_categories must map names to lists of strings'
+    for name, fields in RESUME_TEXT_FIELDS.items():
+        entries = payload.get(name)
+        if entries is None:
+            continue
+        if name == 'personal_info':
+            entries = [entries]
+        elif not isinstance(entries, list):
+            return f'{name} must be a list'
+        for entry in entries:
+            if not isinstance(entry, dict):
+                return f'{name} entries must be objects'
+            for field in fields:
+                if entry.get(field) is not None and not isinstance(entry[field], str):
+                    return f'{name}.{field} must be a string'
+    return None
+
+def admin_error():
+    """Error response for a job-management write without the admin token, or None if it carries it."""
+    token = app.config['ADMIN_TOKEN']
+    if not token:
+        return jsonify({'error': 'Job management is disabled (ADMIN_TOKEN is not set)'}), 403
+    supplied = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(supplied.encode(), f'Bearer {token}'.encode()):
+        return jsonify({'error': 'Unauthorized'}), 401
+    return None
+
+def collect_batch_uploads():
+    """Gather (filename, bytes) pairs from 'files' uploads and/or a zip 'archive'."""
+    uploads = []
+    total_bytes = 0
+    for file in request.files.getlist('files'):
+        if file.filename and allowed_file(file.filename):
+            uploads.append((file.filename, file.read()))
+            total_bytes += len(uploads[-1][1])
+        elif file.filename:
+            raise ValueError(f"Invalid file type: {file.filename}")
+    
+    archive = request.files.get('archive')
+    if archive and archive.filename:
+        try:
+            with zipfile.ZipFile(archive.stream) as zf:
+                for info in zf.infolist():
+                    name = os.path.basename(info.filename)
+                    if info.is_dir() or not name or not allowed_file(name):
+                        continue
+                    # Guard against zip bombs: same per-file cap as single uploads, and a
+                    # cap on the batch as a whole. Reads stop at the declared size, so
+                    # it bounds what is decompressed.
+                    if info.file_size > app.config['MAX_CONTENT_LENGTH']:
+                        raise ValueError(f"File too large in archive: {name}")
+                    total_bytes += info.file_size
+                    if total_bytes > app.config['BATCH_MAX_BYTES']:
+                        raise ValueError(f"Archive exceeds {app.config['BATCH_MAX_BYTES']} bytes uncompressed")
+                    uploads.append((name, zf.read(info)))
+                    if len(uploads) > app.config['BATCH_MAX_FILES']:
+                        break
+        except zipfile.BadZipFile:
+            raise ValueError('Archive is not a valid zip file')
+    
+    if len(uploads) > app.config['BATCH_MAX_FILES']:
+        raise ValueError(f"At most {app.config['BATCH_MAX_FILES']} files per batch")
+    return uploads
+
+def preload():
+    """Import and warm every heavy dependency at import time.
+
+    By default spaCy, scikit-learn and the PDF/DOCX libraries are imported
+    by the first request that needs them, which keeps cold starts fast.
+    Under a pre-forking server started with ``--preload`` (e.g.
+    ``PRELOAD=true gunicorn --preload main:app``) this instead runs once in
+    the master, and the frozen heap is then shared copy-on-write by every
+    worker instead of each worker paying the load cost on its first request.
+    """
+    started = time.perf_counter()
+    file_handler.warm_up()
+    job_matcher.warm_up()
+    try:
+        resume_parser.warm_up()
+        logger.info("spaCy model loaded successfully")
+    except Exception as e:
+        logger.error(f"Failed to load spaCy model: {str(e)}")
+        logger.info(f"Please run: python -m spacy download {app.config['SPACY_MODEL']}")
+        return
+    logger.info(f"Preloaded in {time.perf_counter() - started:.2f}s")
+    # Keep the collector from touching (and so un-sharing) the preloaded pages
+    gc.freeze()
+
+if app.config['PRELOAD']:
+    preload()
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -65,82 +426,267 @@ def parse_resume():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type. Only PDF, DOC, and DOCX are allowed.'}), 400
         
-        # Generate unique filename and save file
-        file_id = str(uuid.uuid4())
-        filename = secure_filename(file.filename)
-        file_extension = filename.rsplit('.', 1)[1].lower()
-        saved_filename = f"{file_id}.{file_extension}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], saved_filename)
-        
-        file.save(file_path)
-        logger.info(f"File saved: {file_path}")
-        
-        # Extract text from file
-        text_content = file_handler.extract_text(file_path, file_extension)
-        if not text_content:
-            return jsonify({'error': 'Unable to extract text from file'}), 400
-        
-        # Parse resume data
-        parsed_data = resume_parser.parse(text_content)
-        
-        # Find job matches
-        job_matches = job_matcher.find_matches(parsed_data)
-        
-        # Create response
-        result = {
-            'id': file_id,
-            'filename': filename,
-            'parsed_at': datetime.utcnow().isoformat(),
-            'personal_info': parsed_data.personal_info,
-            'skills': parsed_data.skills,
-            'experience': parsed_data.experience,
-            'education': parsed_data.education,
-            'job_matches': job_matches
-        }
-        
-        logger.info(f"Resume parsed successfully: {file_id}")
-        return jsonify(result)
+        try:
+            k, min_score = match_options()
+            mode = match_mode()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if request.values.get('async', '').lower() in ('1', 'true', 'yes'):
+            return enqueue_parse(file, k, min_score, mode)
+        
+        try:
+            result = resume_pipeline.process(file.read(), file.filename, k=k, min_score=min_score, mode=mode)
+        except ExtractionError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        logger.info(f"Resume parsed successfully: {result['id']} "
+                    f"in {time.perf_counter() - g.request_started:.3f}s")
+        with time_stage('serialize'):
+            return jsonify(result)
         
     except Exception as e:
         logger.error(f"Error parsing resume: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
+
+def enqueue_parse(file, k, min_score, mode=None):
+    """Queue an upload for background parsing and point the client at its result."""
+    try:
+        job_id = parse_queue.submit(file.read(), file.filename, k=k, min_score=min_score, mode=mode)
+    except QueueFull as e:
+        response = jsonify({'error': str(e)})
+        response.headers['Retry-After'] = '5'
+        return response, 429
+    except QueueUnavailable as e:
+        return jsonify({'error': str(e)}), 503
     
-    finally:
-        # Clean up uploaded file
+    logger.info(f"Resume queued for parsing: {job_id}")
+    response = jsonify({'id': job_id, 'status': 'queued', 'result_url': f'/results/{job_id}'})
+    response.headers['Location'] = f'/results/{job_id}'
+    return response, 202
+
+@app.route('/results/<job_id>', methods=['GET'])
+def get_parse_result(job_id):
+    """Status of a queued parse, with its result once done."""
+    job = parse_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Result not found or expired'}), 404
+    return jsonify(job)
+
+@app.route('/queue/stats', methods=['GET'])
+def queue_stats():
+    """Parse queue depth."""
+    return jsonify({
+        'parse_queue': parse_queue.stats(),
+        'timestamp': datetime.utcnow().isoformat()
+    })
+
+@app.route('/parse/batch', methods=['POST'])
+def parse_resume_batch():
+    """Parse many uploaded resumes (multiple 'files' or one zip 'archive')."""
+    try:
         try:
-            if 'file_path' in locals() and os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            logger.warning(f"Failed to cleanup file {file_path}: {str(e)}")
+            k, min_score = match_options()
+            mode = match_mode()
+            uploads = collect_batch_uploads()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if not uploads:
+            return jsonify({'error': 'No files provided'}), 400
+        
+        results = resume_pipeline.process_many(uploads, k=k, min_score=min_score, mode=mode)
+        failed = sum(1 for result in results if 'error' in result)
+        
+        logger.info(f"Batch parsed: {len(results) - failed} succeeded, {failed} failed")
+        return jsonify({
+            'results': results,
+            'total': len(results),
+            'succeeded': len(results) - failed,
+            'failed': failed,
+            'timestamp': datetime.utcnow().isoformat()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error parsing resume batch: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
 
-@app.route('/jobs', methods=['GET'])
-def get_jobs():
-    """Get available job listings."""
+@app.route('/match/batch', methods=['POST'])
+def match_batch():
+    """Match already-parsed resumes (ResumeData JSON) to jobs in one batch."""
+    try:
+        try:
+            k, min_score = match_options()
+            mode = match_mode()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        data = request.get_json(silent=True)
+        payloads = data.get('resumes') if isinstance(data, dict) else data
+        if not payloads or not isinstance(payloads, list):
+            return jsonify({'error': 'No resumes provided'}), 400
+        if len(payloads) > app.config['MATCH_BATCH_MAX']:
+            return jsonify({'error': f"At most {app.config['MATCH_BATCH_MAX']} resumes per batch"}), 400
+        
+        resumes = []
+        for position, payload in enumerate(payloads):
+            if not isinstance(payload, dict):
+                return jsonify({'error': f"Invalid resume at index {position}: expected an object"}), 400
+            error = resume_payload_error(payload)
+            if error:
+                return jsonify({'error': f"Invalid resume at index {position}: {error}"}), 400
+            try:
+                resumes.append(ResumeData.from_dict(payload))
+            except (TypeError, ValueError, AttributeError) as e:
+                return jsonify({'error': f"Invalid resume at index {position}: {str(e)}"}), 400
+        
+        with time_stage('match_batch'):
+            all_matches = job_matcher.find_matches_many(resumes, k=k, min_score=min_score, mode=mode)
+        return jsonify({
+            'results': [
+                {'index': position, 'job_matches': matches} for position, matches in enumerate(all_matches)
+            ],
+            'total': len(all_matches),
+            'timestamp': datetime.utcnow().isoformat()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error matching resume batch: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus text-format metrics for this process."""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Parse cache hit/miss counters."""
+    return jsonify({
+        'parse_cache': parse_cache.stats(),
+        'timestamp': datetime.utcnow().isoformat()
+    })
+
+@app.route('/match/semantic/stats', methods=['GET'])
+def semantic_stats():
+    """Semantic index shape and recall@10 against exact search."""
     try:
-        jobs = job_matcher.get_all_jobs()
         return jsonify({
-            'jobs': jobs,
-            'total': len(jobs),
+            'semantic_index': job_matcher.semantic_stats(),
             'timestamp': datetime.utcnow().isoformat()
         })
+    except Exception as e:
+        logger.error(f"Error reading semantic index stats: {str(e)}")
+        return jsonify({'error': 'Failed to read semantic index stats'}), 500
+
+def stream_jobs_page(page):
+    """Stream a page of jobs, encoding the listing a chunk at a time."""
+    fields = {key: value for key, value in page.items() if key != 'jobs'}
+    fields['timestamp'] = datetime.utcnow().isoformat()
+    return Response(stream_object(fields, 'jobs', page['jobs']), mimetype='application/json')
+
+@app.route('/jobs', methods=['GET'])
+def get_jobs():
+    """Get available job listings, one page at a time."""
+    try:
+        limit, cursor, fields = page_options(request.args)
+        page = job_matcher.page_jobs(limit=limit, cursor=cursor, fields=fields)
+        return stream_jobs_page(page)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching jobs: {str(e)}")
         return jsonify({'error': 'Failed to fetch jobs'}), 500
 
+@app.route('/jobs', methods=['POST'])
+def upsert_jobs():
+    """Add or replace job postings; stored candidates are re-matched in the background."""
+    error = admin_error()
+    if error:
+        return error
+    try:
+        data = request.get_json(silent=True)
+        jobs = data.get('jobs') if isinstance(data, dict) and 'jobs' in data else data
+        if isinstance(jobs, dict):
+            jobs = [jobs]
+        if not jobs or not isinstance(jobs, list):
+            return jsonify({'error': 'No jobs provided'}), 400
+        try:
+            jobs = [validate_job(job) for job in jobs]
+        except ValueError as e:
+            return jsonify({'error': f"Invalid job: {str(e)}"}), 400
+        
+        job_matcher.add_jobs(jobs)
+        return jsonify({
+            'updated': len(jobs),
+            'rematch': rematcher.stats(),
+            'timestamp': datetime.utcnow().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error updating jobs: {str(e)}")
+        return jsonify({'error': 'Failed to update jobs'}), 500
+
+@app.route('/jobs/<job_id>/candidates', methods=['GET'])
+def get_job_candidates(job_id):
+    """Rank stored candidates for a job posting."""
+    try:
+        k, min_score = match_options()
+        filters = candidate_filters()
+        candidates = job_matcher.find_candidates(job_id, k=k, min_score=min_score, **filters)
+        if candidates is None:
+            return jsonify({'error': 'Job not found'}), 404
+        return jsonify({
+            'job_id': job_id,
+            'candidates': candidates,
+            'total_candidates': job_matcher.candidates.size,
+            'timestamp': datetime.utcnow().isoformat()
+        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error ranking candidates: {str(e)}")
+        return jsonify({'error': 'Failed to rank candidates'}), 500
+
+@app.route('/candidates/<candidate_id>/matches', methods=['GET'])
+def get_candidate_matches(candidate_id):
+    """A stored candidate's top-k job matches, kept current as jobs change."""
+    try:
+        matches = job_matcher.candidate_matches(candidate_id)
+        if matches is None:
+            return jsonify({'error': 'Candidate not found'}), 404
+        return jsonify({
+            'candidate_id': candidate_id,
+            'job_matches': matches,
+            'timestamp': datetime.utcnow().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error fetching candidate matches: {str(e)}")
+        return jsonify({'error': 'Failed to fetch candidate matches'}), 500
+
+@app.route('/candidates/rematch', methods=['GET', 'POST'])
+def candidate_rematch():
+    """Progress of background re-matching; POST queues a full re-match of every candidate."""
+    if request.method == 'POST':
+        error = admin_error()
+        if error:
+            return error
+        rematcher.submit(None)
+        return jsonify({'rematch': rematcher.stats(), 'timestamp': datetime.utcnow().isoformat()}), 202
+    return jsonify({'rematch': rematcher.stats(), 'timestamp': datetime.utcnow().isoformat()})
+
 @app.route('/jobs/search', methods=['POST'])
 def search_jobs():
-    """Search jobs based on criteria."""
+    """Search jobs based on criteria, one page at a time."""
     try:
         search_data = request.get_json()
         if not search_data:
             return jsonify({'error': 'No search criteria provided'}), 400
         
-        jobs = job_matcher.search_jobs(search_data)
-        return jsonify({
-            'jobs': jobs,
-            'total': len(jobs),
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        limit, cursor, fields = page_options({**request.args.to_dict(), **search_data})
+        page = job_matcher.page_jobs(search_data, limit=limit, cursor=cursor, fields=fields)
+        return stream_jobs_page(page)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error searching jobs: {str(e)}")
         return jsonify({'error': 'Failed to search jobs'}), 500
@@ -161,13 +707,12 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
-    # Load spaCy model on startup
-    try:
-        resume_parser.load_model()
-        logger.info("spaCy model loaded successfully")
-    except Exception as e:
-        logger.error(f"Failed to load spaCy model: {str(e)}")
-        logger.info("Please run: python -m spacy download en_core_web_sm")
+    arg_parser = argparse.ArgumentParser(description='Run the resume parser backend.')
+    arg_parser.add_argument('--preload', action='store_true',
+                            help='import and warm all dependencies before serving (same as PRELOAD=true)')
+    args = arg_parser.parse_args()
+    if args.preload and not app.config['PRELOAD']:
+        preload()
     
     # Start the Flask application
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
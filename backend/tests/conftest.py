@@ -0,0 +1,64 @@
+import os
+import sys
+import random
+from typing import List, Dict, Any
+
+import pytest
+
+# Tests import the app the way main.py does, from the backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.resume_data import ResumeData, PersonalInfo, Experience, Education  # noqa: E402
+from benchmarks import generators  # noqa: E402
+
+
+def make_resume(rng: random.Random) -> ResumeData:
+    """A parsed resume built from the benchmark vocabulary, without running the spaCy parser."""
+    skills = rng.sample(generators.SKILLS, rng.randint(3, 12))
+    experience = [
+        Experience(company=rng.choice(generators.COMPANIES), position=rng.choice(generators.TITLES),
+                   start_date='2019', end_date='2023',
+                   description=f'{rng.choice(generators.VERBS)} {rng.choice(generators.OBJECTS)} '
+                               f'using {rng.choice(skills)}')
+        for _ in range(rng.randint(0, 3))
+    ]
+    return ResumeData(
+        personal_info=PersonalInfo(name=f'{rng.choice(generators.FIRST_NAMES)} {rng.choice(generators.LAST_NAMES)}',
+                                   location=rng.choice(generators.CITIES)),
+        summary=f'{rng.choice(generators.TITLES)} working with {", ".join(skills[:3])}',
+        skills=skills,
+        experience=experience,
+        education=[Education(institution=rng.choice(generators.SCHOOLS), degree=rng.choice(generators.DEGREES),
+                             field_of_study=rng.choice(generators.FIELDS))],
+    )
+
+
+@pytest.fixture(scope='session')
+def jobs() -> List[Dict[str, Any]]:
+    return list(generators.generate_jobs(400, seed=1))
+
+
+@pytest.fixture(scope='session')
+def resumes() -> List[ResumeData]:
+    rng = random.Random(2)
+    return [make_resume(rng) for _ in range(40)]
+
+
+@pytest.fixture
+def job_matcher(jobs):
+    from app.utils.job_matcher import JobMatcher
+    job_matcher = JobMatcher(lazy=True)
+    job_matcher.index.fit(jobs)
+    return job_matcher
+
+
+@pytest.fixture(scope='session')
+def app_main():
+    """The Flask app module, imported as the server does (without PRELOAD)."""
+    import main
+    return main
+
+
+@pytest.fixture
+def client(app_main):
+    return app_main.app.test_client()
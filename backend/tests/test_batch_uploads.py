@@ -0,0 +1,40 @@
+import io
+import zipfile
+
+import pytest
+
+
+def archive_of(sizes):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for position, size in enumerate(sizes):
+            zf.writestr(f'resume{position}.pdf', b'0' * size)
+    buffer.seek(0)
+    return buffer
+
+
+def collect(app_main, sizes):
+    data = {'archive': (archive_of(sizes), 'resumes.zip')}
+    with app_main.app.test_request_context('/parse/batch', method='POST', data=data,
+                                           content_type='multipart/form-data'):
+        return app_main.collect_batch_uploads()
+
+
+def test_archive_within_the_batch_cap_is_read(app_main, monkeypatch):
+    monkeypatch.setitem(app_main.app.config, 'BATCH_MAX_BYTES', 2000)
+    uploads = collect(app_main, [600, 600, 600])
+    assert [len(content) for _, content in uploads] == [600, 600, 600]
+
+
+def test_archive_over_the_batch_cap_is_rejected(app_main, monkeypatch):
+    monkeypatch.setitem(app_main.app.config, 'BATCH_MAX_BYTES', 2000)
+    with pytest.raises(ValueError, match='uncompressed'):
+        collect(app_main, [600, 600, 600, 600])
+
+
+def test_batch_endpoint_rejects_archives_over_the_cap(client, app_main, monkeypatch):
+    monkeypatch.setitem(app_main.app.config, 'BATCH_MAX_BYTES', 2000)
+    response = client.post('/parse/batch', data={'archive': (archive_of([1500, 1500]), 'resumes.zip')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert 'uncompressed' in response.get_json()['error']
@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from app.utils.docx_extractor import extract_docx_text, iter_docx_lines
+from app.utils.file_handler import FileHandler
+from benchmarks import generators
+
+docx = pytest.importorskip('docx')
+
+
+def model_text(content):
+    return FileHandler()._extract_from_docx_model(io.BytesIO(content))
+
+
+def save(document):
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('text', generators.generate_resumes(10, seed=5))
+def test_streaming_matches_python_docx_on_paragraphs(text):
+    content = generators.to_docx(text)
+    assert extract_docx_text(io.BytesIO(content)) == model_text(content)
+
+
+@pytest.mark.parametrize('text', generators.generate_resumes(10, seed=6))
+def test_streaming_keeps_table_rows_in_reading_order(text):
+    content = generators.to_docx(text, tables=True)
+    streamed = extract_docx_text(io.BytesIO(content)).split('\n')
+    # python-docx appends every table after the paragraphs; same lines, other order
+    assert sorted(streamed) == sorted(model_text(content).split('\n'))
+    # A bullet row's cells ('-', text) join back into the original line
+    assert streamed == text.split('\n')
+
+
+def test_tabs_breaks_and_nested_tables():
+    document = docx.Document()
+    run = document.add_paragraph('Skills').add_run(':')
+    run.add_tab()
+    run.add_text('Python')
+    run.add_break()
+    run.add_text('Go')
+    run.add_break(docx.enum.text.WD_BREAK.PAGE)
+    cell = document.add_table(rows=1, cols=2).rows[0].cells[1]
+    cell.text = 'Outer'
+    cell.add_table(rows=1, cols=1).rows[0].cells[0].text = 'Inner'
+    content = save(document)
+
+    lines = list(iter_docx_lines(io.BytesIO(content)))
+    assert lines[0] == document.paragraphs[0].text == 'Skills:\tPython\nGo'
+    # python-docx's cell text leaves out the nested table; a cell must end with a paragraph
+    assert ' '.join(cell.text for cell in document.tables[0].rows[0].cells) == ' Outer\n'
+    assert lines[1] == ' Outer\nInner\n'
+
+
+def test_unreadable_documents_fall_back_to_python_docx(monkeypatch):
+    content = generators.to_docx('Jane Doe\nSkills: Python')
+    fallback = []
+    handler = FileHandler()
+    monkeypatch.setattr(handler, '_extract_from_docx_model',
+                        lambda document: fallback.append(document) or 'from the model')
+    assert handler.extract_text(content, 'docx') == 'Jane Doe\nSkills: Python'
+    assert fallback == []
+    assert handler.extract_text(b'not a zip', 'docx') == 'from the model'
+    assert FileHandler().extract_text(b'not a zip', 'docx') is None
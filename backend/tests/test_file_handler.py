@@ -0,0 +1,57 @@
+import io
+import os
+
+import pytest
+
+from app.utils.file_handler import FileHandler
+from benchmarks import generators
+
+TEXT = 'Jane Doe\njane@example.com\n\nSkills\nPython, SQL'
+
+
+class UnseekableStream(io.RawIOBase):
+    """An upload stream that can only be read forwards."""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        chunk = self._buffer.read(len(target))
+        target[:len(chunk)] = chunk
+        return len(chunk)
+
+
+@pytest.mark.parametrize('make_source', [
+    bytes, bytearray, memoryview, io.BytesIO, lambda data: io.BufferedReader(UnseekableStream(data)),
+])
+@pytest.mark.parametrize('extension,render', [('docx', generators.to_docx), ('pdf', generators.to_pdf)])
+def test_every_source_kind_extracts_the_same_text(make_source, extension, render):
+    content = render(TEXT)
+    expected = FileHandler().extract_text(content, extension)
+    assert expected.split() == TEXT.split()
+    assert FileHandler().extract_text(make_source(content), extension) == expected
+
+
+def test_large_uploads_are_spilled_to_a_temporary_file():
+    handler = FileHandler(spill_threshold=10)
+    with handler._open_source(b'x' * 11) as document:
+        assert isinstance(document, str) and os.path.exists(document)
+    assert not os.path.exists(document)
+    with handler._open_source(b'x' * 10) as document:
+        assert isinstance(document, io.BytesIO)
+
+
+def test_spilled_and_in_memory_extraction_agree(tmp_path):
+    content = generators.to_docx(TEXT)
+    path = tmp_path / 'resume.docx'
+    path.write_bytes(content)
+    in_memory = FileHandler().extract_text(content, 'docx')
+    assert FileHandler(spill_threshold=0).extract_text(content, 'docx') == in_memory
+    assert FileHandler().extract_text(str(path), 'docx') == in_memory
+
+
+def test_unsupported_extensions_give_no_text():
+    assert FileHandler().extract_text(b'plain text', 'txt') is None
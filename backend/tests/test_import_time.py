@@ -0,0 +1,13 @@
+from benchmarks.import_time import DEFERRED, measure
+
+# Matches the documented gate: python -m benchmarks.import_time --budget 1.0
+BUDGET_SECONDS = 1.0
+
+
+def test_import_main_within_budget_and_defers_heavy_packages():
+    rows = measure('main')
+    total = next(cumulative for name, _, cumulative in rows if name == 'main') / 1e6
+    assert total <= BUDGET_SECONDS, f"import main took {total:.3f}s"
+
+    loaded = {name.split('.')[0] for name, _, _ in rows} & set(DEFERRED)
+    assert not loaded, f"deferred packages imported eagerly: {sorted(loaded)}"
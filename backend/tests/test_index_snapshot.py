@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+
+from app.storage.index_snapshot import CURRENT_POINTER, load_snapshot, save_snapshot
+from app.utils.job_matcher import JobMatcher
+
+
+def fresh_index():
+    return JobMatcher(lazy=True).index
+
+
+def test_snapshot_round_trip_scores_like_the_saved_index(job_matcher, jobs, resumes, tmp_path):
+    index = job_matcher.index
+    save_snapshot(index, str(tmp_path), revision=3)
+
+    restored = fresh_index()
+    assert load_snapshot(restored, str(tmp_path), jobs, revision=3)
+    assert [job['id'] for job in restored.jobs] == [job['id'] for job in index.jobs]
+    assert restored.vectorizer_key == index.vectorizer_key
+    for resume_data in resumes[:10]:
+        text = job_matcher._create_resume_text(resume_data)
+        np.testing.assert_allclose(restored.similarities(restored.transform(text)),
+                                   index.similarities(index.transform(text)))
+
+
+def test_snapshot_leaves_out_tombstones_without_touching_the_index(job_matcher, jobs, resumes, tmp_path):
+    index = job_matcher.index
+    for job in jobs[:25]:
+        index.remove_job(job['id'])
+    generation, shape = index.generation, index.matrix.shape
+    save_snapshot(index, str(tmp_path), revision=1)
+    assert (index.generation, index.matrix.shape) == (generation, shape)
+
+    restored = fresh_index()
+    assert load_snapshot(restored, str(tmp_path), jobs[25:], revision=1)
+    assert restored.matrix.shape[0] == len(jobs) - 25
+    text = job_matcher._create_resume_text(resumes[0])
+    np.testing.assert_allclose(restored.similarities(restored.transform(text)),
+                               index.similarities(index.transform(text))[index.active_rows])
+
+
+def test_stale_or_mismatched_snapshot_is_not_loaded(job_matcher, jobs, tmp_path):
+    save_snapshot(job_matcher.index, str(tmp_path), revision=1)
+    assert not load_snapshot(fresh_index(), str(tmp_path), jobs, revision=2)
+    assert not load_snapshot(fresh_index(), str(tmp_path), jobs[1:], revision=1)
+
+
+def test_saving_never_overwrites_a_published_revision(job_matcher, tmp_path):
+    first = save_snapshot(job_matcher.index, str(tmp_path), revision=5)
+    second = save_snapshot(job_matcher.index, str(tmp_path), revision=5)
+    assert second != first
+    with open(tmp_path / CURRENT_POINTER) as f:
+        assert f.read() == os.path.basename(second)
+    assert not os.path.exists(first)
+
+
+def test_empty_job_store_is_not_seeded_with_mock_jobs(tmp_path, resumes):
+    from app.storage.job_store import JobStore
+    job_store = JobStore(f'sqlite:///{tmp_path / "jobs.db"}')
+    job_matcher = JobMatcher(job_store=job_store, snapshot_dir=str(tmp_path / 'snapshot'))
+    assert job_store.count() == 0
+    assert job_matcher.index.size == 0
+    assert job_matcher.find_matches(resumes[0]) == []
+
+    seeded = JobMatcher(job_store=JobStore(f'sqlite:///{tmp_path / "seeded.db"}'), seed_mock_jobs=True)
+    assert seeded.index.size == len(seeded._load_mock_jobs()) > 0
@@ -0,0 +1,75 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from ingest import iter_sources, load_checkpoint
+
+FILES = {
+    'a.pdf': b'%PDF a',
+    'nested/b.docx': b'PK b',
+    'nested/c.DOC': b'c',
+    'notes.txt': b'skipped',
+    'nested/.hidden.pdf': b'skipped',
+}
+RESUMES = ['a.pdf', 'nested/b.docx', 'nested/c.DOC']
+
+
+def write_tree(root):
+    for name, content in FILES.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+def write_zip(path):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, content in FILES.items():
+            archive.writestr(name, content)
+
+
+def write_tar(path):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, content in FILES.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+
+
+def read(source):
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read()
+    return source
+
+
+@pytest.mark.parametrize('layout', ['directory', 'zip', 'tar'])
+def test_sources_yield_resumes_and_skip_finished_ones(tmp_path, layout):
+    if layout == 'directory':
+        path = tmp_path / 'resumes'
+        write_tree(path)
+    else:
+        path = tmp_path / f'resumes.{layout}'
+        (write_zip if layout == 'zip' else write_tar)(path)
+
+    sources = {name: read(source) for name, source in iter_sources(str(path))}
+    assert sources == {name: FILES[name] for name in RESUMES}
+    # Directory entries are handed to the workers as paths, archive members as bytes
+    assert all(isinstance(source, str) == (layout == 'directory')
+               for _, source in iter_sources(str(path)))
+    assert [name for name, _ in iter_sources(str(path), skip={'a.pdf'})] == RESUMES[1:]
+
+
+def test_other_inputs_are_rejected(tmp_path):
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(b'%PDF')
+    with pytest.raises(ValueError, match='not a directory, zip or tar'):
+        list(iter_sources(str(path)))
+
+
+def test_checkpoint_lists_finished_files(tmp_path):
+    path = tmp_path / 'out.ndjson.checkpoint'
+    assert load_checkpoint(str(path)) == set()
+    path.write_text('a.pdf\nnested/b.docx\n\n')
+    assert load_checkpoint(str(path)) == {'a.pdf', 'nested/b.docx'}
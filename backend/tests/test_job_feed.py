@@ -0,0 +1,97 @@
+import io
+import re
+
+import pytest
+
+from app.job_feed import FeedImporter, iter_records, validate_job
+from app.utils.job_matcher import JobMatcher
+from app.utils.minhash import MinHashLSH, choose_bands
+from app.serialization import dumps
+
+
+def shingles(text, size=3):
+    tokens = re.findall(r'\w+', text.lower())
+    return {tuple(tokens[start:start + size]) for start in range(len(tokens) - size + 1)}
+
+
+def test_validate_job_normalizes_a_record(jobs):
+    job = validate_job(dict(jobs[0], id=17, skills=[' Python ', '', 'SQL'], remote_friendly='yes'))
+    assert job['id'] == '17'
+    assert job['skills'] == ['Python', 'SQL']
+    assert job['remote_friendly'] is True
+
+
+@pytest.mark.parametrize('changes,error', [
+    ({'id': True}, 'id must be'),
+    ({'id': ' '}, 'id must be'),
+    ({'title': ''}, 'title must be'),
+    ({'description': None}, 'description must be'),
+    ({'skills': 'Python'}, 'skills must be a list'),
+    ({'requirements': [3]}, 'requirements must be a list'),
+    ({'location': 5}, 'location must be a string'),
+    ({'remote_friendly': 'maybe'}, 'remote_friendly must be'),
+])
+def test_validate_job_names_the_first_problem(jobs, changes, error):
+    with pytest.raises(ValueError, match=error):
+        validate_job(dict(jobs[0], **changes))
+
+
+def test_validate_job_reports_missing_fields():
+    with pytest.raises(ValueError, match='missing fields: description, requirements, skills'):
+        validate_job({'id': '1', 'title': 'Engineer'})
+
+
+def test_feed_readers_report_bad_lines_and_split_csv_lists():
+    jsonl = io.StringIO('{"id": "1"}\n\nnot json\n[1]\n')
+    assert [(line, error is None) for line, _, error in iter_records(jsonl, 'jsonl')] == \
+        [(1, True), (3, False), (4, False)]
+
+    rows = list(iter_records(io.StringIO('id,title,skills,requirements\n'
+                                         '1,Engineer,Python|SQL,"[""5 years""]"\n'), 'csv'))
+    assert rows == [(2, {'id': '1', 'title': 'Engineer', 'skills': ['Python', 'SQL'],
+                         'requirements': ['5 years']}, None)]
+
+
+def test_choose_bands_splits_the_signature_near_the_threshold():
+    bands, rows = choose_bands(0.8, 64)
+    assert bands * rows == 64
+    assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.1
+
+
+def test_minhash_similarity_estimates_shingle_jaccard(jobs):
+    lsh = MinHashLSH(num_perm=256)
+    for first, second in zip(jobs[:20], jobs[20:40]):
+        text = f"{first['description']} {second['description']}"
+        edited = f"{first['description']} {jobs[60]['description']}"
+        exact = len(shingles(text) & shingles(edited)) / len(shingles(text) | shingles(edited))
+        estimate = float((lsh.signature(text) == lsh.signature(edited)).mean())
+        assert abs(estimate - exact) < 0.15
+
+
+def test_minhash_flags_reposts_but_not_other_postings(jobs):
+    lsh = MinHashLSH(threshold=0.8)
+    text = ' '.join(jobs[0]['requirements'] + [jobs[0]['description']] * 3)
+    assert lsh.check('a', text) is None
+    # The same document updated under its own key is not a duplicate of itself
+    assert lsh.check('a', text + ' updated') is None
+    key, similarity = lsh.check('b', text + ' Apply today')
+    assert key == 'a' and similarity >= 0.8
+    assert lsh.check('c', 'Pastry chef wanted for a small bakery, early mornings') is None
+
+
+def test_feed_importer_counts_invalid_duplicate_and_repeated_records(jobs):
+    records = [dumps(job).decode() for job in jobs[:50]]
+    records.append(dumps(dict(jobs[3], title='Updated title')).decode())
+    records.append(dumps(dict(jobs[5], id='repost-5')).decode())
+    records.append('{"id": "broken"}')
+    job_matcher = JobMatcher(lazy=True)
+    job_matcher.index.fit(jobs[100:110])
+
+    report = FeedImporter(job_matcher, chunk_size=7, deduplicator=MinHashLSH()).run(
+        iter_records(io.StringIO('\n'.join(records)), 'jsonl'))
+    assert report['invalid'] == 1
+    assert report['duplicates'] >= 1
+    assert any(entry['id'] == 'repost-5' and entry['duplicate_of'] == jobs[5]['id']
+               for entry in report['rejected_sample'])
+    assert report['index_size'] == 10 + report['imported'] - 1
+    assert job_matcher.index.job_at(job_matcher.index.row_of(jobs[3]['id']))['title'] == 'Updated title'
@@ -0,0 +1,21 @@
+from app.utils.job_index import latest_by_id
+
+
+def test_latest_by_id_keeps_the_last_record_of_each_id():
+    jobs = [{'id': 'a', 'n': 1}, {'id': 'b', 'n': 2}, {'id': 'a', 'n': 3}, {'id': 1, 'n': 4}, {'id': '1', 'n': 5}]
+    assert latest_by_id(jobs) == [{'id': 'b', 'n': 2}, {'id': 'a', 'n': 3}, {'id': '1', 'n': 5}]
+
+
+def test_duplicate_ids_in_one_batch_leave_one_active_row(job_matcher, jobs):
+    first = dict(jobs[0], id='dup')
+    last = dict(jobs[1], id='dup', title='Other')
+    job_matcher.add_jobs([first, last])
+    found = [job for job in job_matcher.search_jobs({}) if job['id'] == 'dup']
+    assert found == [last]
+    assert job_matcher.index.size == len(jobs) + 1
+
+
+def test_duplicate_ids_when_fitting(job_matcher, jobs):
+    job_matcher.index.fit(jobs + [dict(jobs[0], title='Replaced')])
+    assert job_matcher.index.size == len(jobs)
+    assert job_matcher.index.job_at(job_matcher.index.row_of(jobs[0]['id']))['title'] == 'Replaced'
@@ -0,0 +1,56 @@
+import pytest
+
+from app.utils.job_matcher import JobMatcher
+
+
+def match_keys(matches):
+    return [(str(match['id']), match['match_percentage']) for match in matches]
+
+
+def assert_matches_reference(job_matcher, resumes, k, min_score):
+    for resume_data in resumes:
+        assert match_keys(job_matcher.find_matches(resume_data, k=k, min_score=min_score)) == \
+            match_keys(job_matcher._find_matches_exhaustive(resume_data, k=k, min_score=min_score))
+
+
+@pytest.mark.parametrize('k,min_score', [(10, 0), (5, 40), (1000, 0), (25, 10)])
+def test_pruned_matches_equal_exhaustive_scoring(job_matcher, resumes, k, min_score):
+    assert_matches_reference(job_matcher, resumes, k, min_score)
+
+
+def test_batched_matches_equal_per_resume(job_matcher, resumes):
+    batched = job_matcher.find_matches_many(resumes, k=10, min_score=0, chunk_size=7)
+    assert [match_keys(matches) for matches in batched] == \
+        [match_keys(job_matcher.find_matches(resume_data, k=10)) for resume_data in resumes]
+
+
+def test_matches_follow_incremental_job_updates(job_matcher, jobs, resumes):
+    job_matcher.add_jobs([dict(job, id=f'new-{job["id"]}') for job in jobs[:20]])
+    for job in jobs[20:40]:
+        job_matcher.remove_job(job['id'])
+    assert_matches_reference(job_matcher, resumes, 10, 0)
+
+
+def test_stored_candidates_are_ranked_like_find_matches(job_matcher, jobs, resumes):
+    for position, resume_data in enumerate(resumes):
+        job_matcher.add_candidate(f'c{position}', resume_data)
+    job_id = jobs[0]['id']
+    ranked = job_matcher.find_candidates(job_id, k=len(resumes))
+    for result in ranked:
+        resume_data = resumes[int(result['candidate_id'][1:])]
+        scores = {str(match['id']): match['match_percentage']
+                  for match in job_matcher._find_matches_exhaustive(resume_data, k=len(jobs))}
+        assert result['match_percentage'] == scores[job_id]
+
+
+def test_in_memory_candidates_are_capped(jobs, resumes):
+    job_matcher = JobMatcher(lazy=True, candidate_memory_limit=10)
+    job_matcher.index.fit(jobs)
+    for round_number in range(5):
+        for position, resume_data in enumerate(resumes):
+            job_matcher.add_candidate(f'c{round_number}-{position}', resume_data)
+    assert job_matcher.candidates.size == 10
+    assert job_matcher.candidate_matches('c0-0') is None
+    assert job_matcher.candidate_matches(f'c4-{len(resumes) - 1}') is not None
+    # Dropped rows are compacted away rather than kept as tombstones
+    assert job_matcher.candidates.tombstones <= 64
@@ -0,0 +1,59 @@
+import pytest
+
+
+def scan(jobs, criteria):
+    """The original linear filter, as the reference for the posting-list search."""
+    results = jobs
+    if criteria.get('location'):
+        location = criteria['location'].lower()
+        results = [job for job in results if location in job['location'].lower()
+                   or (location == 'remote' and job.get('remote_friendly', False))]
+    if criteria.get('experience_level'):
+        level = criteria['experience_level'].lower()
+        results = [job for job in results if job.get('experience_level', '').lower() == level]
+    if criteria.get('skills'):
+        required = {skill.lower() for skill in criteria['skills']}
+        results = [job for job in results if required & {skill.lower() for skill in job['skills']}]
+    return [job['id'] for job in results]
+
+
+def page_through(job_matcher, criteria, limit):
+    ids, cursor = [], None
+    while True:
+        page = job_matcher.page_jobs(criteria, limit=limit, cursor=cursor)
+        ids.extend(job['id'] for job in page['jobs'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return ids, page['total']
+
+
+@pytest.mark.parametrize('criteria', [
+    {},
+    {'location': 'remote'},
+    {'location': 'Austin'},
+    {'location': 'san fran'},
+    {'experience_level': 'Senior', 'skills': ['Python']},
+])
+def test_cursor_pages_cover_search_results_once(job_matcher, jobs, criteria):
+    expected = [job['id'] for job in job_matcher.search_jobs(criteria)]
+    assert expected == scan(jobs, criteria)
+    ids, total = page_through(job_matcher, criteria, limit=7)
+    assert ids == expected
+    assert total == len(expected)
+
+
+def test_last_page_has_no_cursor(job_matcher):
+    page = job_matcher.page_jobs({}, limit=len(job_matcher.jobs_database))
+    assert page['next_cursor'] is None
+
+
+def test_cursor_expires_when_the_index_is_refitted(job_matcher, jobs):
+    cursor = job_matcher.page_jobs({}, limit=5)['next_cursor']
+    job_matcher.index.fit(jobs)
+    with pytest.raises(ValueError):
+        job_matcher.page_jobs({}, limit=5, cursor=cursor)
+
+
+def test_invalid_cursor_is_rejected(job_matcher):
+    with pytest.raises(ValueError):
+        job_matcher.page_jobs({}, limit=5, cursor='not-a-cursor')
@@ -0,0 +1,99 @@
+import pytest
+
+from app.utils.job_matcher import JobMatcher
+
+
+def store_matcher(tmp_path, **options):
+    from app.storage.job_store import JobStore
+    return JobMatcher(job_store=JobStore(f'sqlite:///{tmp_path / "jobs.db"}'), lazy=True, **options)
+
+
+def pct_keys(matches):
+    return [(str(match['id']), match['match_percentage']) for match in matches]
+
+
+def test_rematched_deltas_equal_fresh_matches(job_matcher, jobs, resumes):
+    for position, resume_data in enumerate(resumes):
+        job_matcher.add_candidate(f'c{position}', resume_data)
+
+    changed = [dict(job, id=f'new-{job["id"]}') for job in jobs[:15]]
+    changed += [dict(job, skills=list(reversed(job['skills']))[:2]) for job in jobs[15:30]]
+    job_matcher.add_jobs(changed)
+    for job in jobs[30:40]:
+        job_matcher.remove_job(job['id'])
+    job_matcher.rematch_candidates([job['id'] for job in changed] + [job['id'] for job in jobs[30:40]],
+                                   chunk_size=7)
+
+    for position, resume_data in enumerate(resumes):
+        stored = pct_keys(job_matcher.candidate_matches(f'c{position}'))
+        fresh = [key for key in pct_keys(job_matcher.find_matches(resume_data, k=job_matcher.candidate_top_k))
+                 if key[1] > 0]
+        # Equal scores may be ordered either way
+        assert sorted(pct for _, pct in stored) == sorted(pct for _, pct in fresh)
+        scores = dict(pct_keys(job_matcher._find_matches_exhaustive(resume_data, k=len(jobs) + 15)))
+        assert all(scores[job_id] == pct for job_id, pct in stored)
+
+
+def test_worker_reloads_after_another_process_writes(tmp_path, jobs, resumes):
+    writer = store_matcher(tmp_path)
+    writer.add_jobs(jobs[:200])
+    reader = store_matcher(tmp_path, store_check_interval=0.0)
+    assert len(reader.get_all_jobs()) == 200
+
+    writer.add_jobs(jobs[200:])
+    writer.remove_job(jobs[0]['id'])
+    assert reader.refresh_from_store()
+    assert {job['id'] for job in reader.get_all_jobs()} == {job['id'] for job in jobs[1:]}
+    # The writer only appended to its vocabulary; a reload refits like a fresh start
+    fresh = store_matcher(tmp_path)
+    assert pct_keys(reader.find_matches(resumes[0])) == pct_keys(fresh.find_matches(resumes[0]))
+    assert not reader.refresh_from_store()
+
+
+def test_own_writes_do_not_trigger_a_reload(tmp_path, jobs):
+    job_matcher = store_matcher(tmp_path, store_check_interval=0.0)
+    job_matcher.add_jobs(jobs[:50])
+    job_matcher.remove_job(jobs[0]['id'])
+    assert not job_matcher.refresh_from_store()
+
+
+def test_revision_checks_are_throttled(tmp_path, jobs):
+    writer = store_matcher(tmp_path)
+    writer.add_jobs(jobs[:50])
+    reader = store_matcher(tmp_path, store_check_interval=3600.0)
+    reader.load()
+    writer.add_jobs(jobs[50:60])
+    assert not reader.refresh_from_store()
+    assert len(reader.get_all_jobs()) == 50
+
+
+def test_reload_carries_over_in_memory_candidates(tmp_path, jobs, resumes):
+    writer = store_matcher(tmp_path)
+    writer.add_jobs(jobs[:100])
+    reader = store_matcher(tmp_path, store_check_interval=0.0)
+    reader.add_candidate('c0', resumes[0])
+    writer.add_jobs(jobs[100:])
+    assert reader.refresh_from_store()
+    reader.rematch_candidates()
+    assert pct_keys(reader.candidate_matches('c0')) == \
+        [key for key in pct_keys(reader.find_matches(resumes[0], k=reader.candidate_top_k)) if key[1] > 0]
+
+
+@pytest.mark.parametrize('path', ['/jobs', '/candidates/rematch'])
+def test_job_management_is_disabled_without_admin_token(client, app_main, monkeypatch, path):
+    monkeypatch.setitem(app_main.app.config, 'ADMIN_TOKEN', None)
+    assert client.post(path, json={'jobs': []}).status_code == 403
+
+
+def test_job_management_requires_the_admin_token(client, app_main, monkeypatch, jobs):
+    monkeypatch.setitem(app_main.app.config, 'ADMIN_TOKEN', 'secret')
+    added = []
+    monkeypatch.setattr(app_main.job_matcher, 'add_jobs', added.extend)
+
+    assert client.post('/jobs', json=jobs[:2]).status_code == 401
+    assert client.post('/jobs', json=jobs[:2], headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    assert added == []
+    response = client.post('/jobs', json=jobs[:2], headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+    assert [job['id'] for job in added] == [job['id'] for job in jobs[:2]]
+    assert client.get('/candidates/rematch').status_code == 200
@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.fixture
+def payloads(resumes):
+    return [resume_data.to_dict() for resume_data in resumes[:5]]
+
+
+def test_batch_results_equal_per_resume_matches(client, app_main, resumes, payloads):
+    response = client.post('/match/batch?k=5', json={'resumes': payloads})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    for resume_data, result in zip(resumes, results):
+        expected = app_main.job_matcher.find_matches(resume_data, k=5)
+        assert [(match['id'], match['match_percentage']) for match in result['job_matches']] == \
+            [(match['id'], match['match_percentage']) for match in expected]
+
+
+@pytest.mark.parametrize('field,value', [
+    ('skills', [1, 2]),
+    ('skills', 'Python'),
+    ('raw_text', 5),
+    ('summary', ['text']),
+    ('personal_info', {'name': 7}),
+    ('experience', [{'company': 'Acme', 'position': 'Engineer', 'description': 3}]),
+    ('education', 'MIT'),
+])
+def test_invalid_resume_is_rejected_with_its_index(client, payloads, field, value):
+    payloads[1][field] = value
+    response = client.post('/match/batch', json={'resumes': payloads})
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith('Invalid resume at index 1')
+
+
+def test_scoring_errors_are_not_reported_as_empty_matches(client, app_main, payloads, monkeypatch):
+    def fail(resume_data):
+        raise RuntimeError('scoring failed')
+
+    monkeypatch.setattr(app_main.job_matcher, '_create_resume_text', fail)
+    assert client.post('/match/batch', json={'resumes': payloads}).status_code == 500
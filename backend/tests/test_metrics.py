@@ -0,0 +1,59 @@
+import os
+import pstats
+
+from app.metrics import MetricsRegistry
+from app.request_profiler import RequestProfiler
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('stage_seconds', 'Stage time.', ('stage',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, stage='parse')
+    lines = registry.render().splitlines()
+    assert lines[:2] == ['# HELP stage_seconds Stage time.', '# TYPE stage_seconds histogram']
+    assert lines[2:] == [
+        'stage_seconds_bucket{stage="parse",le="0.1"} 2',
+        'stage_seconds_bucket{stage="parse",le="1"} 3',
+        'stage_seconds_bucket{stage="parse",le="+Inf"} 4',
+        'stage_seconds_sum{stage="parse"} 3.65',
+        'stage_seconds_count{stage="parse"} 4',
+    ]
+
+
+def test_counters_escape_labels_and_callbacks_survive_errors():
+    registry = MetricsRegistry()
+    registry.counter('requests_total', 'Requests.', ('path',)).inc(path='/a"b')
+    registry.register_callback('broken', 'Fails on scrape.', lambda: 1 / 0)
+    registry.register_callback('queued', 'Queue depth.', lambda: [({'queue': 'parse'}, 3)])
+    rendered = registry.render()
+    assert 'requests_total{path="/a\\"b"} 1' in rendered
+    assert '# TYPE broken gauge' in rendered
+    assert 'queued{queue="parse"} 3' in rendered
+
+
+def test_requests_are_timed_by_route_template(client):
+    client.get('/health')
+    client.get('/candidates/nobody/matches')
+    metrics = client.get('/metrics').get_data(as_text=True)
+    assert 'http_requests_total{endpoint="/health",method="GET",status="200"}' in metrics
+    assert 'endpoint="/candidates/<candidate_id>/matches"' in metrics
+    assert 'jobs_indexed' in metrics
+
+
+def test_profiler_needs_the_token_and_keeps_the_newest_files(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), token='secret', max_files=2)
+    assert not profiler.should_profile({})
+    assert not profiler.should_profile({'X-Profile': 'guess'})
+    assert profiler.should_profile({'X-Profile': 'secret'})
+    assert not RequestProfiler().should_profile({'X-Profile': 'secret'})
+
+    names = []
+    for position in range(3):
+        active = profiler.start()
+        sum(range(1000))
+        names.append(profiler.finish(active, f'/jobs/<id>/{position}'))
+        os.utime(tmp_path / names[-1], (position, position))
+    assert sorted(os.listdir(tmp_path)) == sorted(names[1:])
+    assert '<' not in names[0] and '/' not in names[0]
+    pstats.Stats(str(tmp_path / names[-1]))
@@ -0,0 +1,51 @@
+import os
+import time
+
+from app.storage.parse_cache import ParseCache
+
+
+def test_key_depends_on_content_extension_and_parser_version():
+    key = ParseCache.make_key(b'resume', 'pdf', 'v1')
+    assert key == ParseCache.make_key(b'resume', 'PDF', 'v1')
+    assert key != ParseCache.make_key(b'resume!', 'pdf', 'v1')
+    assert key != ParseCache.make_key(b'resume', 'docx', 'v1')
+    assert key != ParseCache.make_key(b'resume', 'pdf', 'v2')
+
+
+def test_memory_tier_is_a_bounded_lru():
+    cache = ParseCache(max_memory_entries=2)
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    assert cache.get('a') == {'n': 1}
+    cache.put('c', {'n': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1}
+    assert cache.stats()['memory_entries'] == 2
+
+
+def test_disk_tier_is_shared_across_instances(tmp_path):
+    ParseCache(str(tmp_path)).put('key', {'parsed_data': {'skills': ['Python']}})
+    other = ParseCache(str(tmp_path))
+    assert other.get('key') == {'parsed_data': {'skills': ['Python']}}
+    assert other.stats()['disk_hits'] == 1
+
+
+def test_disk_entries_expire_after_the_ttl(tmp_path):
+    ParseCache(str(tmp_path)).put('key', {'n': 1})
+    path = os.path.join(str(tmp_path), 'ke', 'key.json')
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    cache = ParseCache(str(tmp_path), ttl_seconds=60)
+    assert cache.get('key') is None
+    assert not os.path.exists(path)
+    assert ParseCache(str(tmp_path), ttl_seconds=3600).get('key') is None
+
+
+def test_disk_tier_directory_is_created_on_first_write(tmp_path):
+    directory = tmp_path / 'cache'
+    cache = ParseCache(str(directory))
+    assert cache.get('key') is None
+    assert not directory.exists()
+    cache.put('key', {'n': 1})
+    assert ParseCache(str(directory)).get('key') == {'n': 1}
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from app.parse_queue import ParseQueue, DONE, FAILED
+
+
+class StubPipeline:
+    """Pipeline whose finish() blocks until released, recording the thread it ran on."""
+
+    file_handler = resume_parser = None
+
+    def __init__(self, error=None):
+        self.release = threading.Event()
+        self.finished_on = []
+        self.error = error
+
+    def lookup(self, content, filename):
+        return filename, 'pdf', None, None
+
+    def finish(self, filename, cache_key, parsed_data, cache_entry, k, min_score, mode):
+        self.finished_on.append(threading.current_thread().name)
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {'filename': filename, 'name': parsed_data.personal_info.name}
+
+    def failure(self, filename, error):
+        return {'error': str(error)}
+
+
+class DoneExecutor:
+    """Executor whose futures are already complete, so callbacks run inside submit()."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(self.payload)
+        return future
+
+
+def wait_for(parse_queue, job_id):
+    deadline = time.monotonic() + 5
+    while parse_queue.get(job_id)['status'] not in (DONE, FAILED):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    return parse_queue.get(job_id)
+
+
+@pytest.fixture
+def payload(resumes):
+    return {'resume': resumes[0].to_dict(), 'seconds': 0.01}
+
+
+def test_completion_callback_hands_matching_to_a_finishing_thread(payload, resumes):
+    pipeline = StubPipeline()
+    parse_queue = ParseQueue(pipeline, workers=1)
+    parse_queue._get_executor = lambda: DoneExecutor(payload)
+
+    # finish() is still blocked, yet the callback has returned
+    job_id = parse_queue.submit(b'%PDF', 'cv.pdf')
+    assert parse_queue.get(job_id)['status'] == 'queued'
+    pipeline.release.set()
+    job = wait_for(parse_queue, job_id)
+    assert job['status'] == DONE
+    assert job['result'] == {'filename': 'cv.pdf', 'name': resumes[0].personal_info.name}
+    assert pipeline.finished_on[0].startswith('parse-finish')
+    parse_queue.shutdown()
+
+
+def test_finishing_errors_fail_the_job(payload):
+    pipeline = StubPipeline(error=ValueError('scoring failed'))
+    pipeline.release.set()
+    parse_queue = ParseQueue(pipeline, workers=1)
+    parse_queue._get_executor = lambda: DoneExecutor(payload)
+
+    job = wait_for(parse_queue, parse_queue.submit(b'%PDF', 'cv.pdf'))
+    assert job['status'] == FAILED
+    assert job['error'] == 'scoring failed'
+    assert parse_queue.stats()['pending'] == 0
+    parse_queue.shutdown()
+
+
+def test_results_directory_is_created_on_first_write(payload, tmp_path):
+    pipeline = StubPipeline()
+    pipeline.release.set()
+    directory = tmp_path / 'results'
+    parse_queue = ParseQueue(pipeline, workers=1, results_dir=str(directory))
+    assert parse_queue.stats()['retained'] == 0
+    assert not directory.exists()
+
+    parse_queue._get_executor = lambda: DoneExecutor(payload)
+    job_id = parse_queue.submit(b'%PDF', 'cv.pdf')
+    # Another process sees the record once it is written
+    assert wait_for(ParseQueue(pipeline, workers=1, results_dir=str(directory)), job_id)['status'] == DONE
+    parse_queue.shutdown()
+
+
+def test_importing_the_app_creates_no_directories(tmp_path):
+    import subprocess
+    import sys
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', f'import sys; sys.path.insert(0, {backend!r}); import main'],
+                   cwd=tmp_path, check=True, capture_output=True)
+    assert os.listdir(tmp_path) == []
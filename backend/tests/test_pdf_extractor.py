@@ -0,0 +1,85 @@
+import io
+import os
+import time
+import multiprocessing
+
+import pytest
+
+from app.utils import pdf_extractor
+from app.utils.pdf_extractor import PdfExtractor
+from benchmarks.generators import to_pdf
+
+LINES = [f'line {number}' for number in range(120)]
+
+# Patched page readers only reach the pool workers when they are forked
+requires_fork = pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                                   reason='needs the fork start method')
+
+
+def pdf(lines, lines_per_page=3):
+    return io.BytesIO(to_pdf('\n'.join(lines), lines_per_page=lines_per_page))
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    """Start the page pool from scratch, so its workers see this test's patches."""
+    monkeypatch.setattr(pdf_extractor, '_executor', None)
+    yield
+    if pdf_extractor._executor is not None:
+        pdf_extractor._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_short_pdf_is_read_in_process(fresh_pool):
+    assert PdfExtractor().extract(pdf(LINES[:6])) == '\n'.join(LINES[:6])
+    assert pdf_extractor._executor is None
+
+
+def test_long_pdf_is_split_across_the_pool_in_order(fresh_pool):
+    assert PdfExtractor(max_workers=2).extract(pdf(LINES)) == '\n'.join(LINES)
+    assert pdf_extractor._executor is not None
+
+
+def test_blank_leading_pages_do_not_end_the_probe():
+    assert PdfExtractor().extract(pdf([''] * 6 + LINES[:6])) == '\n'.join(LINES[:6])
+
+
+def test_page_cap():
+    assert PdfExtractor(max_pages=5).extract(pdf(LINES)) == '\n'.join(LINES[:15])
+
+
+def test_blank_or_invalid_pdf_returns_none():
+    assert PdfExtractor(max_pages=3).extract(pdf([''] * 12)) is None
+    assert PdfExtractor().extract(io.BytesIO(b'not a pdf')) is None
+
+
+def test_probe_stops_at_the_deadline(monkeypatch):
+    read = pdf_extractor._page_text
+
+    def slow(document, backend, page_number):
+        time.sleep(0.2)
+        return read(document, backend, page_number)
+
+    monkeypatch.setattr(pdf_extractor, '_page_text', slow)
+    started = time.monotonic()
+    assert PdfExtractor(time_budget=0.5).extract(pdf([''] * 60 + LINES[:3])) is None
+    assert time.monotonic() - started < 2
+
+
+@requires_fork
+def test_hung_page_in_the_pool_stops_at_the_deadline(fresh_pool, monkeypatch):
+    read = pdf_extractor._page_text
+
+    def hang_on_page_ten(document, backend, page_number):
+        if page_number == 10 and os.getpid() != parent:
+            time.sleep(60)
+        return read(document, backend, page_number)
+
+    parent = os.getpid()
+    monkeypatch.setattr(pdf_extractor, '_page_text', hang_on_page_ten)
+    started = time.monotonic()
+    text = PdfExtractor(time_budget=1.5, max_workers=1).extract(pdf(LINES))
+    assert time.monotonic() - started < 5
+    # Pages 0-8 come back; the range holding page 10 is cut off at the deadline
+    assert text == '\n'.join(LINES[:27])
+    # The worker gave up the hung page at the deadline and is free again
+    assert pdf_extractor._executor.submit(os.getpid).result(timeout=5) != parent
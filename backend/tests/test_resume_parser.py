@@ -0,0 +1,52 @@
+import pytest
+
+from app.parsers.resume_parser import ResumeParser
+from benchmarks import generators
+
+spacy = pytest.importorskip('spacy')
+
+
+@pytest.fixture
+def parser():
+    """A parser over a blank English pipeline whose entity ruler tags known names and places."""
+    parser = ResumeParser(ner_header_chars=200)
+    nlp = spacy.blank('en')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns(
+        [{'label': 'PERSON', 'pattern': f'{first} {last}'}
+         for first in generators.FIRST_NAMES for last in generators.LAST_NAMES]
+        + [{'label': 'GPE', 'pattern': city.split(',')[0]} for city in generators.CITIES]
+    )
+    parser.nlp = nlp
+    return parser
+
+
+def test_header_is_cut_at_a_word_boundary(parser):
+    text = 'word ' * 100
+    header = parser._header(text)
+    assert len(header) <= 200 and header.endswith('word')
+    assert parser._header('short text') == 'short text'
+    assert ResumeParser(ner_header_chars=0)._header(text) == text
+
+
+def test_entities_come_from_the_header_and_fields_from_the_whole_text(parser):
+    text = generators.generate_resumes(1, seed=7)[0] + '\n\nReferences\nJordan Smith, Seattle'
+    resume_data = parser.parse(text)
+    first_line = text.split('\n')[0]
+    assert resume_data.personal_info.name == first_line
+    assert resume_data.personal_info.email.startswith(first_line.split()[0].lower())
+    # Skills and education are read from sections far past the NER header
+    assert len(parser._clean_text(text)) > 200
+    assert resume_data.skills and resume_data.education
+
+
+def comparable(resume_data):
+    fields = resume_data.to_dict()
+    fields.pop('processed_at', None)
+    return fields
+
+
+def test_parse_many_matches_parse(parser):
+    texts = generators.generate_resumes(8, seed=8)
+    assert [comparable(resume_data) for resume_data in parser.parse_many(texts, batch_size=3)] == \
+        [comparable(parser.parse(text)) for text in texts]
@@ -0,0 +1,67 @@
+import pytest
+
+from app.parsers.patterns import SECTION_BY_HEADING
+from app.parsers.section_segmenter import segment, CONTACT
+from benchmarks import generators
+
+MIXED = '''Jane Doe
+jane@example.com
+
+Skills: Python, Go, SQL
+Summary
+Experience shows in everything I build, from APIs to data pipelines.
+
+Work Experience
+Engineer at Cloud Systems 2019 - Present
+- Built the payments service
+
+EDUCATION
+B.S. in Computer Science, State University
+Languages: English, Spanish
+Ran the robotics club'''
+
+
+def reference_lines(text):
+    """Non-empty lines per section, found by looking at each line on its own."""
+    sections, current = {}, CONTACT
+    for line in text.split('\n'):
+        stripped = line.strip()
+        heading, colon, rest = stripped.partition(':')
+        if stripped.lower() in SECTION_BY_HEADING:
+            current = SECTION_BY_HEADING[stripped.lower()]
+            sections.setdefault(current, []).append(stripped)
+        elif colon and heading.strip().lower() in SECTION_BY_HEADING:
+            sections.setdefault(SECTION_BY_HEADING[heading.strip().lower()], []).append(stripped)
+        elif stripped:
+            sections.setdefault(current, []).append(stripped)
+    return sections
+
+
+def section_lines(sections):
+    return {
+        name: [line.strip() for line in sections.get(name).split('\n') if line.strip()]
+        for name in sections.spans
+    }
+
+
+@pytest.mark.parametrize('text', generators.generate_resumes(30, seed=4) + [MIXED])
+def test_single_scan_agrees_with_line_by_line_segmentation(text):
+    assert section_lines(segment(text)) == reference_lines(text)
+
+
+def test_inline_headings_and_prose():
+    sections = segment(MIXED)
+    assert sections.get('skills') == 'Skills: Python, Go, SQL'
+    # Prose starting with a heading word stays in the open section
+    assert 'Experience shows' in sections.get('summary')
+    # The section open before an inline heading continues after it
+    assert sections.get('education').splitlines()[-1] == 'Ran the robotics club'
+    assert sections.get('other') == 'Languages: English, Spanish'
+
+
+def test_missing_sections_fall_back_to_the_full_text():
+    sections = segment('Jane Doe\njane@example.com')
+    assert not sections.has('skills')
+    assert sections.get('skills') == sections.text
+    assert sections.lower('skills') == sections.text.lower()
+    assert sections.get(CONTACT) == sections.text
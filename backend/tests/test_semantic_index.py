@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from app.utils.job_matcher import JobMatcher, SEMANTIC
+from app.utils.semantic_index import SemanticIndex
+
+
+@pytest.fixture
+def semantic(job_matcher):
+    semantic = SemanticIndex(n_components=32, n_lists=12, n_probe=3, min_ivf_rows=100)
+    semantic.fit(job_matcher.index.matrix)
+    return semantic
+
+
+def test_exact_search_ranks_by_cosine_similarity(semantic):
+    query = semantic.embeddings[7]
+    rows, scores = semantic.search_exact(query, 10)
+    reference = np.lexsort((np.arange(semantic.size), -(semantic.embeddings @ query)))[:10]
+    assert rows.tolist() == reference.tolist()
+    assert rows[0] == 7 and scores[0] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_probing_every_list_is_exact_and_fewer_keeps_recall(semantic):
+    queries = semantic.embeddings[:50]
+    assert semantic.recall_at_k(queries, n_probe=len(semantic.centroids)) == 1.0
+    assert semantic.recall_at_k(queries) >= 0.7
+
+
+def test_appended_rows_are_searchable_and_tombstones_are_not(semantic, job_matcher):
+    matrix = job_matcher.index.matrix
+    semantic.add(matrix[:5])
+    assert semantic.size == matrix.shape[0] + 5
+    query = semantic.embeddings[-1]
+    active = np.ones(semantic.size, dtype=bool)
+    rows, _ = semantic.search_exact(query, 2, active)
+    assert set(rows.tolist()) == {4, semantic.size - 1}
+    active[[4, semantic.size - 1]] = False
+    rows, _ = semantic.search(query, 10, active, n_probe=len(semantic.centroids))
+    assert not {4, semantic.size - 1} & set(rows.tolist())
+
+
+def test_semantic_mode_follows_job_updates(jobs, resumes):
+    job_matcher = JobMatcher(lazy=True, match_mode=SEMANTIC,
+                             semantic_index=SemanticIndex(n_components=32, min_ivf_rows=100))
+    job_matcher.index.fit(jobs[:300])
+    matches = job_matcher.find_matches(resumes[0], k=10)
+    assert len(matches) == 10
+    assert [match['match_percentage'] for match in matches] == \
+        sorted((match['match_percentage'] for match in matches), reverse=True)
+
+    job_matcher.add_jobs([dict(job, id=f'new-{job["id"]}') for job in jobs[300:320]])
+    job_matcher.remove_job(matches[0]['id'])
+    again = job_matcher.find_matches(resumes[0], k=10)
+    assert job_matcher.semantic.size == job_matcher.index.matrix.shape[0]
+    assert matches[0]['id'] not in {match['id'] for match in again}
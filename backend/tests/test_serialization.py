@@ -0,0 +1,47 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app import serialization
+from app.models.resume_data import ResumeData
+from app.serialization import dumps, loads, stream_object
+
+VALUES = {
+    'when': datetime(2024, 5, 1, 12, 30),
+    'score': np.float64(0.25),
+    'count': np.int64(3),
+    'rows': np.array([1, 2, 3]),
+    'text': 'Zoë, naïve café',
+}
+
+
+def test_stdlib_fallback_encodes_like_orjson(monkeypatch, resumes):
+    if serialization.orjson is None:
+        pytest.skip('orjson is not installed')
+    fast = [dumps(VALUES), dumps(resumes[0])]
+    monkeypatch.setattr(serialization, 'orjson', None)
+    assert [dumps(VALUES), dumps(resumes[0])] == fast
+
+
+def test_resume_round_trips_through_json(resumes):
+    for resume_data in resumes:
+        restored = ResumeData.from_dict(loads(dumps(resume_data.to_dict())))
+        assert restored.to_dict() == resume_data.to_dict()
+    assert not hasattr(resumes[0], '__dict__')
+    assert not hasattr(resumes[0].personal_info, '__dict__')
+
+
+@pytest.mark.parametrize('count', [0, 1, 99, 100, 101, 250])
+def test_streamed_object_equals_the_encoded_whole(count):
+    items = [{'id': str(position), 'score': position / 3} for position in range(count)]
+    body = b''.join(stream_object({'total': count}, 'jobs', iter(items), chunk_size=100))
+    assert json.loads(body) == {'total': count, 'jobs': items}
+    assert json.loads(b''.join(stream_object({}, 'jobs', items))) == {'jobs': items}
+
+
+def test_flask_responses_use_the_shared_encoder(client):
+    response = client.get('/health')
+    assert response.mimetype == 'application/json'
+    assert loads(response.get_data()) == response.get_json()
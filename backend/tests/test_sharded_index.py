@@ -0,0 +1,42 @@
+import pytest
+
+from app.utils.job_matcher import JobMatcher
+
+
+def match_keys(results):
+    return [[(match['id'], match['match_percentage'], match['similarity_score']) for match in matches]
+            for matches in results]
+
+
+@pytest.fixture(params=[1, 3])
+def sharded_matcher(request, jobs):
+    job_matcher = JobMatcher(lazy=True, shards=request.param)
+    job_matcher.index.fit(jobs)
+    yield job_matcher
+    job_matcher.sharded.close()
+
+
+@pytest.mark.parametrize('k,min_score', [(10, 0), (5, 40), (1000, 0)])
+def test_sharded_results_equal_unsharded(sharded_matcher, job_matcher, resumes, k, min_score):
+    expected = [job_matcher.find_matches(resume_data, k=k, min_score=min_score) for resume_data in resumes]
+    assert match_keys(sharded_matcher.find_matches_many(resumes, k=k, min_score=min_score, chunk_size=16)) == \
+        match_keys(expected)
+
+
+def test_shards_follow_job_updates(sharded_matcher, job_matcher, jobs, resumes):
+    for target in (sharded_matcher, job_matcher):
+        target.remove_job(jobs[0]['id'])
+        target.add_jobs([dict(job, id=f'new-{job["id"]}') for job in jobs[1:11]])
+    assert match_keys([sharded_matcher.find_matches(resume_data, k=10) for resume_data in resumes]) == \
+        match_keys([job_matcher.find_matches(resume_data, k=10) for resume_data in resumes])
+
+
+def test_dead_shard_falls_back_to_in_process_matching(sharded_matcher, job_matcher, resumes):
+    sharded_matcher.find_matches_many(resumes[:2], k=10)
+    sharded_matcher.sharded._workers[0][0].kill()
+    sharded_matcher.sharded._workers[0][0].join()
+    results = sharded_matcher.find_matches_many(resumes, k=10)
+    # The in-process batch path may differ from find_matches in the last bit of a similarity
+    assert [[match[:2] for match in matches] for matches in match_keys(results)] == \
+        [[match[:2] for match in matches] for matches in
+         match_keys([job_matcher.find_matches(resume_data, k=10) for resume_data in resumes])]
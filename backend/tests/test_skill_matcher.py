@@ -0,0 +1,52 @@
+import pytest
+
+from app.parsers.resume_parser import ResumeParser
+from app.parsers.skill_matcher import SkillMatcher, DEFAULT_ALIASES, tokenize
+from benchmarks import generators
+
+
+@pytest.fixture(scope='module')
+def taxonomy():
+    return ResumeParser().skill_keywords
+
+
+@pytest.fixture(scope='module')
+def skill_matcher(taxonomy):
+    return SkillMatcher.from_taxonomy(taxonomy, DEFAULT_ALIASES)
+
+
+def reference_extract(taxonomy, text):
+    """Try every skill and alias at every token position, in text order."""
+    surfaces = [
+        (tokenize(surface), SkillMatcher.canonical_name(skill), category)
+        for category, skills in taxonomy.items() for skill in skills
+        for surface in (skill, *DEFAULT_ALIASES.get(skill.lower(), []))
+    ]
+    tokens = tokenize(text)
+    found = {}
+    for end in range(len(tokens)):
+        for surface, skill, category in surfaces:
+            if surface and tokens[max(0, end + 1 - len(surface)):end + 1] == surface:
+                found.setdefault(skill, category)
+    return found
+
+
+def test_automaton_finds_what_a_scan_of_every_skill_finds(taxonomy, skill_matcher):
+    for text in generators.generate_resumes(50, seed=3):
+        assert skill_matcher.extract(text) == reference_extract(taxonomy, text)
+
+
+@pytest.mark.parametrize('text,expected', [
+    ('JavaScript and TypeScript', ['Javascript', 'Typescript']),
+    ('C++, C# and node.js.', ['C++', 'C#', 'Node.Js']),
+    ('python/django on k8s', ['Python', 'Django', 'Kubernetes']),
+    ('React Native and react', ['React', 'React Native']),
+    ('Google Cloud Platform, golang, Power BI', ['Gcp', 'Go', 'Power Bi']),
+    ('Ruby on Rails; R and Rust', ['Ruby', 'Rails', 'R', 'Rust']),
+])
+def test_matches_whole_tokens_and_aliases(skill_matcher, text, expected):
+    assert list(skill_matcher.extract(text)) == expected
+
+
+def test_java_does_not_fire_inside_javascript(skill_matcher):
+    assert 'Java' not in skill_matcher.extract('Senior JavaScript engineer')